@@ -1,5 +1,19 @@
-"""News & Information Verification ADK agent package."""
+"""News & Information Verification ADK agent package.
 
-from .agent import create_content_routing_agent, root_agent
+The exports below load :mod:`.agent` (and with it Google ADK) on first access, so
+importing a submodule such as ``config`` or ``services.text_utils`` stays cheap.
+"""
 
-__all__ = ["root_agent", "create_content_routing_agent"]
+import importlib
+from typing import Any
+
+_AGENT_EXPORTS = ("root_agent", "create_content_routing_agent", "create_root_agent", "get_root_agent")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _AGENT_EXPORTS:
+        return getattr(importlib.import_module(".agent", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = list(_AGENT_EXPORTS)
@@ -1,10 +1,31 @@
-"""Entry-point module exposing the root agent."""
+"""Entry-point module exposing the root agent.
+
+``root_agent`` is built on first access (the ADK loader reads it right after import), so
+importing this module only loads the agent classes.
+"""
 
 from __future__ import annotations
 
-from .router import create_content_routing_agent
+from typing import Any
+
+from .config import HTTP_PREWARM, METRICS_HOST, METRICS_PORT
+from .router import create_content_routing_agent, create_root_agent, get_root_agent
+
+
+def __getattr__(name: str) -> Any:
+    if name == "root_agent":
+        return get_root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if HTTP_PREWARM:
+    from .services import prewarm_connections
+
+    prewarm_connections()
 
+if METRICS_PORT > 0:
+    from .services import metrics
 
-root_agent = create_content_routing_agent()
+    metrics.serve(METRICS_PORT, METRICS_HOST)
 
-__all__ = ["root_agent", "create_content_routing_agent"]
+__all__ = ["root_agent", "create_content_routing_agent", "create_root_agent", "get_root_agent"]
@@ -0,0 +1,357 @@
+"""Bulk claim verification with bounded concurrency and resumable JSONL output.
+
+Usage::
+
+    python -m news_info_verification.batch claims.jsonl --output reports.jsonl --concurrency 8
+
+Each input line is either a JSON object with a ``claim`` (and optional ``id``) field or a
+bare JSON string. Results are appended to the output file as soon as each claim finishes,
+and the output file doubles as the checkpoint: on restart, claims whose id already has an
+``ok`` line are skipped, while errored claims are retried.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, AsyncIterator, Iterable, Iterator, Optional, TextIO
+
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from .config import BATCH_CONCURRENCY, STATE_KEYS
+from .router import create_root_agent
+from .services import rate_limiter, text_utils
+
+_APP_NAME = "news_info_verification_batch"
+_USER_ID = "batch"
+
+
+@dataclass(frozen=True)
+class ClaimRecord:
+    """A single claim queued for verification."""
+
+    id: str
+    claim: str
+
+
+@dataclass
+class ClaimResult:
+    """Outcome of verifying one claim; serialized as one JSONL line."""
+
+    id: str
+    claim: str
+    status: str
+    final_report: Optional[str]
+    latency_s: float
+    error: Optional[str] = None
+    token_usage: Optional[dict[str, Any]] = None
+
+
+@dataclass
+class BatchStats:
+    """Throughput and latency figures for a batch run."""
+
+    completed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    elapsed_s: float = 0.0
+    latencies: list[float] = field(default_factory=list, repr=False)
+
+    @property
+    def throughput(self) -> float:
+        """Verified claims (ok or error) per second of wall-clock time."""
+        if self.elapsed_s <= 0:
+            return 0.0
+        return round((self.completed + self.failed) / self.elapsed_s, 3)
+
+    def latency_percentile(self, percentile: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, math.ceil(percentile / 100 * len(ordered)) - 1))
+        return round(ordered[index], 3)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "completed": self.completed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "elapsed_s": round(self.elapsed_s, 3),
+            "throughput_per_s": self.throughput,
+            "latency_p50_s": self.latency_percentile(50),
+            "latency_p95_s": self.latency_percentile(95),
+            "latency_max_s": round(max(self.latencies), 3) if self.latencies else 0.0,
+        }
+
+
+def claim_id(claim: str) -> str:
+    """Stable id for records without one, so reruns of the same input line up."""
+    return hashlib.sha256(text_utils.normalize_query(claim).encode("utf-8")).hexdigest()[:16]
+
+
+def _to_record(entry: Any) -> Optional[ClaimRecord]:
+    if isinstance(entry, ClaimRecord):
+        return entry
+    if isinstance(entry, str):
+        claim, record_id = entry, None
+    elif isinstance(entry, dict):
+        claim = entry.get("claim") or entry.get("text") or ""
+        record_id = entry.get("id")
+    else:
+        return None
+    claim = str(claim).strip()
+    if not claim:
+        return None
+    return ClaimRecord(id=str(record_id) if record_id is not None else claim_id(claim), claim=claim)
+
+
+def read_claims(path: str) -> Iterator[ClaimRecord]:
+    """Yield claims from a JSONL file, skipping blank or malformed lines."""
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                entry = line
+            record = _to_record(entry)
+            if record is not None:
+                yield record
+
+
+def completed_ids(path: str) -> set[str]:
+    """Ids that already have a successful result in ``path`` (the checkpoint)."""
+    done: set[str] = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A line cut short by an interrupted write; that claim is simply re-run.
+                continue
+            if isinstance(entry, dict) and entry.get("status") == "ok" and entry.get("id") is not None:
+                done.add(str(entry["id"]))
+    return done
+
+
+def _final_text(events: list[Any]) -> Optional[str]:
+    for event in reversed(events):
+        content = getattr(event, "content", None)
+        if content and content.parts and content.role == "model":
+            text = "".join(part.text or "" for part in content.parts).strip()
+            if text:
+                return text
+    return None
+
+
+class BatchVerifier:
+    """Runs claims through the routing agent, one fresh session per claim."""
+
+    def __init__(
+        self,
+        agent: Optional[BaseAgent] = None,
+        *,
+        concurrency: int = BATCH_CONCURRENCY,
+        priority: int = rate_limiter.PRIORITY_BATCH,
+        token_budget: Optional[int] = None,
+        deadline_s: Optional[float] = None,
+    ) -> None:
+        self.agent = agent or create_root_agent()
+        self.concurrency = max(1, concurrency)
+        self.priority = priority
+        self.token_budget = token_budget
+        self.deadline_s = deadline_s
+        self.runner = InMemoryRunner(agent=self.agent, app_name=_APP_NAME)
+
+    async def verify(self, record: ClaimRecord) -> ClaimResult:
+        """Verify a single claim and return its report or the error that stopped it."""
+        sessions = self.runner.session_service
+        session_id = uuid.uuid4().hex
+        started = time.perf_counter()
+        initial = {
+            key: value
+            for key, value in ((STATE_KEYS.TOKEN_BUDGET, self.token_budget), (STATE_KEYS.DEADLINE_S, self.deadline_s))
+            if value is not None
+        }
+        await sessions.create_session(app_name=_APP_NAME, user_id=_USER_ID, session_id=session_id, state=initial or None)
+        usage = None
+        try:
+            events = []
+            message = types.Content(role="user", parts=[types.Part(text=record.claim)])
+            async for event in self.runner.run_async(user_id=_USER_ID, session_id=session_id, new_message=message):
+                events.append(event)
+            session = await sessions.get_session(app_name=_APP_NAME, user_id=_USER_ID, session_id=session_id)
+            state = session.state if session else {}
+            report = state.get(STATE_KEYS.FINAL_REPORT) or _final_text(events)
+            usage = state.get(STATE_KEYS.TOKEN_USAGE)
+            status = "ok" if report else "error"
+            error = None if report else "no final report produced"
+        except Exception as exc:  # noqa: BLE001 - one bad claim must not stop the batch
+            report, status, error = None, "error", f"{type(exc).__name__}: {exc}"
+        finally:
+            await sessions.delete_session(app_name=_APP_NAME, user_id=_USER_ID, session_id=session_id)
+        return ClaimResult(
+            id=record.id,
+            claim=record.claim,
+            status=status,
+            final_report=report,
+            latency_s=round(time.perf_counter() - started, 3),
+            error=error,
+            token_usage=usage,
+        )
+
+    async def run(self, claims: Iterable[Any], *, skip_ids: Iterable[str] = ()) -> AsyncIterator[ClaimResult]:
+        """Verify ``claims`` with at most ``concurrency`` in flight, yielding results as they finish.
+
+        The input is consumed lazily, so arbitrarily large iterables stay bounded in memory.
+        """
+        skip = set(skip_ids)
+        source = iter(claims)
+        results: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        done = object()
+
+        def next_record() -> Optional[ClaimRecord]:
+            for entry in source:
+                record = _to_record(entry)
+                if record is None or record.id in skip:
+                    continue
+                skip.add(record.id)
+                return record
+            return None
+
+        async def worker() -> None:
+            # Outbound API calls yield to interactive verifications sharing the rate limiters.
+            try:
+                with rate_limiter.priority_class(self.priority):
+                    while (record := next_record()) is not None:
+                        await results.put(await self.verify(record))
+            finally:
+                await results.put(done)
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        remaining = len(workers)
+        try:
+            while remaining:
+                item = await results.get()
+                if item is done:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            for task in workers:
+                task.cancel()
+
+
+def _write_result(handle: TextIO, result: ClaimResult) -> None:
+    handle.write(json.dumps(asdict(result), ensure_ascii=False) + "\n")
+    handle.flush()
+
+
+async def verify_claims(
+    claims: Iterable[Any],
+    output_path: str,
+    *,
+    concurrency: int = BATCH_CONCURRENCY,
+    resume: bool = True,
+    agent: Optional[BaseAgent] = None,
+    priority: int = rate_limiter.PRIORITY_BATCH,
+    token_budget: Optional[int] = None,
+    deadline_s: Optional[float] = None,
+) -> BatchStats:
+    """Verify ``claims`` and append one JSON result per line to ``output_path``.
+
+    With ``resume`` enabled, ids that already succeeded in ``output_path`` are skipped.
+    ``token_budget`` caps the Gemini and Perplexity tokens each claim may use, and
+    ``deadline_s`` overrides the per-claim deadline.
+    """
+    skip = completed_ids(output_path) if resume else set()
+    stats = BatchStats()
+    verifier = BatchVerifier(
+        agent, concurrency=concurrency, priority=priority, token_budget=token_budget, deadline_s=deadline_s
+    )
+    started = time.perf_counter()
+
+    def counted(entries: Iterable[Any]) -> Iterator[Any]:
+        for entry in entries:
+            record = _to_record(entry)
+            if record is not None and record.id in skip:
+                stats.skipped += 1
+                continue
+            yield entry
+
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(output_path, "a" if resume else "w", encoding="utf-8") as handle:
+        async for result in verifier.run(counted(claims)):
+            _write_result(handle, result)
+            stats.latencies.append(result.latency_s)
+            if result.status == "ok":
+                stats.completed += 1
+            else:
+                stats.failed += 1
+    stats.elapsed_s = time.perf_counter() - started
+    return stats
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Verify a JSONL file of claims in bulk.")
+    parser.add_argument("input", help="JSONL file with one claim per line")
+    parser.add_argument("-o", "--output", required=True, help="JSONL file receiving one result per claim")
+    parser.add_argument("-c", "--concurrency", type=int, default=BATCH_CONCURRENCY)
+    parser.add_argument("--no-resume", action="store_true", help="overwrite the output instead of resuming")
+    parser.add_argument(
+        "--priority",
+        choices=sorted(rate_limiter.PRIORITY_CLASSES),
+        default="batch",
+        help="rate-limit priority class for outbound API calls",
+    )
+    parser.add_argument("--token-budget", type=int, default=None, help="per-claim token budget (0 = unlimited)")
+    parser.add_argument("--deadline", type=float, default=None, help="per-claim deadline in seconds (0 = none)")
+    args = parser.parse_args(argv)
+
+    stats = asyncio.run(
+        verify_claims(
+            read_claims(args.input),
+            args.output,
+            concurrency=args.concurrency,
+            resume=not args.no_resume,
+            priority=rate_limiter.PRIORITY_CLASSES[args.priority],
+            token_budget=args.token_budget,
+            deadline_s=args.deadline,
+        )
+    )
+    print(json.dumps(stats.as_dict(), indent=2), file=sys.stderr)
+    return 0 if stats.failed == 0 else 1
+
+
+__all__ = [
+    "BatchStats",
+    "BatchVerifier",
+    "ClaimRecord",
+    "ClaimResult",
+    "claim_id",
+    "completed_ids",
+    "main",
+    "read_claims",
+    "verify_claims",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
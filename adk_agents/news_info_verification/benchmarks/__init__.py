@@ -0,0 +1,14 @@
+"""Offline latency benchmarks: provider stub servers, a scripted LLM and a runner."""
+
+from .fake_llm import ScriptedLlm, install_fake_llm
+from .runner import BenchmarkConfig, run_benchmark
+from .stubs import LatencyProfile, StubCluster
+
+__all__ = [
+    "BenchmarkConfig",
+    "LatencyProfile",
+    "ScriptedLlm",
+    "StubCluster",
+    "install_fake_llm",
+    "run_benchmark",
+]
@@ -0,0 +1,145 @@
+"""Scripted stand-in for Gemini so the agent tree can run without network access.
+
+``ScriptedLlm`` looks up the calling agent's name in the ADK identity system instruction
+and replays the behaviour that agent's prompt asks for:
+
+- The router calls the lane tools suggested by the intent classifier, then the report tool.
+- Tool-relay workers call their tool once and echo its JSON.
+- Merge, sentiment and report agents answer with text in their fixed templates.
+
+Every model turn sleeps for a sampled latency so Gemini time shows up in the benchmark.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import re
+from typing import AsyncGenerator, Iterable, Optional
+
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from ..services import intent_classifier
+from ..telemetry import walk_agents
+
+_AGENT_NAME_PATTERN = re.compile(r'Your internal name is "([^"]+)"')
+_LANE_TOOLS = {"news": "NewsCheckAgent", "fact": "FactCheckAgent", "scam": "ScamCheckAgent"}
+_REPORT_TOOL = "FinalProcessingAgent"
+
+_LANE_SUMMARIES = {
+    "NewsMergeAgent": (
+        "## News Verification\n- consensus_verdict: mixed\n- confidence_range: 0.55-0.70\n- noted_gaps: none\n\n"
+        "### Supporting Points\n* NewsApiAgent (GNews): coverage found\n\n### Sources\n1. Outlet 1 — https://news0.example.com/story"
+    ),
+    "FactMergeAgent": (
+        "## Fact Verification\n- consensus_verdict: false\n- confidence_range: 0.60-0.75\n- noted_gaps: none\n\n"
+        "### Key Evidence\n* FactPrimaryAgent: rated false\n\n### References\n1. Checker 1 — https://check0.example.org/review/1"
+    ),
+    "ScamMergeAgent": (
+        "## Scam Assessment\n- overall_risk: medium\n- confidence: 0.65\n- noted_gaps: none\n\n"
+        "### Indicators\n* ScamSentimentAgent: urgency cues\n\n### Recommended Actions\n* Do not click the link"
+    ),
+    "ScamSentimentAgent": json.dumps(
+        {"status": "ok", "risk_level": "medium", "confidence": 0.6, "triggers": [], "notes": "Scripted sentiment."}
+    ),
+    "ScamSentimentLlmAgent": json.dumps(
+        {"status": "ok", "risk_level": "medium", "confidence": 0.6, "triggers": [], "notes": "Scripted sentiment."}
+    ),
+    _REPORT_TOOL: (
+        "# Verification Report\n## Report Summary\nScripted benchmark report.\n\n## Claim Overview\n"
+        "- paraphrase: benchmark claim\n- submission_time: unspecified"
+    ),
+}
+
+
+def _text_of(content: Optional[types.Content]) -> str:
+    if not content or not content.parts:
+        return ""
+    return " ".join(part.text for part in content.parts if part.text).strip()
+
+
+def _function_responses(contents: Iterable[types.Content]) -> list[types.FunctionResponse]:
+    return [part.function_response for content in contents for part in content.parts or () if part.function_response]
+
+
+class ScriptedLlm(BaseLlm):
+    """Scripted, latency-simulating replacement for the Gemini model."""
+
+    model: str = "scripted-benchmark-llm"
+    latency_ms: float = 400.0
+    jitter_ms: float = 150.0
+    seed: Optional[int] = None
+    calls: int = 0
+
+    @classmethod
+    def supported_models(cls) -> list[str]:
+        return [r"scripted-benchmark-llm"]
+
+    async def _sleep(self) -> None:
+        rng = random.Random(None if self.seed is None else self.seed + self.calls)
+        await asyncio.sleep(max(0.0, self.latency_ms + rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000)
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        self.calls += 1
+        await self._sleep()
+        parts = self._script(llm_request)
+        prompt_chars = sum(len(_text_of(content)) for content in llm_request.contents or ())
+        prompt_chars += len(str(llm_request.config.system_instruction or ""))
+        output_chars = sum(len(part.text or "") + len(str(part.function_call or "")) for part in parts)
+        yield LlmResponse(
+            content=types.Content(role="model", parts=parts),
+            # Roughly four characters per token, so token accounting has something to count.
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=prompt_chars // 4,
+                candidates_token_count=output_chars // 4,
+                total_token_count=(prompt_chars + output_chars) // 4,
+            ),
+        )
+
+    def _script(self, llm_request: LlmRequest) -> list[types.Part]:
+        match = _AGENT_NAME_PATTERN.search(str(llm_request.config.system_instruction or ""))
+        agent_name = match.group(1) if match else ""
+        contents = llm_request.contents or []
+        claim = next((_text_of(c) for c in contents if c.role == "user" and _text_of(c)), "")
+        responses = _function_responses(contents)
+        tools = list(llm_request.tools_dict)
+
+        if _REPORT_TOOL in tools:
+            return self._route(claim, responses)
+        if tools:
+            if responses:
+                return [types.Part(text=json.dumps(responses[-1].response))]
+            return [types.Part(function_call=types.FunctionCall(name=tools[0], args={"claim": claim}))]
+        return [types.Part(text=_LANE_SUMMARIES.get(agent_name, "{}"))]
+
+    def _route(self, claim: str, responses: list[types.FunctionResponse]) -> list[types.Part]:
+        called = {response.name for response in responses}
+        if _REPORT_TOOL in called:
+            report = next(r.response for r in responses if r.name == _REPORT_TOOL)
+            return [types.Part(text=str(report.get("result", report)))]
+        if not called:
+            decision = intent_classifier.classify_intents(claim)
+            lanes = decision.lanes or tuple(lane for lane, score in decision.scores.items() if score >= 0.3) or ("fact",)
+            return [
+                types.Part(function_call=types.FunctionCall(name=_LANE_TOOLS[lane], args={"request": claim}))
+                for lane in lanes
+            ]
+        return [types.Part(function_call=types.FunctionCall(name=_REPORT_TOOL, args={"request": "summarize"}))]
+
+
+def install_fake_llm(agent: BaseAgent, llm: BaseLlm) -> int:
+    """Point every LlmAgent reachable from ``agent`` at ``llm``; returns how many were patched."""
+    patched = 0
+    for current in walk_agents(agent):
+        if isinstance(current, LlmAgent):
+            current.model = llm
+            patched += 1
+    return patched
@@ -0,0 +1,165 @@
+"""Cold-start benchmark: import and first-use cost of the package in fresh interpreters.
+
+Usage::
+
+    python -m news_info_verification.benchmarks.import_time
+    python -m news_info_verification.benchmarks.import_time --repeat 7 --max-ms news_info_verification=150 --json
+
+Each target runs in a new ``python -X importtime`` process, so nothing is served from an
+already-warm ``sys.modules``. A target is either a module path or ``module:attribute``;
+the latter also resolves the attribute, e.g. ``news_info_verification:root_agent``
+measures import plus building the default agent tree. Times are medians over
+``--repeat`` runs with the bare interpreter start-up subtracted. The report also lists
+the package's own modules with the highest self import time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+PACKAGE = (__package__ or __name__).split(".", 1)[0]
+
+DEFAULT_TARGETS = (
+    PACKAGE,
+    f"{PACKAGE}.config",
+    f"{PACKAGE}.services.text_utils",
+    f"{PACKAGE}.router",
+    f"{PACKAGE}:root_agent",
+)
+
+# Heavy third-party packages whose presence after an import is worth reporting.
+TRACKED_MODULES = ("google.adk", "google.genai", "requests")
+
+
+@dataclass
+class ImportSample:
+    wall_s: float
+    # Module -> (self µs, cumulative µs), as printed by ``-X importtime``.
+    modules: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+
+def _script(target: str) -> str:
+    module, _, attribute = target.partition(":")
+    lines = ["import importlib, sys", f"module = importlib.import_module({module!r})"]
+    if attribute:
+        lines.append(f"getattr(module, {attribute!r})")
+    lines.append(f"print(','.join(name for name in {TRACKED_MODULES!r} if name in sys.modules))")
+    return "\n".join(lines)
+
+
+def _parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    modules: dict[str, tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|", 2))
+        if self_us.isdigit() and cumulative_us.isdigit():
+            modules[name] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def _run(code: str, env: dict[str, str]) -> tuple[ImportSample, str]:
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    wall = time.perf_counter() - started
+    if completed.returncode != 0:
+        raise RuntimeError(f"import failed:\n{completed.stderr.strip()[-2000:]}")
+    return ImportSample(wall, _parse_importtime(completed.stderr)), completed.stdout.strip()
+
+
+def _environment() -> dict[str, str]:
+    env = dict(os.environ)
+    root = str(Path(__file__).resolve().parents[2])
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (root, env.get("PYTHONPATH"))))
+    return env
+
+
+def measure(targets: Sequence[str] = DEFAULT_TARGETS, *, repeat: int = 5, top: int = 8) -> dict[str, Any]:
+    """Time each target in ``repeat`` fresh interpreters and return the report."""
+    env = _environment()
+    baseline = statistics.median(_run("pass", env)[0].wall_s for _ in range(repeat))
+    report: dict[str, Any] = {"python": sys.version.split()[0], "baseline_ms": round(baseline * 1000, 1), "targets": {}}
+    for target in targets:
+        samples: list[ImportSample] = []
+        loaded = ""
+        for _ in range(repeat):
+            sample, loaded = _run(_script(target), env)
+            samples.append(sample)
+        wall = statistics.median(sample.wall_s for sample in samples)
+        last = samples[-1].modules
+        own = sorted(
+            ((name, times[0]) for name, times in last.items() if name.split(".", 1)[0] == PACKAGE),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        report["targets"][target] = {
+            "wall_ms": round(max(0.0, wall - baseline) * 1000, 1),
+            "modules_imported": len(last),
+            "heavy_modules": loaded.split(",") if loaded else [],
+            "slowest_own_modules_ms": {name: round(us / 1000, 2) for name, us in own[:top]},
+        }
+    return report
+
+
+def _parse_budgets(values: Sequence[str]) -> dict[str, float]:
+    budgets = {}
+    for value in values:
+        target, sep, limit = value.rpartition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"expected TARGET=MS, got {value!r}")
+        budgets[target] = float(limit)
+    return budgets
+
+
+def _format(report: dict[str, Any]) -> str:
+    lines = [
+        f"python {report['python']}, interpreter start-up {report['baseline_ms']} ms (subtracted)",
+        f"{'target':<44}{'ms':>9}{'modules':>9}  heavy",
+    ]
+    for target, stats in report["targets"].items():
+        heavy = ", ".join(stats["heavy_modules"]) or "-"
+        lines.append(f"{target:<44}{stats['wall_ms']:>9.1f}{stats['modules_imported']:>9}  {heavy}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure cold import and first-use cost in fresh interpreters.")
+    parser.add_argument("targets", nargs="*", default=list(DEFAULT_TARGETS), help="module or module:attribute")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8, help="own modules listed per target in --json output")
+    parser.add_argument(
+        "--max-ms", action="append", default=[], metavar="TARGET=MS", help="fail when a target exceeds its budget"
+    )
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    budgets = _parse_budgets(args.max_ms)
+    report = measure(args.targets, repeat=max(1, args.repeat), top=args.top)
+    print(json.dumps(report, indent=2) if args.json else _format(report))
+    over = [
+        f"{target}: {report['targets'][target]['wall_ms']} ms > {limit} ms"
+        for target, limit in budgets.items()
+        if target in report["targets"] and report["targets"][target]["wall_ms"] > limit
+    ]
+    for line in over:
+        print(f"over budget: {line}", file=sys.stderr)
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
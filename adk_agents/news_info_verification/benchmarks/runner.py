@@ -0,0 +1,212 @@
+"""Offline end-to-end latency benchmark for the verification pipeline.
+
+Usage::
+
+    python -m news_info_verification.benchmarks --claims 200 --concurrency 8
+    python -m news_info_verification.benchmarks --perplexity-ms 4000 --perplexity-errors 0.1 --json
+
+The root agent runs against local provider stubs and the scripted model. The report gives
+p50/p95/p99 latency for whole requests and for each lane, plus overall throughput. Merge,
+worker and report modes come from the usual environment settings (``WORKER_MODE``,
+``*_MERGE_MODE``, ``FINAL_REPORT_MODE`` and so on). Point ``VERIFICATION_CACHE_DIR`` at
+an empty directory to measure cold-cache behaviour.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional, Sequence
+
+from google.adk.agents.callback_context import CallbackContext
+
+from ..batch import BatchVerifier, ClaimRecord
+from ..router import create_root_agent
+from ..services import metrics, rate_limiter
+from ..telemetry import add_agent_callbacks, walk_agents
+from .fake_llm import ScriptedLlm, install_fake_llm
+from .stubs import DEFAULT_PROFILES, LatencyProfile, StubCluster
+
+LANE_AGENTS = ("NewsCheckAgent", "FactCheckAgent", "ScamCheckAgent")
+
+SAMPLE_CLAIMS = (
+    "Breaking: Reuters reports the central bank cut interest rates by half a point this morning.",
+    "Drinking coffee every day causes heart disease.",
+    "URGENT: your account has been suspended. Verify your account at http://secure-login.example.net/verify now.",
+    "The Great Wall of China is visible from space with the naked eye.",
+    "CNN says a magnitude 7 earthquake hit the coast yesterday, officials confirmed.",
+    "Congratulations, you have won a prize! Pay the processing fee via gift cards at https://claim-prize.example.com",
+    "I saw a post claiming the new phone update drains batteries and a link http://blog.example.org/post, is it real?",
+    "Vaccines contain microchips that track people.",
+)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty sample."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _summary(values: Sequence[float]) -> dict[str, float]:
+    return {
+        "count": len(values),
+        "p50_s": round(percentile(values, 50), 4),
+        "p95_s": round(percentile(values, 95), 4),
+        "p99_s": round(percentile(values, 99), 4),
+        "max_s": round(max(values), 4) if values else 0.0,
+    }
+
+
+class LaneTimer:
+    """Agent callbacks that record wall-clock time spent in each lane."""
+
+    def __init__(self) -> None:
+        self._started: dict[tuple[str, str], float] = {}
+        self.samples: dict[str, list[float]] = {name: [] for name in LANE_AGENTS}
+
+    def _before(self, callback_context: CallbackContext) -> None:
+        self._started[(callback_context.agent_name, callback_context.invocation_id)] = time.perf_counter()
+
+    def _after(self, callback_context: CallbackContext) -> None:
+        started = self._started.pop((callback_context.agent_name, callback_context.invocation_id), None)
+        if started is not None:
+            self.samples[callback_context.agent_name].append(time.perf_counter() - started)
+
+    def attach(self, root: Any) -> None:
+        for agent in walk_agents(root):
+            if agent.name in self.samples:
+                add_agent_callbacks(agent, self._before, self._after)
+
+
+@dataclass
+class BenchmarkConfig:
+    claims: int = 100
+    concurrency: int = 4
+    llm_latency_ms: float = 400.0
+    llm_jitter_ms: float = 150.0
+    profiles: dict[str, LatencyProfile] = field(default_factory=lambda: dict(DEFAULT_PROFILES))
+    preclassify: Optional[bool] = None
+    # Production quotas would dominate stub latencies, so they are lifted unless asked for.
+    rate_limits: bool = False
+    seed: Optional[int] = 7
+
+
+def benchmark_claims(count: int) -> Iterator[ClaimRecord]:
+    """Cycle the sample claims, tagging each so persistent caches never short-circuit a run."""
+    run = int(time.time())
+    for idx in range(count):
+        claim = SAMPLE_CLAIMS[idx % len(SAMPLE_CLAIMS)]
+        yield ClaimRecord(id=f"bench-{idx}", claim=f"{claim} [bench {run}-{idx}]")
+
+
+@contextlib.contextmanager
+def _without_rate_limits() -> Iterator[None]:
+    saved = dict(rate_limiter.RATE_LIMITS)
+    for provider in saved:
+        rate_limiter.configure(provider, rate_per_min=0, burst=0)
+    try:
+        yield
+    finally:
+        for provider, (rate_per_min, burst) in saved.items():
+            rate_limiter.configure(provider, rate_per_min=rate_per_min, burst=burst)
+
+
+async def run_benchmark(config: BenchmarkConfig) -> dict[str, Any]:
+    """Run ``config.claims`` verifications against the stubs and return the latency report."""
+    limits = contextlib.nullcontext() if config.rate_limits else _without_rate_limits()
+    with limits, StubCluster(config.profiles, seed=config.seed) as cluster:
+        agent = create_root_agent(preclassify=config.preclassify)
+        llm = ScriptedLlm(latency_ms=config.llm_latency_ms, jitter_ms=config.llm_jitter_ms, seed=config.seed)
+        install_fake_llm(agent, llm)
+        timer = LaneTimer()
+        timer.attach(agent)
+
+        verifier = BatchVerifier(agent, concurrency=config.concurrency)
+        latencies: list[float] = []
+        errors = 0
+        started = time.perf_counter()
+        async for result in verifier.run(benchmark_claims(config.claims)):
+            latencies.append(result.latency_s)
+            errors += result.status != "ok"
+        elapsed = time.perf_counter() - started
+
+        return {
+            "claims": config.claims,
+            "concurrency": config.concurrency,
+            "errors": errors,
+            "elapsed_s": round(elapsed, 3),
+            "throughput_per_s": round(len(latencies) / elapsed, 3) if elapsed > 0 else 0.0,
+            "request": _summary(latencies),
+            "lanes": {name: _summary(samples) for name, samples in timer.samples.items()},
+            "llm_calls": llm.calls,
+            "provider_requests": cluster.request_counts(),
+        }
+
+
+def _format(report: dict[str, Any]) -> str:
+    lines = [
+        f"claims={report['claims']} concurrency={report['concurrency']} errors={report['errors']} "
+        f"elapsed={report['elapsed_s']}s throughput={report['throughput_per_s']}/s llm_calls={report['llm_calls']}",
+        f"{'scope':<16}{'count':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}",
+    ]
+    rows = [("request", report["request"]), *report["lanes"].items()]
+    for name, stats in rows:
+        lines.append(
+            f"{name:<16}{stats['count']:>7}{stats['p50_s']:>9.3f}{stats['p95_s']:>9.3f}"
+            f"{stats['p99_s']:>9.3f}{stats['max_s']:>9.3f}"
+        )
+    lines.append("provider requests: " + ", ".join(f"{k}={v}" for k, v in report["provider_requests"].items()))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline latency benchmark with provider stubs and a scripted LLM.")
+    parser.add_argument("--claims", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--llm-ms", type=float, default=400.0, help="mean scripted LLM latency per model turn")
+    parser.add_argument("--llm-jitter-ms", type=float, default=150.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--no-preclassify", action="store_true", help="always route through the LLM router")
+    parser.add_argument("--rate-limits", action="store_true", help="keep the production per-provider rate limits")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--metrics", action="store_true", help="also print the Prometheus metrics exposition")
+    for provider, profile in DEFAULT_PROFILES.items():
+        parser.add_argument(f"--{provider}-ms", type=float, default=profile.mean_ms)
+        parser.add_argument(f"--{provider}-errors", type=float, default=profile.error_rate, help="error ratio 0-1")
+        parser.add_argument(f"--{provider}-tail", type=float, default=profile.tail_ratio, help="slow-tail ratio 0-1")
+    args = parser.parse_args(argv)
+
+    profiles = {
+        provider: LatencyProfile(
+            mean_ms=getattr(args, f"{provider}_ms"),
+            jitter_ms=profile.jitter_ms,
+            tail_ratio=getattr(args, f"{provider}_tail"),
+            tail_ms=profile.tail_ms,
+            error_rate=getattr(args, f"{provider}_errors"),
+            error_status=profile.error_status,
+        )
+        for provider, profile in DEFAULT_PROFILES.items()
+    }
+    config = BenchmarkConfig(
+        claims=args.claims,
+        concurrency=args.concurrency,
+        llm_latency_ms=args.llm_ms,
+        llm_jitter_ms=args.llm_jitter_ms,
+        profiles=profiles,
+        preclassify=False if args.no_preclassify else None,
+        rate_limits=args.rate_limits,
+        seed=args.seed,
+    )
+    report = asyncio.run(run_benchmark(config))
+    print(json.dumps(report, indent=2) if args.json else _format(report))
+    if args.metrics:
+        print(metrics.render(), end="")
+    return 0
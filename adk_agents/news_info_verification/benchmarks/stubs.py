@@ -0,0 +1,302 @@
+"""Local HTTP stand-ins for GNews, Fact Check, VirusTotal and Perplexity.
+
+Each provider gets its own threaded server with a configurable latency and error profile.
+The response bodies follow the upstream schemas the clients in ``services/`` parse, so
+the whole client/tool stack runs unmodified against ``127.0.0.1``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Mapping, Optional
+from urllib.parse import parse_qs, urlparse
+
+from ..services import factcheck_client, gnews_client, perplexity_client, virustotal_client
+
+PROVIDERS = ("gnews", "factcheck", "virustotal", "perplexity")
+
+_API_KEY_ENV = ("GNEWS_API_TOKEN", "GOOGLE_FACT_CHECK_API_KEY", "VT_API_KEY", "PERPLEXITY_API_KEY")
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Response time and failure behaviour of one stub provider.
+
+    Latency is ``mean_ms`` plus uniform ``jitter_ms``. A ``tail_ratio`` share of requests
+    instead take ``tail_ms``. An ``error_rate`` share are answered with ``error_status``.
+    """
+
+    mean_ms: float = 100.0
+    jitter_ms: float = 20.0
+    tail_ratio: float = 0.0
+    tail_ms: float = 2000.0
+    error_rate: float = 0.0
+    error_status: int = 503
+
+    def sample_delay(self, rng: random.Random) -> float:
+        if self.tail_ratio and rng.random() < self.tail_ratio:
+            return self.tail_ms / 1000
+        return max(0.0, self.mean_ms + rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+
+    def should_fail(self, rng: random.Random) -> bool:
+        return bool(self.error_rate) and rng.random() < self.error_rate
+
+
+DEFAULT_PROFILES: Mapping[str, LatencyProfile] = {
+    "gnews": LatencyProfile(mean_ms=250, jitter_ms=80),
+    "factcheck": LatencyProfile(mean_ms=150, jitter_ms=50),
+    "virustotal": LatencyProfile(mean_ms=300, jitter_ms=100),
+    "perplexity": LatencyProfile(mean_ms=2500, jitter_ms=800),
+}
+
+
+def _gnews_body(query: str, rng: random.Random) -> dict[str, Any]:
+    articles = [
+        {
+            "title": f"Coverage of {query[:60]} ({idx + 1})",
+            "description": f"Report {idx + 1} discussing the claim.",
+            "url": f"https://news{idx}.example.com/{abs(hash((query, idx))) % 10**8}",
+            "publishedAt": "2024-01-01T00:00:00Z",
+            "source": {"name": f"Outlet {idx + 1}", "url": f"https://news{idx}.example.com"},
+        }
+        for idx in range(rng.randint(0, 5))
+    ]
+    return {"totalArticles": len(articles), "articles": articles}
+
+
+def _factcheck_body(query: str, rng: random.Random) -> dict[str, Any]:
+    ratings = ("False", "True", "Misleading", "Mostly false")
+    claims = [
+        {
+            "text": query[:120],
+            "claimant": "Social media",
+            "claimReview": [
+                {
+                    "publisher": {"name": f"Checker {idx + 1}", "site": f"check{idx}.example.org"},
+                    "url": f"https://check{idx}.example.org/review/{abs(hash((query, idx))) % 10**8}",
+                    "title": f"Fact check: {query[:60]}",
+                    "textualRating": rng.choice(ratings),
+                    "reviewDate": "2024-01-02T00:00:00Z",
+                    "languageCode": "en",
+                }
+            ],
+        }
+        for idx in range(rng.randint(0, 3))
+    ]
+    return {"claims": claims} if claims else {}
+
+
+def _virustotal_body(rng: random.Random) -> Optional[dict[str, Any]]:
+    roll = rng.random()
+    if roll < 0.1:
+        return None  # 404: URL never analysed
+    malicious = 0 if roll < 0.7 else rng.randint(1, 8)
+    return {
+        "data": {
+            "type": "url",
+            "attributes": {
+                "last_analysis_date": int(time.time()) - 3600,
+                "last_analysis_stats": {
+                    "harmless": 60,
+                    "malicious": malicious,
+                    "suspicious": rng.randint(0, 2),
+                    "undetected": 20,
+                    "timeout": 0,
+                },
+            },
+        }
+    }
+
+
+def _perplexity_content(system_prompt: str, rng: random.Random) -> dict[str, Any]:
+    confidence = round(rng.uniform(0.4, 0.9), 2)
+    if "scam" in system_prompt.lower():
+        return {
+            "status": "ok",
+            "verdict": rng.choice(("likely_scam", "unclear", "benign")),
+            "confidence": confidence,
+            "pattern_matches": [{"pattern": "urgency", "explanation": "Pressures the reader to act immediately."}],
+            "supporting_citations": ["https://consumer.example.gov/scams"],
+            "notes": "Stubbed scam pattern comparison.",
+        }
+    payload = {
+        "status": "ok",
+        "verdict": rng.choice(("true", "false", "mixed", "unknown")),
+        "confidence": confidence,
+        "notes": "Stubbed web research result.",
+    }
+    if "factual accuracy" in system_prompt.lower():
+        payload["reasoning"] = ["Primary sources were consulted."]
+        payload["references"] = [
+            {"title": "Reference", "url": "https://ref.example.org/a", "published": "2024-01-01"}
+        ]
+    else:
+        payload["reasoning_bullets"] = ["Multiple outlets report the event."]
+        payload["citations"] = ["https://news0.example.com/story"]
+    return payload
+
+
+def _perplexity_body(request: Mapping[str, Any], rng: random.Random) -> dict[str, Any]:
+    messages = request.get("messages") or []
+    system = next((m.get("content", "") for m in messages if m.get("role") == "system"), "")
+    return {
+        "id": "stub",
+        "model": request.get("model", "sonar"),
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": json.dumps(_perplexity_content(system, rng))}}],
+        "search_results": [{"title": "Result", "url": "https://search.example.com/1", "date": "2024-01-01"}],
+        "usage": {"prompt_tokens": rng.randint(300, 600), "completion_tokens": rng.randint(150, 400), "total_tokens": 0},
+    }
+
+
+@dataclass
+class StubServer:
+    """One provider stub listening on an ephemeral localhost port."""
+
+    provider: str
+    profile: LatencyProfile
+    seed: Optional[int] = None
+    requests: int = field(default=0, init=False)
+    _server: Optional[ThreadingHTTPServer] = field(default=None, init=False, repr=False)
+    _rng: random.Random = field(init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._rng = random.Random(self.seed)
+
+    @property
+    def base_url(self) -> str:
+        if self._server is None:
+            raise RuntimeError(f"{self.provider} stub is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _draw(self, fn: Callable[[random.Random], Any]) -> Any:
+        with self._lock:
+            return fn(self._rng)
+
+    def start(self) -> "StubServer":
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:  # keep benchmark output clean
+                return
+
+            def _reply(self, status: int, body: Optional[dict[str, Any]]) -> None:
+                encoded = json.dumps(body or {}).encode("utf-8")
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(encoded)))
+                    self.end_headers()
+                    self.wfile.write(encoded)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up (deadline or hedged request); nothing to deliver.
+                    self.close_connection = True
+
+            def _handle(self, body: Optional[dict[str, Any]]) -> None:
+                with stub._lock:
+                    stub.requests += 1
+                delay, fail = stub._draw(lambda rng: (stub.profile.sample_delay(rng), stub.profile.should_fail(rng)))
+                time.sleep(delay)
+                if fail:
+                    self._reply(stub.profile.error_status, {"error": "stubbed failure"})
+                    return
+                self._reply(*stub._respond(self.path, body))
+
+            def do_HEAD(self) -> None:
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_GET(self) -> None:
+                self._handle(None)
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b"{}"
+                self._handle(json.loads(raw or b"{}"))
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name=f"stub-{self.provider}", daemon=True).start()
+        return self
+
+    def _respond(self, path: str, body: Optional[dict[str, Any]]) -> tuple[int, Optional[dict[str, Any]]]:
+        query = (parse_qs(urlparse(path).query).get("q") or parse_qs(urlparse(path).query).get("query") or [""])[0]
+        if self.provider == "gnews":
+            return 200, self._draw(lambda rng: _gnews_body(query, rng))
+        if self.provider == "factcheck":
+            return 200, self._draw(lambda rng: _factcheck_body(query, rng))
+        if self.provider == "virustotal":
+            report = self._draw(_virustotal_body)
+            return (200, report) if report else (404, {"error": {"code": "NotFoundError"}})
+        return 200, self._draw(lambda rng: _perplexity_body(body or {}, rng))
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class StubCluster:
+    """All four provider stubs, wired into the service clients while installed."""
+
+    def __init__(self, profiles: Optional[Mapping[str, LatencyProfile]] = None, *, seed: Optional[int] = None) -> None:
+        merged = {**DEFAULT_PROFILES, **(profiles or {})}
+        self.servers = {
+            provider: StubServer(provider, merged[provider], seed=None if seed is None else seed + idx)
+            for idx, provider in enumerate(PROVIDERS)
+        }
+        self._saved: dict[str, Any] = {}
+
+    def __enter__(self) -> "StubCluster":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def start(self) -> "StubCluster":
+        for server in self.servers.values():
+            server.start()
+        self._saved = {
+            "gnews": gnews_client.API_URL,
+            "factcheck": factcheck_client.API_URL,
+            "virustotal": virustotal_client.API_URL,
+            "perplexity": perplexity_client.PERPLEXITY_API_URL,
+            "env": {name: os.environ.get(name) for name in _API_KEY_ENV},
+        }
+        gnews_client.API_URL = f"{self.servers['gnews'].base_url}/api/v4/search"
+        factcheck_client.API_URL = f"{self.servers['factcheck'].base_url}/v1alpha1/claims:search"
+        virustotal_client.API_URL = f"{self.servers['virustotal'].base_url}/api/v3/urls"
+        perplexity_client.PERPLEXITY_API_URL = f"{self.servers['perplexity'].base_url}/chat/completions"
+        for name in _API_KEY_ENV:
+            os.environ[name] = "benchmark-stub-key"
+        return self
+
+    def close(self) -> None:
+        for server in self.servers.values():
+            server.close()
+        if not self._saved:
+            return
+        gnews_client.API_URL = self._saved["gnews"]
+        factcheck_client.API_URL = self._saved["factcheck"]
+        virustotal_client.API_URL = self._saved["virustotal"]
+        perplexity_client.PERPLEXITY_API_URL = self._saved["perplexity"]
+        for name, value in self._saved["env"].items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        self._saved = {}
+
+    def request_counts(self) -> dict[str, int]:
+        return {provider: server.requests for provider, server in self.servers.items()}
@@ -1,10 +1,195 @@
 """Shared configuration values for the news & information verification agents."""
 
+import os
 from dataclasses import dataclass
 
 MODEL = "gemini-2.0-flash"
 
 
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back to ``default``."""
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment, falling back to ``default``."""
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+def _env_flag(name: str, default: bool = False) -> bool:
+    """Read a boolean setting from the environment (1/true/yes/on)."""
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
+
+
+# Lane merge implementation per lane: "llm" (Gemini merge agent) or "deterministic".
+NEWS_MERGE_MODE = os.getenv("NEWS_MERGE_MODE", "llm").strip().lower()
+FACT_MERGE_MODE = os.getenv("FACT_MERGE_MODE", "llm").strip().lower()
+SCAM_MERGE_MODE = os.getenv("SCAM_MERGE_MODE", "llm").strip().lower()
+
+# Tool-backed worker implementation: "direct" (default; call the tool, no LLM) or "llm" (Gemini relays the tool output).
+WORKER_MODE = os.getenv("WORKER_MODE", "direct").strip().lower()
+
+# ScamSentimentAgent implementation: "llm" (default; Gemini), "local" (lexicon scorer only) or
+# "gate" (lexicon scorer; Gemini only for scores between the gate thresholds).
+SCAM_SENTIMENT_MODE = os.getenv("SCAM_SENTIMENT_MODE", "llm").strip().lower()
+SCAM_SCORER_GATE_LOW = _env_float("SCAM_SCORER_GATE_LOW", 0.25)
+SCAM_SCORER_GATE_HIGH = _env_float("SCAM_SCORER_GATE_HIGH", 0.6)
+SCAM_SCORER_MAX_CHARS = _env_int("SCAM_SCORER_MAX_CHARS", 100_000)
+
+# Final report implementation: "llm" (FinalProcessingAgent prompt) or "template".
+FINAL_REPORT_MODE = os.getenv("FINAL_REPORT_MODE", "llm").strip().lower()
+
+# Local intent pre-classifier in front of the LLM router (on by default; 0 restores LLM-only routing).
+ROUTER_PRECLASSIFIER_ENABLED = _env_flag("ROUTER_PRECLASSIFIER_ENABLED", True)
+ROUTER_PRECLASSIFIER_THRESHOLD = _env_float("ROUTER_PRECLASSIFIER_THRESHOLD", 0.8)
+
+# Request deadline in seconds (0 disables). Fan-outs stop DEADLINE_REPORT_RESERVE_S early
+# so the lane merges and the final report still finish in time.
+VERIFICATION_DEADLINE_S = _env_float("VERIFICATION_DEADLINE_S", 60.0)
+DEADLINE_REPORT_RESERVE_S = _env_float("DEADLINE_REPORT_RESERVE_S", 10.0)
+
+# Streaming mode: emit each lane summary (and optionally each worker signal) as it lands.
+STREAM_LANE_RESULTS = _env_flag("STREAM_LANE_RESULTS")
+STREAM_WORKER_SIGNALS = _env_flag("STREAM_WORKER_SIGNALS")
+
+# Near-duplicate claim reuse (opt-in): completed verifications are indexed with MinHash/LSH,
+# and a new claim whose estimated similarity reaches NEAR_DUPLICATE_THRESHOLD, with the same
+# names, numbers, URLs and negations, reuses the stored lane summaries and report.
+# Entries expire after NEAR_DUPLICATE_TTL_S.
+NEAR_DUPLICATE_ENABLED = _env_flag("NEAR_DUPLICATE_ENABLED")
+NEAR_DUPLICATE_THRESHOLD = _env_float("NEAR_DUPLICATE_THRESHOLD", 0.9)
+NEAR_DUPLICATE_MAX_ENTRIES = _env_int("NEAR_DUPLICATE_MAX_ENTRIES", 5000)
+NEAR_DUPLICATE_TTL_S = _env_float("NEAR_DUPLICATE_TTL_S", 15 * 60)
+NEAR_DUPLICATE_NUM_PERM = _env_int("NEAR_DUPLICATE_NUM_PERM", 128)
+NEAR_DUPLICATE_BANDS = _env_int("NEAR_DUPLICATE_BANDS", 32)
+
+# Bulk verification (batch.py)
+BATCH_CONCURRENCY = _env_int("BATCH_CONCURRENCY", 4)
+
+# Outbound HTTP transport
+HTTP_POOL_HOSTS = _env_int("HTTP_POOL_HOSTS", 10)
+HTTP_POOL_MAXSIZE = _env_int("HTTP_POOL_MAXSIZE", 10)
+HTTP_PREWARM = _env_flag("HTTP_PREWARM")
+
+# Per-provider outbound rate limits: (requests per minute, burst). A rate <= 0 disables the limit.
+RATE_LIMIT_ENABLED = _env_flag("RATE_LIMIT_ENABLED", True)
+RATE_LIMIT_MAX_RETRIES = _env_int("RATE_LIMIT_MAX_RETRIES", 3)
+RATE_LIMITS = {
+    "virustotal": (_env_float("VT_RATE_PER_MIN", 4), _env_int("VT_RATE_BURST", 4)),
+    "gnews": (_env_float("GNEWS_RATE_PER_MIN", 60), _env_int("GNEWS_RATE_BURST", 5)),
+    "factcheck": (_env_float("FACTCHECK_RATE_PER_MIN", 600), _env_int("FACTCHECK_RATE_BURST", 10)),
+    "perplexity": (_env_float("PERPLEXITY_RATE_PER_MIN", 50), _env_int("PERPLEXITY_RATE_BURST", 5)),
+}
+
+# Per-provider circuit breakers over the last BREAKER_WINDOW calls.
+BREAKER_ENABLED = _env_flag("BREAKER_ENABLED", True)
+BREAKER_WINDOW = _env_int("BREAKER_WINDOW", 20)
+BREAKER_MIN_REQUESTS = _env_int("BREAKER_MIN_REQUESTS", 5)
+BREAKER_FAILURE_RATIO = _env_float("BREAKER_FAILURE_RATIO", 0.5)
+BREAKER_COOLDOWN = _env_float("BREAKER_COOLDOWN", 30.0)
+BREAKER_HALF_OPEN_PROBES = _env_int("BREAKER_HALF_OPEN_PROBES", 1)
+
+# Hedged GETs: send a backup request once the first outlives the provider's latency percentile.
+HTTP_HEDGE_ENABLED = _env_flag("HTTP_HEDGE_ENABLED")
+HTTP_HEDGE_PROVIDERS = frozenset(
+    name.strip() for name in os.getenv("HTTP_HEDGE_PROVIDERS", "gnews,factcheck,virustotal").split(",") if name.strip()
+)
+HTTP_HEDGE_PERCENTILE = _env_float("HTTP_HEDGE_PERCENTILE", 95.0)
+HTTP_HEDGE_MIN_SAMPLES = _env_int("HTTP_HEDGE_MIN_SAMPLES", 20)
+HTTP_HEDGE_MIN_DELAY = _env_float("HTTP_HEDGE_MIN_DELAY", 0.05)
+
+# In-process metrics (services/metrics.py); METRICS_PORT > 0 serves them at /metrics.
+METRICS_ENABLED = _env_flag("METRICS_ENABLED", True)
+METRICS_PORT = _env_int("METRICS_PORT", 0)
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+
+# LLM cost estimates: (USD per 1M prompt tokens, USD per 1M completion tokens, USD per request).
+LLM_PRICES = {
+    "gemini": (
+        _env_float("GEMINI_PRICE_INPUT_PER_M", 0.10),
+        _env_float("GEMINI_PRICE_OUTPUT_PER_M", 0.40),
+        0.0,
+    ),
+    "perplexity": (
+        _env_float("PERPLEXITY_PRICE_INPUT_PER_M", 3.0),
+        _env_float("PERPLEXITY_PRICE_OUTPUT_PER_M", 15.0),
+        _env_float("PERPLEXITY_PRICE_PER_REQUEST", 0.006),
+    ),
+}
+# Default per-request token budget across Gemini and Perplexity; 0 means unlimited.
+TOKEN_BUDGET_PER_REQUEST = _env_int("TOKEN_BUDGET_PER_REQUEST", 0)
+
+# URL extraction: characters scanned per message, window size, and longest URL kept
+URL_SCAN_MAX_CHARS = _env_int("URL_SCAN_MAX_CHARS", 1_000_000)
+URL_SCAN_CHUNK_CHARS = _env_int("URL_SCAN_CHUNK_CHARS", 64 * 1024)
+URL_MAX_LENGTH = _env_int("URL_MAX_LENGTH", 2048)
+
+# Scam lane URL scanning
+VT_SCAN_CONCURRENCY = _env_int("VT_SCAN_CONCURRENCY", 5)
+VT_LOOKUP_TIMEOUT = _env_float("VT_LOOKUP_TIMEOUT", 8.0)
+
+# Offline URL/domain blocklist checked before VirusTotal. BLOCKLIST_SOURCES lists
+# blocklist files (os.pathsep-separated); the index is rebuilt when they change.
+BLOCKLIST_ENABLED = _env_flag("BLOCKLIST_ENABLED", True)
+BLOCKLIST_SOURCES = tuple(path for path in os.getenv("BLOCKLIST_SOURCES", "").split(os.pathsep) if path.strip())
+BLOCKLIST_RELOAD_INTERVAL_S = _env_float("BLOCKLIST_RELOAD_INTERVAL_S", 30.0)
+
+# Persistent response caches
+CACHE_DIR = os.path.expanduser(os.getenv("VERIFICATION_CACHE_DIR", "~/.cache/news_info_verification"))
+
+BLOCKLIST_INDEX_PATH = os.path.expanduser(os.getenv("BLOCKLIST_INDEX_PATH", os.path.join(CACHE_DIR, "blocklist.idx")))
+
+VT_CACHE_ENABLED = _env_flag("VT_CACHE_ENABLED", True)
+VT_CACHE_MAX_ENTRIES = _env_int("VT_CACHE_MAX_ENTRIES", 50_000)
+VT_CACHE_TTL_CLEAN = _env_int("VT_CACHE_TTL_CLEAN", 60 * 60)
+VT_CACHE_TTL_SUSPICIOUS = _env_int("VT_CACHE_TTL_SUSPICIOUS", 6 * 60 * 60)
+VT_CACHE_TTL_MALICIOUS = _env_int("VT_CACHE_TTL_MALICIOUS", 7 * 24 * 60 * 60)
+VT_CACHE_TTL_NOT_FOUND = _env_int("VT_CACHE_TTL_NOT_FOUND", 15 * 60)
+
+FACTCHECK_CACHE_ENABLED = _env_flag("FACTCHECK_CACHE_ENABLED", True)
+FACTCHECK_CACHE_MAX_ENTRIES = _env_int("FACTCHECK_CACHE_MAX_ENTRIES", 20_000)
+FACTCHECK_CACHE_TTL = _env_int("FACTCHECK_CACHE_TTL", 24 * 60 * 60)
+FACTCHECK_CACHE_TTL_EMPTY = _env_int("FACTCHECK_CACHE_TTL_EMPTY", 60 * 60)
+
+# Local ClaimReview full-text index consulted before the Fact Check API. A local answer
+# needs at least FACTCHECK_LOCAL_MIN_MATCH of the claim's terms in the review text.
+FACTCHECK_LOCAL_INDEX_ENABLED = _env_flag("FACTCHECK_LOCAL_INDEX_ENABLED", True)
+FACTCHECK_LOCAL_INDEX_PATH = os.path.expanduser(
+    os.getenv("FACTCHECK_LOCAL_INDEX_PATH", os.path.join(CACHE_DIR, "claimreview_index.sqlite3"))
+)
+FACTCHECK_LOCAL_MIN_MATCH = _env_float("FACTCHECK_LOCAL_MIN_MATCH", 0.6)
+
+# Persistent verdict store (opt-in): each lane's summary and worker signals per claim
+# fingerprint, reused while fresh. Scam results also expire with the age of VirusTotal's analysis.
+VERDICT_STORE_ENABLED = _env_flag("VERDICT_STORE_ENABLED")
+VERDICT_STORE_PATH = os.path.expanduser(os.getenv("VERDICT_STORE_PATH", os.path.join(CACHE_DIR, "verdicts.sqlite3")))
+VERDICT_STORE_MAX_CLAIMS = _env_int("VERDICT_STORE_MAX_CLAIMS", 20_000)
+VERDICT_TTL_NEWS = _env_int("VERDICT_TTL_NEWS", 10 * 60)
+VERDICT_TTL_FACT = _env_int("VERDICT_TTL_FACT", 3 * 24 * 60 * 60)
+VERDICT_TTL_SCAM = _env_int("VERDICT_TTL_SCAM", 24 * 60 * 60)
+
+PERPLEXITY_CACHE_ENABLED = _env_flag("PERPLEXITY_CACHE_ENABLED", True)
+PERPLEXITY_CACHE_MAX_ENTRIES = _env_int("PERPLEXITY_CACHE_MAX_ENTRIES", 20_000)
+PERPLEXITY_CACHE_TTL_NEWS = _env_int("PERPLEXITY_CACHE_TTL_NEWS", 15 * 60)
+PERPLEXITY_CACHE_TTL_FACT = _env_int("PERPLEXITY_CACHE_TTL_FACT", 24 * 60 * 60)
+PERPLEXITY_CACHE_TTL_SCAM = _env_int("PERPLEXITY_CACHE_TTL_SCAM", 3 * 24 * 60 * 60)
+
+
 @dataclass(frozen=True)
 class StateKeys:
     """Centralized session.state keys used across the workflow."""
@@ -26,6 +211,19 @@ class StateKeys:
     SCAM_LINK: str = "scam_link_signal"
     SCAM_SUMMARY: str = "scam_check_summary"
 
+    # Request context captured for the final report
+    CLAIM_TEXT: str = "claim_text"
+    SUBMITTED_AT: str = "submitted_at"
+    LANE_SKIP_REASONS: str = "lane_skip_reasons"
+    NEAR_DUPLICATE: str = "near_duplicate"
+    REUSED_LANES: str = "reused_lanes"
+
+    # Optional per-request limits in (token budget, deadline); usage for this turn and the session out
+    TOKEN_BUDGET: str = "token_budget"
+    DEADLINE_S: str = "deadline_s"
+    TOKEN_USAGE: str = "token_usage"
+    TOKEN_USAGE_TOTAL: str = "token_usage_total"
+
     # Final response
     FINAL_REPORT: str = "final_report"
 
@@ -1,11 +1,21 @@
 """Lane exports for the news & information verification workflow."""
 
-from .news import news_check_agent
-from .fact import fact_check_agent
+from . import fact, news
+from .common import lazy_defaults
+from .fact import create_fact_check_agent
+from .news import create_news_check_agent
 from .scam import create_scam_check_agent
 
+__getattr__ = lazy_defaults(
+    globals(),
+    news_check_agent=lambda: news.news_check_agent,
+    fact_check_agent=lambda: fact.fact_check_agent,
+)
+
 __all__ = [
+    "create_news_check_agent",
     "news_check_agent",
+    "create_fact_check_agent",
     "fact_check_agent",
     "create_scam_check_agent",
 ]
@@ -0,0 +1,344 @@
+"""Shared building blocks for lane agents that run without an LLM round trip."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import re
+import time
+from typing import Any, AsyncGenerator, Callable, Iterable, Mapping, Optional, Sequence
+
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.tools.function_tool import FunctionTool
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
+
+from ..config import DEADLINE_REPORT_RESERVE_S, STATE_KEYS
+from ..services import context_helpers, deadline, text_utils
+
+MERGE_MODE_LLM = "llm"
+MERGE_MODE_DETERMINISTIC = "deterministic"
+
+WORKER_MODE_LLM = "llm"
+WORKER_MODE_DIRECT = "direct"
+
+SENTIMENT_MODE_LLM = "llm"
+SENTIMENT_MODE_LOCAL = "local"
+SENTIMENT_MODE_GATE = "gate"
+
+STATUS_TIMEOUT = "timeout"
+
+_FENCE_PATTERN = re.compile(r"^```(?:json)?\s*|\s*```$", re.IGNORECASE)
+_JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+_VERDICT_ALIASES = {
+    "true": "true",
+    "supported": "true",
+    "false": "false",
+    "refuted": "false",
+    "mixed": "mixed",
+}
+
+
+def parse_signal(value: Any) -> dict[str, Any]:
+    """Coerce a worker's state value into a dict.
+
+    Workers may publish a dict directly or, when an LLM relayed the tool output, a JSON
+    string that is sometimes wrapped in code fences.
+    """
+    if isinstance(value, Mapping):
+        return dict(value)
+    if not isinstance(value, str) or not value.strip():
+        return {}
+    candidate = _FENCE_PATTERN.sub("", value.strip())
+    for text in (candidate, *(_JSON_OBJECT_PATTERN.findall(candidate)[:1])):
+        try:
+            parsed = json.loads(text)
+        except (TypeError, ValueError):
+            continue
+        if isinstance(parsed, dict):
+            return parsed
+    return {"status": "error", "notes": f"Unparseable worker output: {text_utils.truncate_sentences([value], limit=160)}"}
+
+
+def signal_confidence(signal: Mapping[str, Any]) -> Optional[float]:
+    try:
+        return float(signal.get("confidence"))
+    except (TypeError, ValueError):
+        return None
+
+
+def confidence_range(signals: Iterable[Mapping[str, Any]]) -> str:
+    """Format the min-max confidence across signals that did not error."""
+    values = [
+        value
+        for signal in signals
+        if signal and signal.get("status") not in ("error", STATUS_TIMEOUT)
+        for value in (signal_confidence(signal),)
+        if value is not None
+    ]
+    if not values:
+        return "0.00-0.00"
+    return f"{min(values):.2f}-{max(values):.2f}"
+
+
+def normalize_verdict(verdict: Any) -> Optional[str]:
+    """Map worker verdict labels onto true/false/mixed; anything else is uninformative."""
+    if not isinstance(verdict, str):
+        return None
+    return _VERDICT_ALIASES.get(verdict.strip().lower())
+
+
+def consensus_verdict(signals: Iterable[Mapping[str, Any]]) -> str:
+    """Combine the informative verdicts of successful signals into true|false|mixed|unknown."""
+    verdicts = {
+        verdict
+        for signal in signals
+        if signal and signal.get("status", "ok") == "ok"
+        for verdict in (normalize_verdict(signal.get("verdict")),)
+        if verdict
+    }
+    if not verdicts:
+        return "unknown"
+    if len(verdicts) == 1:
+        return verdicts.pop()
+    return "mixed"
+
+
+def timeout_signal(agent_name: str) -> dict[str, Any]:
+    """Worker payload recorded when the request deadline cut the worker off."""
+    return {
+        "status": STATUS_TIMEOUT,
+        "verdict": "unknown",
+        "confidence": 0.0,
+        "notes": f"{agent_name} did not finish before the request deadline.",
+    }
+
+
+def split_source(entry: Any) -> tuple[str, str]:
+    """Split a source entry (``"Label - URL"`` string or dict) into ``(label, url)``."""
+    if isinstance(entry, Mapping):
+        url = str(entry.get("url") or "").strip()
+        label = str(entry.get("organization") or entry.get("title") or entry.get("source") or "").strip()
+        return label or url, url
+    text = str(entry or "").strip()
+    urls = text_utils.extract_urls(text)
+    if not urls:
+        return text, ""
+    url = urls[0]
+    raw = url if url in text else url.removeprefix("https://")
+    label = text.split(raw, 1)[0].strip(" -—–:|")
+    return label or url, url
+
+
+def dedupe_sources(entries: Iterable[Any]) -> list[tuple[str, str]]:
+    """Return ``(label, url)`` pairs with duplicate URLs (or labels, when URL-less) removed."""
+    seen: set[str] = set()
+    ordered: list[tuple[str, str]] = []
+    for entry in entries:
+        label, url = split_source(entry)
+        key = url or label
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        ordered.append((label, url))
+    return ordered
+
+
+def format_sources(sources: list[tuple[str, str]], *, empty: str = "none") -> list[str]:
+    """Render numbered Markdown source lines."""
+    if not sources:
+        return [f"1. {empty}"]
+    return [
+        f"{idx}. {label} — {url}" if url and label != url else f"{idx}. {url or label}"
+        for idx, (label, url) in enumerate(sources, start=1)
+    ]
+
+
+def describe_failure(agent_name: str, signal: Mapping[str, Any], *, note_field: str = "notes") -> Optional[str]:
+    """Return a verbatim gap line when a worker reported an error or no data."""
+    if not signal:
+        return f"{agent_name}: no output recorded"
+    status = signal.get("status", "ok")
+    if status in ("ok",):
+        return None
+    detail = signal.get(note_field) or signal.get("notes") or signal.get("recommended_action") or ""
+    return f"{agent_name}: status {status}" + (f" — {detail}" if detail else "")
+
+
+def lazy_defaults(namespace: dict[str, Any], **factories: Callable[[], Any]) -> Callable[[str], Any]:
+    """Build a module ``__getattr__`` that creates the named default agents on first access.
+
+    Each instance is stored in ``namespace``, so later lookups are plain attribute reads
+    and importing the module never constructs an agent.
+    """
+
+    def __getattr__(name: str) -> Any:
+        factory = factories.get(name)
+        if factory is None:
+            raise AttributeError(f"module {namespace['__name__']!r} has no attribute {name!r}")
+        return namespace.setdefault(name, factory())
+
+    return __getattr__
+
+
+class DeterministicMergeAgent(BaseAgent):
+    """Renders a lane summary from worker state in Python instead of calling Gemini."""
+
+    output_key: str
+    renderer: Callable[[Mapping[str, Any]], str]
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        summary = self.renderer(ctx.session.state)
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=summary)]),
+            actions=EventActions(state_delta={self.output_key: summary}),
+        )
+
+
+class ToolExecutorAgent(BaseAgent):
+    """Calls a worker tool with the claim text and stores its payload untouched.
+
+    Replaces the "call the tool and echo its JSON" LlmAgents: no Gemini round trip, and
+    the dict in ``output_key`` is exactly what the tool returned.
+    """
+
+    tool: FunctionTool
+    output_key: str
+
+    def _claim_text(self, ctx: InvocationContext) -> str:
+        return context_helpers.extract_latest_user_text(ctx) or str(ctx.session.state.get(STATE_KEYS.CLAIM_TEXT) or "")
+
+    async def _call_tool(self, ctx: InvocationContext) -> Any:
+        payload = await self.tool.run_async(args={"claim": self._claim_text(ctx)}, tool_context=ToolContext(ctx))
+        if isinstance(payload, dict) and payload.get("status") == "error" and deadline.expired():
+            # The client gave up because the deadline ran out, not because the provider failed.
+            payload = {**timeout_signal(self.name), "error": payload.get("notes") or payload.get("synopsis")}
+        return payload
+
+    def _payload_event(self, ctx: InvocationContext, payload: Any) -> Event:
+        return Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=json.dumps(payload, ensure_ascii=False))]),
+            actions=EventActions(state_delta={self.output_key: payload}),
+        )
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        yield self._payload_event(ctx, await self._call_tool(ctx))
+
+
+class GatedToolAgent(ToolExecutorAgent):
+    """Calls a local tool first and defers to ``fallback`` only when the payload is ambiguous.
+
+    A payload with ``ambiguous: true`` is dropped and ``fallback`` (an LlmAgent writing
+    the same ``output_key``) runs instead; any other payload is stored as returned.
+    """
+
+    fallback: BaseAgent
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        payload = await self._call_tool(ctx)
+        if isinstance(payload, dict) and payload.get("ambiguous"):
+            async for event in self.fallback.run_async(ctx):
+                yield event
+            return
+        yield self._payload_event(ctx, payload)
+
+
+async def run_concurrently(
+    ctx: InvocationContext,
+    agents: Sequence[BaseAgent],
+    *,
+    timeout: Optional[float] = None,
+) -> AsyncGenerator[tuple[Optional[BaseAgent], Optional[Event]], None]:
+    """Run agents side by side on isolated branches, yielding ``(agent, event)`` as events arrive.
+
+    Each producer waits until its event has been yielded (and so appended to the
+    session) before continuing, mirroring how ``ParallelAgent`` merges branches. With
+    ``timeout``, each agent also runs under that deadline; agents still running when it
+    passes are cancelled and yielded once more as ``(agent, None)``. If an agent raises,
+    the others are cancelled and the exception propagates. Cancelled agents are always
+    awaited before this generator finishes.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+    finished: set[str] = set()
+
+    async def drive(agent: BaseAgent) -> None:
+        branch = f"{ctx.branch}.{agent.name}" if ctx.branch else agent.name
+        scope = deadline.scope(timeout) if timeout is not None else contextlib.nullcontext()
+        error: Optional[Exception] = None
+        try:
+            with scope:
+                async for event in agent.run_async(ctx.model_copy(update={"branch": branch})):
+                    resume = asyncio.Event()
+                    await queue.put((agent, event, resume))
+                    await resume.wait()
+        except Exception as exc:
+            error = exc
+        finally:
+            # A failure is queued in place of ``done`` so the consumer can stop at once.
+            await queue.put((agent, done if error is None else error, None))
+
+    expires_at = time.monotonic() + timeout if timeout is not None else None
+    tasks = [asyncio.create_task(drive(agent)) for agent in agents]
+    try:
+        while len(finished) < len(tasks):
+            wait = None if expires_at is None else max(0.0, expires_at - time.monotonic())
+            try:
+                agent, event, resume = await asyncio.wait_for(queue.get(), timeout=wait)
+            except asyncio.TimeoutError:
+                break
+            if isinstance(event, Exception):
+                raise event
+            if event is done:
+                finished.add(agent.name)
+                continue
+            yield agent, event
+            resume.set()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    for agent in agents:
+        if agent.name not in finished:
+            yield agent, None
+
+
+class DeadlineParallelAgent(BaseAgent):
+    """Fan-out that runs its workers in parallel until the request deadline, minus a reserve.
+
+    ``reserve_s`` seconds of the request budget are kept back for the merge and final
+    report. Workers still running when the fan-out's share runs out are cancelled and
+    their ``output_key`` is set to a ``status: "timeout"`` payload, so the merge still
+    produces a partial verdict. Without a request deadline it behaves like
+    ``ParallelAgent``.
+    """
+
+    reserve_s: float = DEADLINE_REPORT_RESERVE_S
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        left = deadline.remaining()
+        timeout = None if left is None else max(0.0, left - self.reserve_s)
+        timed_out: dict[str, Any] = {}
+        async for agent, event in run_concurrently(ctx, self.sub_agents, timeout=timeout):
+            if event is not None:
+                yield event
+                continue
+            output_key = getattr(agent, "output_key", None)
+            if output_key:
+                timed_out[output_key] = timeout_signal(agent.name)
+        if timed_out:
+            yield Event(
+                invocation_id=ctx.invocation_id,
+                author=self.name,
+                branch=ctx.branch,
+                actions=EventActions(state_delta=timed_out),
+            )
@@ -2,25 +2,44 @@
 
 from __future__ import annotations
 
-from google.adk.agents.parallel_agent import ParallelAgent
-from google.adk.agents.sequential_agent import SequentialAgent
-
-from .merge import fact_merge_agent
-from .sub_agents import fact_perplexity_agent, fact_primary_agent
-
-
-fact_parallel_agent = ParallelAgent(
-    name="FactParallelFanout",
-    description="Runs specialized fact-check workers in parallel.",
-    sub_agents=[fact_primary_agent, fact_perplexity_agent],
-)
+import sys
+from typing import Optional
 
+from google.adk.agents.sequential_agent import SequentialAgent
 
-fact_check_agent = SequentialAgent(
-    name="FactCheckAgent",
-    description="Performs deep fact verification.",
-    sub_agents=[fact_parallel_agent, fact_merge_agent],
+from ...config import MODEL
+from ..common import DeadlineParallelAgent, lazy_defaults
+from .merge import create_fact_merge_agent
+from .sub_agents import create_fact_perplexity_agent, create_fact_primary_agent
+
+
+def create_fact_check_agent(
+    model: str = MODEL, *, merge_mode: Optional[str] = None, worker_mode: Optional[str] = None
+) -> SequentialAgent:
+    """Constructs the Fact verification SequentialAgent with parallel fan-out."""
+
+    fanout = DeadlineParallelAgent(
+        name="FactParallelFanout",
+        description="Runs specialized fact-check workers in parallel.",
+        sub_agents=[
+            create_fact_primary_agent(model=model, mode=worker_mode),
+            create_fact_perplexity_agent(model=model, mode=worker_mode),
+        ],
+    )
+
+    return SequentialAgent(
+        name="FactCheckAgent",
+        description="Performs deep fact verification.",
+        sub_agents=[fanout, create_fact_merge_agent(model=model, mode=merge_mode)],
+    )
+
+
+# Default-model instances, built on first access.
+__getattr__ = lazy_defaults(
+    globals(),
+    fact_check_agent=create_fact_check_agent,
+    fact_parallel_agent=lambda: sys.modules[__name__].fact_check_agent.sub_agents[0],
 )
 
 
-__all__ = ["fact_check_agent", "fact_parallel_agent"]
+__all__ = ["create_fact_check_agent", "fact_check_agent", "fact_parallel_agent"]
@@ -2,35 +2,124 @@
 
 from __future__ import annotations
 
+from typing import Any, Mapping, Optional
+
+from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.llm_agent import LlmAgent
 
-from ...config import MODEL, STATE_KEYS
-
-
-fact_merge_agent = LlmAgent(
-    name="FactMergeAgent",
-    model=MODEL,
-    description="Consolidates fact-check signals into a unified assessment.",
-    instruction=(
-        f"You receive structured JSON from state[{STATE_KEYS.FACT_PRIMARY!r}] and state[{STATE_KEYS.FACT_PERPLEXITY!r}]. "
-        "Treat them as authoritative evidence packets—quote their status fields when relevant and never overwrite a reported "
-        "error.\n\n"
-        "Output Markdown:\n"
-        "## Fact Verification\n"
-        "- consensus_verdict: <true|false|mixed|unknown>\n"
-        "- confidence_range: <min-max>\n"
-        "- registry_alignment: <matches|conflicts|no_data>\n\n"
-        "### Key Evidence\n"
-        "* <Combine fact_primary + index references>\n"
-        "* <Highlight gaps if any>\n\n"
-    "### References\n"
-    "1. <Organization — URL>\n"
-    "2. <Title — URL>\n"
-    "Maintain consistent numbering with the upstream references arrays. Keep the full URL strings from the input JSON"
-    " so downstream reports link to the exact ruling page."
-    ),
-    output_key=STATE_KEYS.FACT_SUMMARY,
+from ...config import FACT_MERGE_MODE, MODEL, STATE_KEYS
+from ..common import (
+    MERGE_MODE_DETERMINISTIC,
+    DeterministicMergeAgent,
+    confidence_range,
+    consensus_verdict,
+    dedupe_sources,
+    describe_failure,
+    format_sources,
+    lazy_defaults,
+    normalize_verdict,
+    parse_signal,
 )
 
 
-__all__ = ["fact_merge_agent"]
+def _registry_alignment(primary: Mapping[str, Any], research: Mapping[str, Any]) -> str:
+    registry = normalize_verdict(primary.get("verdict")) if primary.get("status") == "ok" else None
+    web = normalize_verdict(research.get("verdict")) if research.get("status", "ok") == "ok" else None
+    if not registry or not web:
+        return "no_data"
+    return "matches" if registry == web else "conflicts"
+
+
+def render_fact_summary(state: Mapping[str, Any]) -> str:
+    """Render the Fact Verification Markdown directly from the worker signals."""
+    primary = parse_signal(state.get(STATE_KEYS.FACT_PRIMARY))
+    research = parse_signal(state.get(STATE_KEYS.FACT_PERPLEXITY))
+    signals = (primary, research)
+
+    gaps = [
+        line
+        for line in (
+            describe_failure("FactPrimaryAgent", primary),
+            describe_failure("FactPerplexityAgent", research),
+        )
+        if line
+    ]
+
+    evidence: list[str] = []
+    if primary.get("status") == "ok":
+        evidence.append(f"FactPrimaryAgent (verdict {primary.get('verdict', 'inconclusive')}): {primary.get('notes', '')}".rstrip(": "))
+        for check in (primary.get("fact_checks") or [])[:3]:
+            evidence.append(
+                f"{check.get('organization', 'Unknown')} rated it {check.get('rating', 'Unrated')}: {check.get('snippet', '')}".rstrip(": ")
+            )
+    if research and research.get("status", "ok") == "ok":
+        reasoning = [item for item in research.get("reasoning") or [] if isinstance(item, str) and item]
+        detail = "; ".join(reasoning[:3]) or research.get("notes", "")
+        evidence.append(f"FactPerplexityAgent (verdict {research.get('verdict', 'unknown')}): {detail}".rstrip(": "))
+    evidence.extend(f"Gap — {gap}" for gap in gaps)
+
+    references = dedupe_sources(
+        [
+            *({"organization": check.get("organization"), "url": check.get("url")} for check in primary.get("fact_checks") or []),
+            *(research.get("references") or []),
+        ]
+    )
+
+    lines = [
+        "## Fact Verification",
+        f"- consensus_verdict: {consensus_verdict(signals)}",
+        f"- confidence_range: {confidence_range(signals)}",
+        f"- registry_alignment: {_registry_alignment(primary, research)}",
+        "",
+        "### Key Evidence",
+        *(f"* {item}" for item in evidence or ["No worker returned usable evidence."]),
+        "",
+        "### References",
+        *format_sources(references),
+    ]
+    return "\n".join(lines)
+
+
+def create_fact_merge_agent(model: str = MODEL, *, mode: Optional[str] = None) -> BaseAgent:
+    """Build the Fact merge agent; ``mode='deterministic'`` skips the Gemini call."""
+    if (mode or FACT_MERGE_MODE) == MERGE_MODE_DETERMINISTIC:
+        return DeterministicMergeAgent(
+            name="FactMergeAgent",
+            description="Consolidates fact-check signals into a unified assessment.",
+            output_key=STATE_KEYS.FACT_SUMMARY,
+            renderer=render_fact_summary,
+        )
+    return _create_llm_fact_merge_agent(model)
+
+
+def _create_llm_fact_merge_agent(model: str) -> LlmAgent:
+    return LlmAgent(
+        name="FactMergeAgent",
+        model=model,
+        description="Consolidates fact-check signals into a unified assessment.",
+        instruction=(
+            f"You receive structured JSON from state[{STATE_KEYS.FACT_PRIMARY!r}] and state[{STATE_KEYS.FACT_PERPLEXITY!r}]. "
+            "Treat them as authoritative evidence packets—quote their status fields when relevant and never overwrite a reported "
+            "error.\n\n"
+            "Output Markdown:\n"
+            "## Fact Verification\n"
+            "- consensus_verdict: <true|false|mixed|unknown>\n"
+            "- confidence_range: <min-max>\n"
+            "- registry_alignment: <matches|conflicts|no_data>\n\n"
+            "### Key Evidence\n"
+            "* <Combine fact_primary + index references>\n"
+            "* <Highlight gaps if any>\n\n"
+        "### References\n"
+        "1. <Organization — URL>\n"
+        "2. <Title — URL>\n"
+        "Maintain consistent numbering with the upstream references arrays. Keep the full URL strings from the input JSON"
+        " so downstream reports link to the exact ruling page."
+        ),
+        output_key=STATE_KEYS.FACT_SUMMARY,
+    )
+
+
+__getattr__ = lazy_defaults(globals(), fact_merge_agent=create_fact_merge_agent)
+
+
+__all__ = ["create_fact_merge_agent", "fact_merge_agent", "render_fact_summary"]
@@ -1,9 +1,19 @@
 """Exports for Fact verification sub-agent definitions."""
 
-from .fact_primary import fact_primary_agent
-from .fact_perplexity import fact_perplexity_agent
+from ...common import lazy_defaults
+from . import fact_perplexity, fact_primary
+from .fact_primary import create_fact_primary_agent
+from .fact_perplexity import create_fact_perplexity_agent
+
+__getattr__ = lazy_defaults(
+    globals(),
+    fact_primary_agent=lambda: fact_primary.fact_primary_agent,
+    fact_perplexity_agent=lambda: fact_perplexity.fact_perplexity_agent,
+)
 
 __all__ = [
+    "create_fact_primary_agent",
     "fact_primary_agent",
+    "create_fact_perplexity_agent",
     "fact_perplexity_agent",
 ]
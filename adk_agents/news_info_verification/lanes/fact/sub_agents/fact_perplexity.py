@@ -2,24 +2,41 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
+from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.llm_agent import LlmAgent
 
-from ....config import MODEL, STATE_KEYS
+from ....config import MODEL, STATE_KEYS, WORKER_MODE
 from ....tools import FACT_PERPLEXITY_TOOL
+from ...common import WORKER_MODE_DIRECT, ToolExecutorAgent, lazy_defaults
+
+
+def create_fact_perplexity_agent(model: str = MODEL, *, mode: Optional[str] = None) -> BaseAgent:
+    """Build the FactPerplexityAgent; ``mode='direct'`` calls the tool without a Gemini round trip."""
+    if (mode or WORKER_MODE) == WORKER_MODE_DIRECT:
+        return ToolExecutorAgent(
+            name="FactPerplexityAgent",
+            description="Performs reasoning over open web evidence to validate factual statements.",
+            tool=FACT_PERPLEXITY_TOOL,
+            output_key=STATE_KEYS.FACT_PERPLEXITY,
+        )
+
+    return LlmAgent(
+        name="FactPerplexityAgent",
+        model=model,
+        description="Performs reasoning over open web evidence to validate factual statements.",
+        instruction=(
+            f"Call the {FACT_PERPLEXITY_TOOL.name} tool using the current claim text. The tool returns JSON with status, "
+            "verdict, confidence, reasoning, and references. Relay the payload exactly without rewriting or summarizing it "
+            "yourself."
+        ),
+        tools=[FACT_PERPLEXITY_TOOL],
+        output_key=STATE_KEYS.FACT_PERPLEXITY,
+    )
 
 
-fact_perplexity_agent = LlmAgent(
-    name="FactPerplexityAgent",
-    model=MODEL,
-    description="Performs reasoning over open web evidence to validate factual statements.",
-    instruction=(
-        "Call the research_fact_with_perplexity tool using the current claim text. The tool returns JSON with status, "
-        "verdict, confidence, reasoning, and references. Relay the payload exactly without rewriting or summarizing it "
-        "yourself."
-    ),
-    tools=[FACT_PERPLEXITY_TOOL],
-    output_key=STATE_KEYS.FACT_PERPLEXITY,
-)
+__getattr__ = lazy_defaults(globals(), fact_perplexity_agent=create_fact_perplexity_agent)
 
 
-__all__ = ["fact_perplexity_agent"]
+__all__ = ["create_fact_perplexity_agent", "fact_perplexity_agent"]
@@ -2,24 +2,41 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
+from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.llm_agent import LlmAgent
 
-from ....config import MODEL, STATE_KEYS
+from ....config import MODEL, STATE_KEYS, WORKER_MODE
 from ....tools import FACT_CHECK_TOOL
+from ...common import WORKER_MODE_DIRECT, ToolExecutorAgent, lazy_defaults
+
+
+def create_fact_primary_agent(model: str = MODEL, *, mode: Optional[str] = None) -> BaseAgent:
+    """Build the FactPrimaryAgent; ``mode='direct'`` calls the tool without a Gemini round trip."""
+    if (mode or WORKER_MODE) == WORKER_MODE_DIRECT:
+        return ToolExecutorAgent(
+            name="FactPrimaryAgent",
+            description="Queries official fact-check APIs for claim verdicts.",
+            tool=FACT_CHECK_TOOL,
+            output_key=STATE_KEYS.FACT_PRIMARY,
+        )
+
+    return LlmAgent(
+        name="FactPrimaryAgent",
+        model=model,
+        description="Queries official fact-check APIs for claim verdicts.",
+        instruction=(
+            f"Call the {FACT_CHECK_TOOL.name} tool with the current claim text to retrieve authoritative reviews."
+            " When the tool responds, return its JSON payload without modification."
+            " Do not synthesize new ratings or notes."
+        ),
+        tools=[FACT_CHECK_TOOL],
+        output_key=STATE_KEYS.FACT_PRIMARY,
+    )
 
 
-fact_primary_agent = LlmAgent(
-    name="FactPrimaryAgent",
-    model=MODEL,
-    description="Queries official fact-check APIs for claim verdicts.",
-    instruction=(
-        "Call the lookup_fact_checks tool with the current claim text to retrieve authoritative reviews."
-        " When the tool responds, return its JSON payload without modification."
-        " Do not synthesize new ratings or notes."
-    ),
-    tools=[FACT_CHECK_TOOL],
-    output_key=STATE_KEYS.FACT_PRIMARY,
-)
+__getattr__ = lazy_defaults(globals(), fact_primary_agent=create_fact_primary_agent)
 
 
-__all__ = ["fact_primary_agent"]
+__all__ = ["create_fact_primary_agent", "fact_primary_agent"]
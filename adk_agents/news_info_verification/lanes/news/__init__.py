@@ -2,29 +2,49 @@
 
 from __future__ import annotations
 
-from google.adk.agents.parallel_agent import ParallelAgent
+import sys
+from typing import Optional
+
 from google.adk.agents.sequential_agent import SequentialAgent
 
+from ...config import MODEL
+from ..common import DeadlineParallelAgent, lazy_defaults
+from .merge import create_news_merge_agent
 from .sub_agents import (
-    news_api_agent,
-    news_fact_checker_agent,
-    news_perplexity_agent,
-)
-from .merge import news_merge_agent
-
-
-news_parallel_agent = ParallelAgent(
-    name="NewsParallelFanout",
-    description="Runs the news verification workers in parallel.",
-    sub_agents=[news_api_agent, news_fact_checker_agent, news_perplexity_agent],
+    create_news_api_agent,
+    create_news_fact_checker_agent,
+    create_news_perplexity_agent,
 )
 
 
-news_check_agent = SequentialAgent(
-    name="NewsCheckAgent",
-    description="Validates breaking news claims across multiple data sources.",
-    sub_agents=[news_parallel_agent, news_merge_agent],
+def create_news_check_agent(
+    model: str = MODEL, *, merge_mode: Optional[str] = None, worker_mode: Optional[str] = None
+) -> SequentialAgent:
+    """Constructs the News verification SequentialAgent with parallel fan-out."""
+
+    fanout = DeadlineParallelAgent(
+        name="NewsParallelFanout",
+        description="Runs the news verification workers in parallel.",
+        sub_agents=[
+            create_news_api_agent(model=model, mode=worker_mode),
+            create_news_fact_checker_agent(model=model, mode=worker_mode),
+            create_news_perplexity_agent(model=model, mode=worker_mode),
+        ],
+    )
+
+    return SequentialAgent(
+        name="NewsCheckAgent",
+        description="Validates breaking news claims across multiple data sources.",
+        sub_agents=[fanout, create_news_merge_agent(model=model, mode=merge_mode)],
+    )
+
+
+# Default-model instances, built on first access.
+__getattr__ = lazy_defaults(
+    globals(),
+    news_check_agent=create_news_check_agent,
+    news_parallel_agent=lambda: sys.modules[__name__].news_check_agent.sub_agents[0],
 )
 
 
-__all__ = ["news_check_agent", "news_parallel_agent"]
+__all__ = ["create_news_check_agent", "news_check_agent", "news_parallel_agent"]
@@ -2,35 +2,118 @@
 
 from __future__ import annotations
 
+from typing import Any, Mapping, Optional
+
+from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.llm_agent import LlmAgent
 
-from ...config import MODEL, STATE_KEYS
-
-
-news_merge_agent = LlmAgent(
-    name="NewsMergeAgent",
-    model=MODEL,
-    description="Synthesizes the news verification outputs into a single verdict.",
-    instruction=(
-        f"You consolidate the outputs in state[{STATE_KEYS.NEWS_API!r}], state[{STATE_KEYS.NEWS_FACT!r}], and "
-        f"state[{STATE_KEYS.NEWS_PERPLEXITY!r}]. Trust the JSON fields they expose—do not invent new evidence. If any agent "
-        "returned status 'error', surface it verbatim before drawing conclusions.\n\n"
-    "Produce Markdown with this template so downstream agents can parse it reliably:\n"
-    "## News Verification\n"
-    "- consensus_verdict: <true|false|mixed|unknown>\n"
-    "- confidence_range: <min-max>\n"
-    "- noted_gaps: <short sentence or 'none'>\n\n"
-    "### Supporting Points\n"
-    "* <Point 1 citing agent and source>\n"
-    "* <Point 2>\n\n"
-    "### Sources\n"
-    "1. <Outlet — URL>\n"
-    "2. <Outlet — URL>\n"
-    "Deduplicate sources and call out disagreements explicitly. Preserve the exact URL strings provided by upstream"
-    " agents—do not shorten them to domains or rewrite them."
-    ),
-    output_key=STATE_KEYS.NEWS_SUMMARY,
+from ...config import MODEL, NEWS_MERGE_MODE, STATE_KEYS
+from ..common import (
+    MERGE_MODE_DETERMINISTIC,
+    DeterministicMergeAgent,
+    confidence_range,
+    consensus_verdict,
+    dedupe_sources,
+    describe_failure,
+    format_sources,
+    lazy_defaults,
+    parse_signal,
 )
 
 
-__all__ = ["news_merge_agent"]
+def render_news_summary(state: Mapping[str, Any]) -> str:
+    """Render the News Verification Markdown directly from the worker signals."""
+    api = parse_signal(state.get(STATE_KEYS.NEWS_API))
+    fact = parse_signal(state.get(STATE_KEYS.NEWS_FACT))
+    research = parse_signal(state.get(STATE_KEYS.NEWS_PERPLEXITY))
+    signals = (api, fact, research)
+
+    gaps = [
+        line
+        for line in (
+            describe_failure("NewsApiAgent", api, note_field="synopsis"),
+            describe_failure("NewsFactCheckerAgent", fact),
+            describe_failure("NewsPerplexityAgent", research),
+        )
+        if line
+    ]
+
+    points = [f"Error surfaced — {gap}" for gap in gaps if ": status error" in gap]
+    if api.get("status") == "ok" and api.get("synopsis"):
+        points.append(f"NewsApiAgent (GNews): {api['synopsis']}")
+    if fact.get("status") == "ok":
+        points.append(f"NewsFactCheckerAgent (verdict {fact.get('verdict', 'inconclusive')}): {fact.get('notes', '')}".rstrip(": "))
+    if research.get("status") == "ok":
+        bullets = [bullet for bullet in research.get("reasoning_bullets") or [] if isinstance(bullet, str) and bullet]
+        detail = "; ".join(bullets[:3]) or research.get("notes", "")
+        points.append(f"NewsPerplexityAgent (verdict {research.get('verdict', 'unknown')}): {detail}".rstrip(": "))
+    verdicts = {signal.get("verdict") for signal in (fact, research) if signal.get("status") == "ok"}
+    if {"true", "false"} <= verdicts:
+        points.append("Disagreement: the fact-check registry and web research reached opposite verdicts.")
+
+    sources = dedupe_sources(
+        [
+            *(api.get("supporting_sources") or []),
+            *({"organization": entry.get("organization"), "url": entry.get("url")} for entry in fact.get("fact_checks") or []),
+            *(research.get("citations") or []),
+        ]
+    )
+
+    lines = [
+        "## News Verification",
+        f"- consensus_verdict: {consensus_verdict(signals)}",
+        f"- confidence_range: {confidence_range(signals)}",
+        f"- noted_gaps: {'; '.join(gaps) if gaps else 'none'}",
+        "",
+        "### Supporting Points",
+        *(f"* {point}" for point in points or ["No worker returned usable evidence."]),
+        "",
+        "### Sources",
+        *format_sources(sources),
+    ]
+    return "\n".join(lines)
+
+
+def create_news_merge_agent(model: str = MODEL, *, mode: Optional[str] = None) -> BaseAgent:
+    """Build the News merge agent; ``mode='deterministic'`` skips the Gemini call."""
+    if (mode or NEWS_MERGE_MODE) == MERGE_MODE_DETERMINISTIC:
+        return DeterministicMergeAgent(
+            name="NewsMergeAgent",
+            description="Synthesizes the news verification outputs into a single verdict.",
+            output_key=STATE_KEYS.NEWS_SUMMARY,
+            renderer=render_news_summary,
+        )
+    return _create_llm_news_merge_agent(model)
+
+
+def _create_llm_news_merge_agent(model: str) -> LlmAgent:
+    return LlmAgent(
+        name="NewsMergeAgent",
+        model=model,
+        description="Synthesizes the news verification outputs into a single verdict.",
+        instruction=(
+            f"You consolidate the outputs in state[{STATE_KEYS.NEWS_API!r}], state[{STATE_KEYS.NEWS_FACT!r}], and "
+            f"state[{STATE_KEYS.NEWS_PERPLEXITY!r}]. Trust the JSON fields they expose—do not invent new evidence. If any agent "
+            "returned status 'error', surface it verbatim before drawing conclusions.\n\n"
+        "Produce Markdown with this template so downstream agents can parse it reliably:\n"
+        "## News Verification\n"
+        "- consensus_verdict: <true|false|mixed|unknown>\n"
+        "- confidence_range: <min-max>\n"
+        "- noted_gaps: <short sentence or 'none'>\n\n"
+        "### Supporting Points\n"
+        "* <Point 1 citing agent and source>\n"
+        "* <Point 2>\n\n"
+        "### Sources\n"
+        "1. <Outlet — URL>\n"
+        "2. <Outlet — URL>\n"
+        "Deduplicate sources and call out disagreements explicitly. Preserve the exact URL strings provided by upstream"
+        " agents—do not shorten them to domains or rewrite them."
+        ),
+        output_key=STATE_KEYS.NEWS_SUMMARY,
+    )
+
+
+__getattr__ = lazy_defaults(globals(), news_merge_agent=create_news_merge_agent)
+
+
+__all__ = ["create_news_merge_agent", "news_merge_agent", "render_news_summary"]
@@ -1,11 +1,23 @@
 """Exports for News lane sub-agent definitions."""
 
-from .news_api import news_api_agent
-from .news_fact_checker import news_fact_checker_agent
-from .news_perplexity import news_perplexity_agent
+from ...common import lazy_defaults
+from . import news_api, news_fact_checker, news_perplexity
+from .news_api import create_news_api_agent
+from .news_fact_checker import create_news_fact_checker_agent
+from .news_perplexity import create_news_perplexity_agent
+
+__getattr__ = lazy_defaults(
+    globals(),
+    news_api_agent=lambda: news_api.news_api_agent,
+    news_fact_checker_agent=lambda: news_fact_checker.news_fact_checker_agent,
+    news_perplexity_agent=lambda: news_perplexity.news_perplexity_agent,
+)
 
 __all__ = [
+    "create_news_api_agent",
     "news_api_agent",
+    "create_news_fact_checker_agent",
     "news_fact_checker_agent",
+    "create_news_perplexity_agent",
     "news_perplexity_agent",
 ]
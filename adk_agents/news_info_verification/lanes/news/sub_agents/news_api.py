@@ -2,24 +2,41 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
+from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.llm_agent import LlmAgent
 
-from ....config import MODEL, STATE_KEYS
+from ....config import MODEL, STATE_KEYS, WORKER_MODE
 from ....tools import NEWS_API_TOOL
+from ...common import WORKER_MODE_DIRECT, ToolExecutorAgent, lazy_defaults
+
+
+def create_news_api_agent(model: str = MODEL, *, mode: Optional[str] = None) -> BaseAgent:
+    """Build the NewsApiAgent; ``mode='direct'`` calls the tool without a Gemini round trip."""
+    if (mode or WORKER_MODE) == WORKER_MODE_DIRECT:
+        return ToolExecutorAgent(
+            name="NewsApiAgent",
+            description="Queries licensed news APIs and normalizes evidence for the claim.",
+            tool=NEWS_API_TOOL,
+            output_key=STATE_KEYS.NEWS_API,
+        )
+
+    return LlmAgent(
+        name="NewsApiAgent",
+        model=model,
+        description="Queries licensed news APIs and normalizes evidence for the claim.",
+        instruction=(
+            f"Call the {NEWS_API_TOOL.name} tool with the current claim text to gather coverage."
+            " When the tool returns, respond with its JSON payload verbatim."
+            " Do not fabricate fields or alter confidence values."
+        ),
+        tools=[NEWS_API_TOOL],
+        output_key=STATE_KEYS.NEWS_API,
+    )
 
 
-news_api_agent = LlmAgent(
-    name="NewsApiAgent",
-    model=MODEL,
-    description="Queries licensed news APIs and normalizes evidence for the claim.",
-    instruction=(
-        "Call the fetch_news_evidence tool with the current claim text to gather coverage."
-        " When the tool returns, respond with its JSON payload verbatim."
-        " Do not fabricate fields or alter confidence values."
-    ),
-    tools=[NEWS_API_TOOL],
-    output_key=STATE_KEYS.NEWS_API,
-)
+__getattr__ = lazy_defaults(globals(), news_api_agent=create_news_api_agent)
 
 
-__all__ = ["news_api_agent"]
+__all__ = ["create_news_api_agent", "news_api_agent"]
@@ -2,24 +2,41 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
+from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.llm_agent import LlmAgent
 
-from ....config import MODEL, STATE_KEYS
+from ....config import MODEL, STATE_KEYS, WORKER_MODE
 from ....tools import FACT_CHECK_TOOL
+from ...common import WORKER_MODE_DIRECT, ToolExecutorAgent, lazy_defaults
+
+
+def create_news_fact_checker_agent(model: str = MODEL, *, mode: Optional[str] = None) -> BaseAgent:
+    """Build the NewsFactCheckerAgent; ``mode='direct'`` calls the tool without a Gemini round trip."""
+    if (mode or WORKER_MODE) == WORKER_MODE_DIRECT:
+        return ToolExecutorAgent(
+            name="NewsFactCheckerAgent",
+            description="Leverages official fact-checking feeds for news-specific validation.",
+            tool=FACT_CHECK_TOOL,
+            output_key=STATE_KEYS.NEWS_FACT,
+        )
+
+    return LlmAgent(
+        name="NewsFactCheckerAgent",
+        model=model,
+        description="Leverages official fact-checking feeds for news-specific validation.",
+        instruction=(
+            f"Call the {FACT_CHECK_TOOL.name} tool with the current claim text to retrieve official verdicts relevant to the news"
+            " claim. Do not guess at the schema; rely entirely on the JSON payload returned by the tool. After receiving the"
+            " tool result, echo that JSON verbatim, without additional commentary or formatting."
+        ),
+        tools=[FACT_CHECK_TOOL],
+        output_key=STATE_KEYS.NEWS_FACT,
+    )
 
 
-news_fact_checker_agent = LlmAgent(
-    name="NewsFactCheckerAgent",
-    model=MODEL,
-    description="Leverages official fact-checking feeds for news-specific validation.",
-    instruction=(
-        "Call the lookup_fact_checks tool with the current claim text to retrieve official verdicts relevant to the news"
-        " claim. Do not guess at the schema; rely entirely on the JSON payload returned by the tool. After receiving the"
-        " tool result, echo that JSON verbatim, without additional commentary or formatting."
-    ),
-    tools=[FACT_CHECK_TOOL],
-    output_key=STATE_KEYS.NEWS_FACT,
-)
+__getattr__ = lazy_defaults(globals(), news_fact_checker_agent=create_news_fact_checker_agent)
 
 
-__all__ = ["news_fact_checker_agent"]
+__all__ = ["create_news_fact_checker_agent", "news_fact_checker_agent"]
@@ -2,24 +2,41 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
+from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.llm_agent import LlmAgent
 
-from ....config import MODEL, STATE_KEYS
+from ....config import MODEL, STATE_KEYS, WORKER_MODE
 from ....tools import NEWS_PERPLEXITY_TOOL
+from ...common import WORKER_MODE_DIRECT, ToolExecutorAgent, lazy_defaults
+
+
+def create_news_perplexity_agent(model: str = MODEL, *, mode: Optional[str] = None) -> BaseAgent:
+    """Build the NewsPerplexityAgent; ``mode='direct'`` calls the tool without a Gemini round trip."""
+    if (mode or WORKER_MODE) == WORKER_MODE_DIRECT:
+        return ToolExecutorAgent(
+            name="NewsPerplexityAgent",
+            description="Performs retrieval-augmented reasoning to spot inconsistencies in news content.",
+            tool=NEWS_PERPLEXITY_TOOL,
+            output_key=STATE_KEYS.NEWS_PERPLEXITY,
+        )
+
+    return LlmAgent(
+        name="NewsPerplexityAgent",
+        model=model,
+        description="Performs retrieval-augmented reasoning to spot inconsistencies in news content.",
+        instruction=(
+            f"Call the {NEWS_PERPLEXITY_TOOL.name} tool with the current claim text. The tool returns structured JSON "
+            "containing status, verdict, confidence, reasoning_bullets, and citations. Do not alter the payload—return it "
+            "verbatim as your final response."
+        ),
+        tools=[NEWS_PERPLEXITY_TOOL],
+        output_key=STATE_KEYS.NEWS_PERPLEXITY,
+    )
 
 
-news_perplexity_agent = LlmAgent(
-    name="NewsPerplexityAgent",
-    model=MODEL,
-    description="Performs retrieval-augmented reasoning to spot inconsistencies in news content.",
-    instruction=(
-        "Call the research_news_with_perplexity tool with the current claim text. The tool returns structured JSON "
-        "containing status, verdict, confidence, reasoning_bullets, and citations. Do not alter the payload—return it "
-        "verbatim as your final response."
-    ),
-    tools=[NEWS_PERPLEXITY_TOOL],
-    output_key=STATE_KEYS.NEWS_PERPLEXITY,
-)
+__getattr__ = lazy_defaults(globals(), news_perplexity_agent=create_news_perplexity_agent)
 
 
-__all__ = ["news_perplexity_agent"]
+__all__ = ["create_news_perplexity_agent", "news_perplexity_agent"]
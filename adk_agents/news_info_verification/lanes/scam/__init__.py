@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from google.adk.agents.parallel_agent import ParallelAgent
+from typing import Optional
+
 from google.adk.agents.sequential_agent import SequentialAgent
 
 from ...config import MODEL
+from ..common import DeadlineParallelAgent
 from .merge import create_scam_merge_agent
 from .sub_agents import (
     create_scam_link_agent,
@@ -14,20 +16,26 @@ from .sub_agents import (
 )
 
 
-def create_scam_check_agent(model: str = MODEL) -> SequentialAgent:
+def create_scam_check_agent(
+    model: str = MODEL,
+    *,
+    merge_mode: Optional[str] = None,
+    worker_mode: Optional[str] = None,
+    sentiment_mode: Optional[str] = None,
+) -> SequentialAgent:
     """Constructs the Scam detection SequentialAgent with parallel fan-out."""
 
-    scam_sentiment = create_scam_sentiment_agent(model=model)
-    scam_perplexity = create_scam_perplexity_agent(model=model)
-    scam_link = create_scam_link_agent(model=model)
+    scam_sentiment = create_scam_sentiment_agent(model=model, mode=sentiment_mode)
+    scam_perplexity = create_scam_perplexity_agent(model=model, mode=worker_mode)
+    scam_link = create_scam_link_agent(model=model, mode=worker_mode)
 
-    fanout = ParallelAgent(
+    fanout = DeadlineParallelAgent(
         name="ScamParallelFanout",
         description="Runs scam detection agents in parallel.",
         sub_agents=[scam_sentiment, scam_perplexity, scam_link],
     )
 
-    merger = create_scam_merge_agent(model=model)
+    merger = create_scam_merge_agent(model=model, mode=merge_mode)
 
     return SequentialAgent(
         name="ScamCheckAgent",
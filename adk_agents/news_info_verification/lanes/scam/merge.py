@@ -2,13 +2,125 @@
 
 from __future__ import annotations
 
+from typing import Any, Mapping, Optional
+
+from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.llm_agent import LlmAgent
 
-from ...config import MODEL, STATE_KEYS
+from ...config import MODEL, SCAM_MERGE_MODE, STATE_KEYS
+from ..common import (
+    MERGE_MODE_DETERMINISTIC,
+    DeterministicMergeAgent,
+    confidence_range,
+    dedupe_sources,
+    describe_failure,
+    format_sources,
+    parse_signal,
+)
+
+_RISK_ORDER = {"low": 0, "medium": 1, "high": 2}
+_PATTERN_VERDICT_RISK = {"likely_scam": "high", "benign": "low"}
+_DEFAULT_ACTIONS = {
+    "high": "Do not click the links, reply, or send money; report the message to the impersonated organisation.",
+    "medium": "Verify the sender through an official channel before acting on the message.",
+    "low": "No immediate action needed; stay alert for follow-up requests for money or credentials.",
+    "unknown": "Re-run the scam checks or review the message manually before acting on it.",
+}
+
+
+def _signal_risks(
+    sentiment: Mapping[str, Any], patterns: Mapping[str, Any], links: Mapping[str, Any]
+) -> list[str]:
+    risks: list[str] = []
+    if sentiment.get("status") == "ok" and sentiment.get("risk_level") in _RISK_ORDER:
+        risks.append(sentiment["risk_level"])
+    if patterns.get("status") == "ok" and patterns.get("verdict") in _PATTERN_VERDICT_RISK:
+        risks.append(_PATTERN_VERDICT_RISK[patterns["verdict"]])
+    if links.get("status") == "ok" and links.get("risk_level") in _RISK_ORDER:
+        risks.append(links["risk_level"])
+    return risks
+
+
+def render_scam_summary(state: Mapping[str, Any]) -> str:
+    """Render the Scam Risk Summary Markdown directly from the worker signals."""
+    sentiment = parse_signal(state.get(STATE_KEYS.SCAM_SENTIMENT))
+    patterns = parse_signal(state.get(STATE_KEYS.SCAM_PERPLEXITY))
+    links = parse_signal(state.get(STATE_KEYS.SCAM_LINK))
+
+    errors = [
+        line
+        for line in (
+            describe_failure("ScamSentimentAgent", sentiment),
+            describe_failure("ScamPerplexityAgent", patterns),
+            describe_failure("MaliciousLinkAgent", links, note_field="recommended_action"),
+        )
+        if line and ": status error" in line
+    ]
+
+    risks = _signal_risks(sentiment, patterns, links)
+    overall = max(risks, key=_RISK_ORDER.__getitem__) if risks else "unknown"
+
+    triggers = [f"Error surfaced — {line}" for line in errors]
+    for trigger in sentiment.get("triggers") or []:
+        if isinstance(trigger, Mapping):
+            triggers.append(f"Sentiment ({trigger.get('pattern', 'cue')}): \"{trigger.get('excerpt', '')}\"")
+    for match in patterns.get("pattern_matches") or []:
+        if isinstance(match, Mapping):
+            triggers.append(f"Pattern match ({match.get('pattern', 'unspecified')}): {match.get('explanation', '')}".rstrip(": "))
+    for flagged in links.get("flagged_urls") or []:
+        if isinstance(flagged, Mapping):
+            triggers.append(f"Link audit: {flagged.get('url', '')} — {flagged.get('issue', '')}")
+
+    actions = list(dict.fromkeys(
+        action
+        for action in (
+            links.get("recommended_action") if links.get("status") == "ok" else None,
+            _DEFAULT_ACTIONS[overall],
+        )
+        if action
+    ))
+
+    sources = dedupe_sources(
+        [
+            *(
+                {"title": f"VirusTotal link audit ({flagged.get('issue', 'no issue reported')})", "url": flagged.get("url")}
+                for flagged in links.get("flagged_urls") or []
+                if isinstance(flagged, Mapping)
+            ),
+            *(patterns.get("supporting_citations") or []),
+        ]
+    )
+
+    lines = [
+        "## Scam Risk Summary",
+        f"- overall_risk: {overall}",
+        f"- confidence_range: {confidence_range((sentiment, patterns, links))}",
+        f"- immediate_action_required: {'yes' if overall == 'high' else 'no'}",
+        "",
+        "### Triggers",
+        *(f"* {trigger}" for trigger in triggers or ["No scam triggers were reported."]),
+        "",
+        "### Recommended Actions",
+        *(f"* {action}" for action in actions),
+        "",
+        "### Sources",
+        *format_sources(sources, empty="n/a"),
+    ]
+    return "\n".join(lines)
+
 
+def create_scam_merge_agent(model: str = MODEL, *, mode: Optional[str] = None) -> BaseAgent:
+    """Builds the agent that consolidates scam detection signals.
 
-def create_scam_merge_agent(model: str = MODEL) -> LlmAgent:
-    """Builds the agent that consolidates scam detection signals."""
+    ``mode='deterministic'`` renders the summary in Python without a Gemini call.
+    """
+    if (mode or SCAM_MERGE_MODE) == MERGE_MODE_DETERMINISTIC:
+        return DeterministicMergeAgent(
+            name="ScamMergeAgent",
+            description="Combines scam signals into a consolidated risk assessment.",
+            output_key=STATE_KEYS.SCAM_SUMMARY,
+            renderer=render_scam_summary,
+        )
 
     return LlmAgent(
         name="ScamMergeAgent",
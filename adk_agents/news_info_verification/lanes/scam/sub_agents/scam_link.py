@@ -2,21 +2,33 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
+from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.llm_agent import LlmAgent
 
-from ....config import MODEL, STATE_KEYS
+from ....config import MODEL, STATE_KEYS, WORKER_MODE
 from ....tools import VIRUSTOTAL_URL_TOOL
+from ...common import WORKER_MODE_DIRECT, ToolExecutorAgent
+
 
+def create_scam_link_agent(model: str = MODEL, *, mode: Optional[str] = None) -> BaseAgent:
+    """Build the VirusTotal link checker; ``mode='direct'`` calls the tool without a Gemini relay."""
 
-def create_scam_link_agent(model: str = MODEL) -> LlmAgent:
-    """Build the agent that evaluates links for malicious signals via VirusTotal."""
+    if (mode or WORKER_MODE) == WORKER_MODE_DIRECT:
+        return ToolExecutorAgent(
+            name="MaliciousLinkAgent",
+            description="Evaluates links for malicious or suspicious signals using VirusTotal.",
+            tool=VIRUSTOTAL_URL_TOOL,
+            output_key=STATE_KEYS.SCAM_LINK,
+        )
 
     return LlmAgent(
         name="MaliciousLinkAgent",
         model=model,
         description="Evaluates links for malicious or suspicious signals using VirusTotal.",
         instruction=(
-            "Use the scan_urls_with_virustotal tool to inspect URLs mentioned in the claim."
+            f"Use the {VIRUSTOTAL_URL_TOOL.name} tool to inspect URLs mentioned in the claim."
             " Return the JSON object produced by the tool without altering any fields."
         ),
         tools=[VIRUSTOTAL_URL_TOOL],
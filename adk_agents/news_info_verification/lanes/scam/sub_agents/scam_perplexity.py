@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
+from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.llm_agent import LlmAgent
 
-from ....config import MODEL, STATE_KEYS
+from ....config import MODEL, STATE_KEYS, WORKER_MODE
 from ....tools import SCAM_PERPLEXITY_TOOL
+from ...common import WORKER_MODE_DIRECT, ToolExecutorAgent
+
 
+def create_scam_perplexity_agent(model: str = MODEL, *, mode: Optional[str] = None) -> BaseAgent:
+    """Builds the scam pattern researcher; ``mode='direct'`` calls the tool without a Gemini relay."""
 
-def create_scam_perplexity_agent(model: str = MODEL) -> LlmAgent:
-    """Builds the agent that compares the content against known scam patterns."""
+    if (mode or WORKER_MODE) == WORKER_MODE_DIRECT:
+        return ToolExecutorAgent(
+            name="ScamPerplexityAgent",
+            description="Compares the content against known scam patterns via retrieval reasoning.",
+            tool=SCAM_PERPLEXITY_TOOL,
+            output_key=STATE_KEYS.SCAM_PERPLEXITY,
+        )
 
     return LlmAgent(
         name="ScamPerplexityAgent",
@@ -18,7 +30,7 @@ def create_scam_perplexity_agent(model: str = MODEL) -> LlmAgent:
         instruction=(
             "Compare the claim and any embedded instructions/links against known scam signatures (advance-fee fraud, "
             "account suspension phishing, lottery scams, malware delivery). Emphasize similarities and differences explicitly.\n\n"
-            "Call the research_scam_with_perplexity tool with the current message text. The tool performs retrieval against "
+            f"Call the {SCAM_PERPLEXITY_TOOL.name} tool with the current message text. The tool performs retrieval against "
             "scam pattern documentation and returns JSON including status, verdict, confidence, pattern_matches, and "
             "supporting_citations. Return the JSON payload exactly as received."
         ),
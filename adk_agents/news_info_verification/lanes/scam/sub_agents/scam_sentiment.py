@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
+from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.llm_agent import LlmAgent
 
-from ....config import MODEL, STATE_KEYS
+from ....config import MODEL, SCAM_SENTIMENT_MODE, STATE_KEYS
+from ....tools import SCAM_LANGUAGE_TOOL
+from ...common import SENTIMENT_MODE_GATE, SENTIMENT_MODE_LOCAL, GatedToolAgent, ToolExecutorAgent
 
+_DESCRIPTION = "Detects persuasive or manipulative sentiment indicating scams."
 
-def create_scam_sentiment_agent(model: str = MODEL) -> LlmAgent:
-    """Builds the agent that detects manipulative sentiment."""
 
+def _create_llm_sentiment_agent(model: str, name: str) -> LlmAgent:
     return LlmAgent(
-        name="ScamSentimentAgent",
+        name=name,
         model=model,
-        description="Detects persuasive or manipulative sentiment indicating scams.",
+        description=_DESCRIPTION,
         instruction=(
             "Evaluate tone cues that typically indicate scams: urgency, fear appeals, authority impersonation, reward framing. "
             "Cite the exact phrases you relied upon.\n\n"
@@ -22,3 +27,32 @@ def create_scam_sentiment_agent(model: str = MODEL) -> LlmAgent:
         ),
         output_key=STATE_KEYS.SCAM_SENTIMENT,
     )
+
+
+def create_scam_sentiment_agent(model: str = MODEL, *, mode: Optional[str] = None) -> BaseAgent:
+    """Builds the agent that detects manipulative sentiment.
+
+    ``mode`` (default ``SCAM_SENTIMENT_MODE``): ``"llm"`` asks Gemini, ``"local"`` uses the
+    lexicon scorer alone, and ``"gate"`` uses the scorer and asks Gemini only when its
+    score is ambiguous.
+    """
+
+    selected = mode or SCAM_SENTIMENT_MODE
+    if selected == SENTIMENT_MODE_LOCAL:
+        return ToolExecutorAgent(
+            name="ScamSentimentAgent",
+            description=_DESCRIPTION,
+            tool=SCAM_LANGUAGE_TOOL,
+            output_key=STATE_KEYS.SCAM_SENTIMENT,
+        )
+    if selected == SENTIMENT_MODE_GATE:
+        fallback = _create_llm_sentiment_agent(model, "ScamSentimentLlmAgent")
+        return GatedToolAgent(
+            name="ScamSentimentAgent",
+            description=_DESCRIPTION,
+            tool=SCAM_LANGUAGE_TOOL,
+            output_key=STATE_KEYS.SCAM_SENTIMENT,
+            fallback=fallback,
+            sub_agents=[fallback],
+        )
+    return _create_llm_sentiment_agent(model, "ScamSentimentAgent")
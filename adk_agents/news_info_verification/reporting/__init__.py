@@ -1,5 +1,5 @@
 """Reporting utilities for the news & information verification workflow."""
 
-from .final_report import create_final_report_agent
+from .final_report import create_final_report_agent, render_final_report
 
-__all__ = ["create_final_report_agent"]
+__all__ = ["create_final_report_agent", "render_final_report"]
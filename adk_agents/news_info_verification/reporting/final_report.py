@@ -2,13 +2,243 @@
 
 from __future__ import annotations
 
+import re
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Mapping, Optional, Sequence
+
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
 from google.adk.agents.llm_agent import LlmAgent
+from google.adk.events import Event, EventActions
+from google.genai import types
+
+from ..config import FINAL_REPORT_MODE, MODEL, STATE_KEYS
+from ..lanes.common import consensus_verdict, dedupe_sources, split_source
+from ..services import context_helpers
+
+REPORT_MODE_TEMPLATE = "template"
+
+_LANES = (
+    ("news", "News", STATE_KEYS.NEWS_SUMMARY, "consensus_verdict"),
+    ("fact", "Fact", STATE_KEYS.FACT_SUMMARY, "consensus_verdict"),
+    ("scam", "Scam", STATE_KEYS.SCAM_SUMMARY, "overall_risk"),
+)
+_FIELD_PATTERN = re.compile(r"^-\s*([a-z_]+):\s*(.*)$")
+_NUMBERED_PATTERN = re.compile(r"^\d+\.\s+(.*)$")
+_RANGE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(?:-\s*(\d+(?:\.\d+)?))?")
+_OUTCOME_PHRASES = {
+    "true": "appears accurate",
+    "false": "appears false",
+    "mixed": "has mixed support",
+    "unknown": "could not be verified",
+}
+
+
+@dataclass
+class LaneSummary:
+    """Fields, bullets and sources parsed from a lane's Markdown summary."""
+
+    fields: dict[str, str] = field(default_factory=dict)
+    bullets: list[str] = field(default_factory=list)
+    sources: list[tuple[str, str]] = field(default_factory=list)
+
+
+def parse_lane_summary(markdown: str) -> LaneSummary:
+    """Parse the fixed lane Markdown template produced by the merge agents."""
+    summary = LaneSummary()
+    section = ""
+    for raw in (markdown or "").splitlines():
+        line = raw.strip()
+        if line.startswith("#"):
+            section = line.lstrip("#").strip().lower()
+            continue
+        field_match = _FIELD_PATTERN.match(line)
+        if field_match and not section.startswith(("sources", "references")):
+            summary.fields[field_match.group(1)] = field_match.group(2).strip()
+            continue
+        numbered = _NUMBERED_PATTERN.match(line)
+        if numbered and section.startswith(("sources", "references")):
+            label, url = split_source(numbered.group(1))
+            if label.lower() not in {"none", "n/a"} or url:
+                summary.sources.append((label, url))
+            continue
+        if line.startswith(("* ", "- ")):
+            summary.bullets.append(line[2:].strip())
+    return summary
+
+
+def _confidence_bounds(value: str) -> Optional[tuple[float, float]]:
+    match = _RANGE_PATTERN.search(value or "")
+    if not match:
+        return None
+    low = float(match.group(1))
+    high = float(match.group(2)) if match.group(2) else low
+    return min(low, high), max(low, high)
+
+
+def _combined_confidence(lanes: list[LaneSummary]) -> str:
+    bounds = [b for lane in lanes for b in (_confidence_bounds(lane.fields.get("confidence_range", "")),) if b]
+    bounds = [b for b in bounds if b != (0.0, 0.0)]
+    if not bounds:
+        return "unknown"
+    return f"{min(b[0] for b in bounds):.2f}-{max(b[1] for b in bounds):.2f}"
+
+
+def _paraphrase(claim: str) -> str:
+    words = claim.split()
+    if not words:
+        return "unspecified"
+    if len(words) <= 40:
+        return " ".join(words)
+    return " ".join(words[:40]) + " ..."
+
+
+def _lane_section(title: str, lane: Optional[LaneSummary], verdict_field: str, empty_source: str) -> list[str]:
+    if lane is None:
+        return [
+            f"## {title}",
+            "- summary: not requested",
+            "- confidence: not requested",
+            "- sources:",
+            f"  * {empty_source}",
+        ]
+    verdict = lane.fields.get(verdict_field, "unknown")
+    points = "; ".join(bullet.rstrip(".") for bullet in lane.bullets[:2])
+    summary = f"{verdict_field}={verdict}" + (f"; {points}" if points else "")
+    sources = [f"  * {label} - {url}" if url and label != url else f"  * {url or label}" for label, url in lane.sources]
+    return [
+        f"## {title}",
+        f"- summary: {summary}",
+        f"- confidence: {lane.fields.get('confidence_range', 'unknown')}",
+        "- sources:",
+        *(sources or [f"  * {empty_source}"]),
+    ]
+
+
+def render_final_report(
+    state: Mapping[str, Any],
+    *,
+    claim: str = "",
+    submitted_at: Optional[str] = None,
+    extra_risks: Sequence[str] = (),
+) -> str:
+    """Fill the ``# Verification Report`` skeleton from the lane summaries in state.
+
+    ``extra_risks`` are appended to the final verdict's residual risks.
+    """
+    skip_reasons = state.get(STATE_KEYS.LANE_SKIP_REASONS) or {}
+    parsed: dict[str, Optional[LaneSummary]] = {}
+    for key, _, state_key, _ in _LANES:
+        markdown = state.get(state_key)
+        parsed[key] = parse_lane_summary(markdown) if isinstance(markdown, str) and markdown.strip() else None
+
+    executed = [key for key, *_ in _LANES if parsed[key] is not None]
+    skipped = [f"{key} ({skip_reasons.get(key) or 'not requested'})" for key, *_ in _LANES if parsed[key] is None]
+    executed_lanes = [parsed[key] for key in executed]
+
+    verdict_signals = [
+        {"status": "ok", "verdict": parsed[key].fields.get("consensus_verdict")}
+        for key in ("news", "fact")
+        if parsed[key] is not None
+    ]
+    outcome = consensus_verdict(verdict_signals)
+    confidence = _combined_confidence(executed_lanes)
+    scam = parsed["scam"]
+    scam_risk = scam.fields.get("overall_risk", "unknown") if scam else None
+
+    residual: list[str] = []
+    news, fact = parsed["news"], parsed["fact"]
+    if news and news.fields.get("noted_gaps", "none").lower() not in {"none", ""}:
+        residual.append(f"news: {news.fields['noted_gaps']}")
+    if fact and fact.fields.get("registry_alignment") in {"conflicts", "no_data"}:
+        residual.append(f"fact: registry_alignment {fact.fields['registry_alignment']}")
+    if scam_risk in {"medium", "high", "unknown"}:
+        residual.append(f"scam: overall_risk {scam_risk}")
+    residual.extend(f"skipped lane: {entry}" for entry in skipped if executed)
+    residual.extend(extra_risks)
+
+    sentences = []
+    if executed:
+        sentences.append(
+            f"The claim {_OUTCOME_PHRASES[outcome]} (outcome {outcome}, confidence {confidence})"
+            + (f" and scam screening rated it {scam_risk} risk." if scam_risk else ".")
+        )
+        key_point = next((lane.bullets[0] for lane in executed_lanes if lane.bullets), "")
+        if key_point:
+            sentences.append(f"Key evidence: {key_point.rstrip('.')}.")
+        sentences.append(f"Skipped lanes: {', '.join(skipped)}." if skipped else "All lanes executed.")
+    else:
+        sentences.append("No verification lane produced a summary, so the claim remains unverified.")
+
+    all_sources = dedupe_sources(
+        {"title": label, "url": url} if url else label
+        for lane in executed_lanes
+        for label, url in lane.sources
+    )
+
+    lines = [
+        "# Verification Report",
+        "## Report Summary",
+        " ".join(sentences),
+        "",
+        "## Claim Overview",
+        f"- paraphrase: {_paraphrase(claim)}",
+        f"- submission_time: {submitted_at or 'unspecified'}",
+        "",
+        *_lane_section("News Assessment", news, "consensus_verdict", "none"),
+        "",
+        *_lane_section("Fact Assessment", fact, "consensus_verdict", "none"),
+        "",
+        *_lane_section("Scam Risk", scam, "overall_risk", "n/a"),
+        "",
+        "## Lane Execution",
+        f"- executed: {', '.join(executed) or 'none'}",
+        f"- skipped: {', '.join(skipped) or 'none'}",
+        "",
+        "## Final Verdict",
+        f"- outcome: {outcome}",
+        f"- confidence: {confidence}",
+        "- residual_risks:",
+        *(f"  * {risk}" for risk in residual or ["none"]),
+        "",
+        "## Sources",
+        *(
+            f"{idx}. {label} — {url}" if url and label != url else f"{idx}. {url or label}"
+            for idx, (label, url) in enumerate(all_sources, start=1)
+        ),
+    ]
+    if not all_sources:
+        lines.append("1. none")
+    return "\n".join(lines)
+
+
+class TemplateReportAgent(BaseAgent):
+    """FinalProcessingAgent variant that fills the report skeleton without calling Gemini."""
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state
+        claim = state.get(STATE_KEYS.CLAIM_TEXT) or context_helpers.extract_latest_user_text(ctx)
+        submitted_at = state.get(STATE_KEYS.SUBMITTED_AT) or context_helpers.latest_user_timestamp(ctx)
+        report = render_final_report(state, claim=claim, submitted_at=submitted_at)
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=report)]),
+            actions=EventActions(state_delta={STATE_KEYS.FINAL_REPORT: report}),
+        )
 
-from ..config import MODEL, STATE_KEYS
 
+def create_final_report_agent(model: str = MODEL, *, mode: Optional[str] = None) -> BaseAgent:
+    """Construct the final processing agent that assembles the full report.
 
-def create_final_report_agent(model: str = MODEL) -> LlmAgent:
-    """Construct the final processing agent that assembles the full report."""
+    ``mode='template'`` returns the deterministic renderer instead of the LLM editor.
+    """
+    if (mode or FINAL_REPORT_MODE) == REPORT_MODE_TEMPLATE:
+        return TemplateReportAgent(
+            name="FinalProcessingAgent",
+            description="Generates the final consolidated verification report.",
+        )
 
     return LlmAgent(
         name="FinalProcessingAgent",
@@ -19,7 +249,9 @@ def create_final_report_agent(model: str = MODEL) -> LlmAgent:
             f"state[{STATE_KEYS.FACT_SUMMARY!r}], and state[{STATE_KEYS.SCAM_SUMMARY!r}]. Maintain their intent, especially "
             "when a lane surfaced an error or data gap.\n\n"
             "Bundle outputs by reusing their Markdown whenever possible. If a lane summary string is empty or missing, treat the"
-            " lane as 'not requested'. Extract existing bullet lists and sources verbatim rather than rephrasing; this keeps"
+            " lane as 'not requested'. Lanes skipped by the pre-classifier carry a reason in"
+            f" state[{STATE_KEYS.LANE_SKIP_REASONS!r}] ({{{STATE_KEYS.LANE_SKIP_REASONS}?}}); cite it alongside 'not requested'."
+            " Extract existing bullet lists and sources verbatim rather than rephrasing; this keeps"
             " traceability back to the tool output. Use those lane verdicts and confidences to populate the Report Summary"
             " section so it accurately reflects downstream content.\n\n"
             "Your response MUST match the exact Markdown skeleton below. Do not add extra prose before or after any heading."
@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import asyncio
+import functools
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Optional
 
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.invocation_context import InvocationContext
 from google.adk.agents.llm_agent import LlmAgent
+from google.adk.events import Event, EventActions
 from google.adk.tools.agent_tool import AgentTool
+from google.genai import types
 
 
 class NormalizedAgentTool(AgentTool):
@@ -50,27 +60,411 @@ class NormalizedAgentTool(AgentTool):
         return await super().run_async(args=normalized, tool_context=tool_context)
 
 
+class LaneAgentTool(NormalizedAgentTool):
+    """AgentTool wrapper that answers from a lane result reused from the verdict store."""
+
+    def __init__(self, agent: BaseAgent, lane: str) -> None:
+        super().__init__(agent)
+        self.lane = lane
+
+    async def run_async(self, *, args: Any, tool_context) -> Any:  # type: ignore[override]
+        reused = tool_context.state.get(STATE_KEYS.REUSED_LANES) or {}
+        if self.lane in reused:
+            summary_key, _ = verdict_store.LANE_KEYS[self.lane]
+            summary = tool_context.state.get(summary_key)
+            if summary:
+                return summary
+        return await super().run_async(args=args, tool_context=tool_context)
+
+
 class FinalReportAgentTool(NormalizedAgentTool):
     """AgentTool wrapper that avoids recomputing the final report."""
 
+    @staticmethod
+    def _capture_request_context(tool_context) -> None:
+        """Record the claim and submission time; the report sub-session only sees 'summarize'."""
+        state = tool_context.state
+        if not state.get(STATE_KEYS.CLAIM_TEXT):
+            claim = context_helpers.extract_latest_user_text(tool_context)
+            if claim:
+                state[STATE_KEYS.CLAIM_TEXT] = claim
+        if not state.get(STATE_KEYS.SUBMITTED_AT):
+            submitted_at = context_helpers.latest_user_timestamp(tool_context)
+            if submitted_at:
+                state[STATE_KEYS.SUBMITTED_AT] = submitted_at
+
     async def run_async(self, *, args: Any, tool_context) -> Any:  # type: ignore[override]
         existing = tool_context.session.state.get(STATE_KEYS.FINAL_REPORT)
         if existing:
             return existing
+        self._capture_request_context(tool_context)
         return await super().run_async(args=args, tool_context=tool_context)
 
-from .config import MODEL, STATE_KEYS
-from .lanes import fact_check_agent, news_check_agent, create_scam_check_agent
+from .config import (
+    MODEL,
+    NEAR_DUPLICATE_ENABLED,
+    ROUTER_PRECLASSIFIER_ENABLED,
+    ROUTER_PRECLASSIFIER_THRESHOLD,
+    STATE_KEYS,
+    STREAM_LANE_RESULTS,
+    STREAM_WORKER_SIGNALS,
+    VERDICT_STORE_ENABLED,
+    VERIFICATION_DEADLINE_S,
+)
+from .lanes import create_fact_check_agent, create_news_check_agent, create_scam_check_agent
+from .lanes.common import parse_signal, run_concurrently
 from .reporting import create_final_report_agent
+from .services import context_helpers, deadline, intent_classifier, near_duplicates, verdict_store
+from .telemetry import add_agent_callbacks, instrument_agents
+
+_LANE_STATE_KEYS = (
+    STATE_KEYS.NEWS_SUMMARY,
+    STATE_KEYS.FACT_SUMMARY,
+    STATE_KEYS.SCAM_SUMMARY,
+    STATE_KEYS.FINAL_REPORT,
+)
+# What a completed verification hands on to near-duplicates of its claim.
+_REUSED_STATE_KEYS = (*_LANE_STATE_KEYS, STATE_KEYS.LANE_SKIP_REASONS)
+
+# Incremental results emitted in streaming mode: state key -> (kind, lane).
+STREAM_WORKER_SIGNAL = "worker_signal"
+STREAM_LANE_SUMMARY = "lane_summary"
+STREAM_FINAL_REPORT = "final_report"
+_STREAMED_LANE_KEYS = {
+    STATE_KEYS.NEWS_SUMMARY: (STREAM_LANE_SUMMARY, "news"),
+    STATE_KEYS.FACT_SUMMARY: (STREAM_LANE_SUMMARY, "fact"),
+    STATE_KEYS.SCAM_SUMMARY: (STREAM_LANE_SUMMARY, "scam"),
+    STATE_KEYS.FINAL_REPORT: (STREAM_FINAL_REPORT, None),
+}
+_STREAMED_WORKER_KEYS = {
+    STATE_KEYS.NEWS_API: (STREAM_WORKER_SIGNAL, "news"),
+    STATE_KEYS.NEWS_FACT: (STREAM_WORKER_SIGNAL, "news"),
+    STATE_KEYS.NEWS_PERPLEXITY: (STREAM_WORKER_SIGNAL, "news"),
+    STATE_KEYS.FACT_PRIMARY: (STREAM_WORKER_SIGNAL, "fact"),
+    STATE_KEYS.FACT_PERPLEXITY: (STREAM_WORKER_SIGNAL, "fact"),
+    STATE_KEYS.SCAM_SENTIMENT: (STREAM_WORKER_SIGNAL, "scam"),
+    STATE_KEYS.SCAM_PERPLEXITY: (STREAM_WORKER_SIGNAL, "scam"),
+    STATE_KEYS.SCAM_LINK: (STREAM_WORKER_SIGNAL, "scam"),
+}
+
+
+def _start_deadline(callback_context: CallbackContext) -> None:
+    """Start the request deadline; ``state["deadline_s"]`` overrides the configured one."""
+    seconds = callback_context.state.get(STATE_KEYS.DEADLINE_S)
+    deadline.start(float(seconds) if seconds is not None else VERIFICATION_DEADLINE_S)
+
+
+def _clear_deadline(callback_context: CallbackContext) -> None:
+    deadline.start(None)
+
+
+def _skip_reasons(reasons: Optional[Dict[str, str]], reported: Any) -> Optional[Dict[str, str]]:
+    """Skip reasons minus the lanes whose results are reported anyway (e.g. reused from the store)."""
+    remaining = {lane: reason for lane, reason in (reasons or {}).items() if lane not in reported}
+    return remaining or None
+
+
+class PreClassifiedRoutingAgent(BaseAgent):
+    """Routes unambiguous submissions locally and defers everything else to the LLM router.
+
+    With ``stream`` enabled, each lane summary (and, with ``stream_worker_signals``, each
+    worker signal) is re-emitted as a partial event as soon as it lands in state, ahead
+    of the final report. Partial events reach the caller but are not stored in the
+    session. Their ``custom_metadata`` carries ``stream`` (the kind), ``lane`` and
+    ``state_key``. Streaming is only early on the pre-classified path. On the LLM router
+    path, lane results reach state through the lane tools' function responses, and ADK
+    merges the responses of parallel tool calls into one event, so lanes called
+    together surface together once the slowest of them returns.
+
+    With ``reuse_near_duplicates``, a claim that closely matches one verified earlier in
+    this process, with the same names, numbers, URLs and negations, is answered from that
+    verification's lane summaries and report (see :mod:`.services.near_duplicates`),
+    whatever ``NEAR_DUPLICATE_ENABLED`` says. The report gains a ``## Reused Verdict``
+    section naming the matched claim and similarity, which is also stored under
+    ``state["near_duplicate"]``. Index lookups and inserts run in a worker thread.
+
+    With ``reuse_stored_verdicts``, lane results persisted by :mod:`.services.verdict_store`
+    (whatever ``VERDICT_STORE_ENABLED`` says) for the same claim are loaded into state
+    while fresh, and only the stale lanes run. The store is read and written in a worker
+    thread, off the event loop.
+    When every lane behind a stored report is fresh, the report is returned as is.
+    ``state["reused_lanes"]`` maps each reused lane to when it was verified.
+    """
+
+    llm_router: BaseAgent
+    lane_agents: Dict[str, BaseAgent]
+    report_agent: BaseAgent
+    threshold: float = ROUTER_PRECLASSIFIER_THRESHOLD
+    preclassify: bool = True
+    stream: bool = False
+    stream_worker_signals: bool = False
+    reuse_near_duplicates: bool = False
+    reuse_stored_verdicts: bool = False
+
+    def _stream_updates(self, ctx: InvocationContext, event: Event, emitted: set[str]) -> list[Event]:
+        delta = event.actions.state_delta if event.actions else None
+        if not delta:
+            return []
+        watched = {**_STREAMED_LANE_KEYS, **(_STREAMED_WORKER_KEYS if self.stream_worker_signals else {})}
+        updates = []
+        for key, value in delta.items():
+            if key not in watched or key in emitted or not value:
+                continue
+            emitted.add(key)
+            kind, lane = watched[key]
+            text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+            updates.append(
+                Event(
+                    invocation_id=ctx.invocation_id,
+                    author=self.name,
+                    branch=ctx.branch,
+                    partial=True,
+                    content=types.Content(role="model", parts=[types.Part(text=text)]),
+                    custom_metadata={"stream": kind, "lane": lane, "state_key": key},
+                )
+            )
+        return updates
+
+    async def _relay(
+        self, ctx: InvocationContext, events: AsyncIterator[Event], emitted: set[str]
+    ) -> AsyncGenerator[Event, None]:
+        async for event in events:
+            yield event
+            if self.stream:
+                for update in self._stream_updates(ctx, event, emitted):
+                    yield update
+
+    def _reused_verdict(self, ctx: InvocationContext, claim: str, match: near_duplicates.NearDuplicate) -> Event:
+        verified_at = datetime.fromtimestamp(match.verified_at, tz=timezone.utc).isoformat(timespec="seconds")
+        reuse = {"claim": match.claim, "score": match.score, "verified_at": verified_at}
+        report = "\n".join(
+            [
+                str(match.state.get(STATE_KEYS.FINAL_REPORT) or "").rstrip(),
+                "",
+                "## Reused Verdict",
+                f"- matched_claim: {' '.join(match.claim.split())}",
+                f"- similarity: {match.score:.2f}",
+                f"- verified_at: {verified_at}",
+            ]
+        )
+        request_state: Dict[str, Any] = {key: match.state.get(key) for key in _REUSED_STATE_KEYS}
+        request_state.update(
+            {
+                STATE_KEYS.CLAIM_TEXT: claim,
+                STATE_KEYS.SUBMITTED_AT: context_helpers.latest_user_timestamp(ctx),
+                STATE_KEYS.NEAR_DUPLICATE: reuse,
+                STATE_KEYS.REUSED_LANES: None,
+                STATE_KEYS.FINAL_REPORT: report,
+            }
+        )
+        return Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=report)]),
+            actions=EventActions(state_delta=request_state),
+            custom_metadata={"near_duplicate": reuse},
+        )
+
+    async def _remember(self, ctx: InvocationContext, claim: str) -> None:
+        state = ctx.session.state
+        report = state.get(STATE_KEYS.FINAL_REPORT)
+        # A report cut short by the deadline is not worth handing on.
+        if not isinstance(report, str) or not report.strip() or deadline.expired():
+            return
+        if self.reuse_near_duplicates:
+            reused = {key: state.get(key) for key in _REUSED_STATE_KEYS}
+            await asyncio.to_thread(near_duplicates.remember, claim, reused, enabled=True)
+        if self.reuse_stored_verdicts:
+            await asyncio.to_thread(self._store_verdicts, dict(state), claim, report)
+
+    @staticmethod
+    def _store_verdicts(state: Dict[str, Any], claim: str, report: str) -> None:
+        now = time.time()
+        reused = state.get(STATE_KEYS.REUSED_LANES) or {}
+        completed = tuple(lane for lane, (summary_key, _) in verdict_store.LANE_KEYS.items() if state.get(summary_key))
+        verdicts = {}
+        for lane in completed:
+            if lane in reused:
+                continue
+            summary_key, signal_keys = verdict_store.LANE_KEYS[lane]
+            signals = {key: state.get(key) for key in signal_keys if state.get(key) is not None}
+            parsed = {key: parse_signal(value) for key, value in signals.items()}
+            verdicts[lane] = verdict_store.LaneVerdict(
+                lane, state[summary_key], signals, now, verdict_store.lane_expiry(lane, parsed, now)
+            )
+        verdict_store.record(
+            near_duplicates.fingerprint(claim),
+            claim,
+            verdicts,
+            report=report,
+            skip_reasons=state.get(STATE_KEYS.LANE_SKIP_REASONS),
+            report_lanes=completed,
+            enabled=True,
+        )
+
+    @staticmethod
+    def _stored_state(fresh: Dict[str, verdict_store.LaneVerdict]) -> Dict[str, Any]:
+        stored: Dict[str, Any] = {}
+        for lane, verdict in fresh.items():
+            summary_key, signal_keys = verdict_store.LANE_KEYS[lane]
+            stored[summary_key] = verdict.summary
+            stored.update({key: verdict.signals.get(key) for key in signal_keys})
+        if fresh:
+            stored[STATE_KEYS.REUSED_LANES] = {
+                lane: datetime.fromtimestamp(verdict.verified_at, tz=timezone.utc).isoformat(timespec="seconds")
+                for lane, verdict in fresh.items()
+            }
+        return stored
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        claim = context_helpers.extract_latest_user_text(ctx)
+        match = None
+        if self.reuse_near_duplicates:
+            match = await asyncio.to_thread(near_duplicates.find, claim, enabled=True)
+        if match is not None:
+            yield self._reused_verdict(ctx, claim, match)
+            return
+
+        fresh, stored_report = {}, None
+        if self.reuse_stored_verdicts and claim:
+            fresh, stored_report = await asyncio.to_thread(
+                verdict_store.lookup, near_duplicates.fingerprint(claim), enabled=True
+            )
+        if stored_report is not None and stored_report.lanes and set(stored_report.lanes) <= set(fresh):
+            yield Event(
+                invocation_id=ctx.invocation_id,
+                author=self.name,
+                branch=ctx.branch,
+                content=types.Content(role="model", parts=[types.Part(text=stored_report.report)]),
+                actions=EventActions(
+                    state_delta={
+                        **{key: None for key in _LANE_STATE_KEYS},
+                        **self._stored_state({lane: fresh[lane] for lane in stored_report.lanes}),
+                        STATE_KEYS.CLAIM_TEXT: claim,
+                        STATE_KEYS.SUBMITTED_AT: context_helpers.latest_user_timestamp(ctx),
+                        STATE_KEYS.LANE_SKIP_REASONS: _skip_reasons(stored_report.skip_reasons, stored_report.lanes),
+                        STATE_KEYS.NEAR_DUPLICATE: None,
+                        STATE_KEYS.FINAL_REPORT: stored_report.report,
+                    }
+                ),
+            )
+            return
+
+        decision = intent_classifier.classify_intents(claim)
+        confident = self.preclassify and decision.is_confident(self.threshold)
+
+        # Clear the previous turn's lane output so the report only reflects this claim.
+        request_state: Dict[str, Any] = {key: None for key in _LANE_STATE_KEYS}
+        request_state.update(
+            {
+                STATE_KEYS.CLAIM_TEXT: claim,
+                STATE_KEYS.SUBMITTED_AT: context_helpers.latest_user_timestamp(ctx),
+                STATE_KEYS.LANE_SKIP_REASONS: _skip_reasons(decision.skip_reasons, fresh) if confident else None,
+                STATE_KEYS.NEAR_DUPLICATE: None,
+                STATE_KEYS.REUSED_LANES: None,
+            }
+        )
+        request_state.update(self._stored_state(fresh))
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta=request_state),
+        )
+
+        emitted: set[str] = set()
+        if not confident:
+            async for event in self._relay(ctx, self.llm_router.run_async(ctx), emitted):
+                yield event
+            await self._remember(ctx, claim)
+            return
+
+        lanes = [self.lane_agents[lane] for lane in decision.lanes if lane in self.lane_agents and lane not in fresh]
+        lane_events = (event async for _, event in run_concurrently(ctx, lanes) if event is not None)
+        async for event in self._relay(ctx, lane_events, emitted):
+            yield event
+
+        async for event in self._relay(ctx, self.report_agent.run_async(ctx), emitted):
+            yield event
+        await self._remember(ctx, claim)
 
 
 def create_content_routing_agent(model: str = MODEL) -> LlmAgent:
     """Create the top-level content routing agent."""
 
-    news_lane_agent = news_check_agent
-    fact_lane_agent = fact_check_agent
-    scam_lane_agent = create_scam_check_agent(model=model)
+    return _create_llm_router(model, _create_lane_agents(model), create_final_report_agent(model=model))
+
+
+def create_root_agent(
+    model: str = MODEL,
+    *,
+    preclassify: Optional[bool] = None,
+    stream: Optional[bool] = None,
+    reuse_near_duplicates: Optional[bool] = None,
+    reuse_stored_verdicts: Optional[bool] = None,
+) -> BaseAgent:
+    """Create the entry agent: the LLM router, fronted by the local pre-classifier when enabled.
+
+    Each request runs under a deadline (``VERIFICATION_DEADLINE_S``) that bounds the lane
+    fan-outs and every outbound HTTP call. With ``stream`` (default
+    ``STREAM_LANE_RESULTS``), lane summaries are emitted as they complete; see
+    :class:`PreClassifiedRoutingAgent`. With ``reuse_near_duplicates`` (default
+    ``NEAR_DUPLICATE_ENABLED``), near-duplicates of an already verified claim reuse its
+    report instead of running the lanes again. With ``reuse_stored_verdicts`` (default
+    ``VERDICT_STORE_ENABLED``), lane results persisted for the same claim are reused while
+    fresh, so only stale lanes rerun.
+    """
+
+    enabled = ROUTER_PRECLASSIFIER_ENABLED if preclassify is None else preclassify
+    streaming = STREAM_LANE_RESULTS if stream is None else stream
+    reuse = NEAR_DUPLICATE_ENABLED if reuse_near_duplicates is None else reuse_near_duplicates
+    stored = VERDICT_STORE_ENABLED if reuse_stored_verdicts is None else reuse_stored_verdicts
+    lanes = _create_lane_agents(model)
     final_report_agent = create_final_report_agent(model=model)
+    llm_router = _create_llm_router(model, lanes, final_report_agent)
+    root: BaseAgent = llm_router
+    if enabled or streaming or reuse or stored:
+        root = PreClassifiedRoutingAgent(
+            name="ContentTriageAgent",
+            description="Pre-classifies submissions locally before falling back to the LLM router.",
+            sub_agents=[llm_router],
+            llm_router=llm_router,
+            lane_agents=lanes,
+            report_agent=final_report_agent,
+            preclassify=enabled,
+            stream=streaming,
+            stream_worker_signals=streaming and STREAM_WORKER_SIGNALS,
+            reuse_near_duplicates=reuse,
+            reuse_stored_verdicts=stored,
+        )
+    add_agent_callbacks(root, _start_deadline, _clear_deadline)
+    instrument_agents(root, lanes={**lanes, "report": final_report_agent})
+    return root
+
+
+@functools.lru_cache(maxsize=None)
+def get_root_agent(model: str = MODEL) -> BaseAgent:
+    """The shared default root agent for ``model``, built on first use.
+
+    Call :func:`create_root_agent` for a private tree, e.g. to attach callbacks or a
+    different model client.
+    """
+    return create_root_agent(model)
+
+
+def _create_lane_agents(model: str) -> Dict[str, BaseAgent]:
+    return {
+        "news": create_news_check_agent(model=model),
+        "fact": create_fact_check_agent(model=model),
+        "scam": create_scam_check_agent(model=model),
+    }
+
+
+def _create_llm_router(model: str, lanes: Dict[str, BaseAgent], final_report_agent: BaseAgent) -> LlmAgent:
+    news_lane_agent = lanes["news"]
+    fact_lane_agent = lanes["fact"]
+    scam_lane_agent = lanes["scam"]
 
     return LlmAgent(
         name="ContentRoutingAgent",
@@ -96,9 +490,9 @@ def create_content_routing_agent(model: str = MODEL) -> LlmAgent:
             "- Keep the conversation grounded: explain skipped lanes and residual uncertainties explicitly."
         ),
         tools=[
-            NormalizedAgentTool(news_lane_agent),
-            NormalizedAgentTool(fact_lane_agent),
-            NormalizedAgentTool(scam_lane_agent),
+            LaneAgentTool(news_lane_agent, "news"),
+            LaneAgentTool(fact_lane_agent, "fact"),
+            LaneAgentTool(scam_lane_agent, "scam"),
             FinalReportAgentTool(final_report_agent),
         ],
         output_key=STATE_KEYS.FINAL_REPORT,
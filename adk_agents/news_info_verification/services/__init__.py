@@ -1,15 +1,75 @@
 """Shared service helpers for external API integrations."""
 
-from . import context_helpers
-from . import factcheck_client
-from . import gnews_client
-from . import text_utils
-from . import virustotal_client
+import importlib
+from typing import Any
+
+# Submodules are imported on first access so that light consumers (config, text helpers,
+# the benchmarks) do not pay for every client and ``requests`` up front.
+_SUBMODULES = (
+	"blocklist_index",
+	"cache_store",
+	"circuit_breaker",
+	"claimreview_index",
+	"context_helpers",
+	"deadline",
+	"factcheck_client",
+	"gnews_client",
+	"http_transport",
+	"intent_classifier",
+	"metrics",
+	"near_duplicates",
+	"perplexity_client",
+	"rate_limiter",
+	"scam_language",
+	"text_utils",
+	"token_usage",
+	"url_extraction",
+	"verdict_store",
+	"virustotal_client",
+)
+
+
+def __getattr__(name: str) -> Any:
+	if name in _SUBMODULES:
+		return importlib.import_module(f".{name}", __name__)
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def prewarm_connections(*, connections_per_host: int = 1) -> int:
+	"""Open pooled keep-alive connections to every upstream API host."""
+	from . import factcheck_client, gnews_client, http_transport, perplexity_client, virustotal_client
+
+	return http_transport.prewarm(
+		(
+			gnews_client.API_URL,
+			factcheck_client.API_URL,
+			virustotal_client.API_URL,
+			perplexity_client.PERPLEXITY_API_URL,
+		),
+		connections_per_host=connections_per_host,
+	)
+
 
 __all__ = [
+	"blocklist_index",
+	"cache_store",
+	"circuit_breaker",
+	"claimreview_index",
 	"context_helpers",
+	"deadline",
 	"factcheck_client",
 	"gnews_client",
+	"http_transport",
+	"intent_classifier",
+	"metrics",
+	"near_duplicates",
+	"perplexity_client",
+	"prewarm_connections",
+	"rate_limiter",
+	"scam_language",
 	"text_utils",
+	"token_usage",
+	"url_extraction",
+	"verdict_store",
 	"virustotal_client",
 ]
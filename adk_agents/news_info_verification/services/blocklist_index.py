@@ -0,0 +1,342 @@
+"""Offline URL/domain reputation index compiled from public blocklists.
+
+Blocklist files are compiled into one read-only file: a header, JSON metadata, a Bloom
+filter, a sorted array of 64-bit key hashes and a parallel array of source ids. The
+accepted line formats are plain URLs, hostnames, hosts-file entries and ``||domain^`` or
+``*.domain`` rules. Readers memory-map the file, so every worker process shares the same
+pages. A lookup hashes the URL (without its scheme), the host, and each parent domain
+down to the registered domain. It probes the Bloom filter and binary-searches the hash
+array only for candidates.
+
+Rebuilds write a temporary file next to the index and ``os.replace`` it. Readers keep
+their mapping of the old file until the next reload check remaps the new one.
+
+Usage::
+
+    python -m news_info_verification.services.blocklist_index urlhaus.txt hosts.txt --output blocklist.idx
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional, Sequence
+from urllib.parse import urlsplit
+
+from ..config import BLOCKLIST_ENABLED, BLOCKLIST_INDEX_PATH, BLOCKLIST_RELOAD_INTERVAL_S, BLOCKLIST_SOURCES
+from . import url_extraction
+
+KIND_URL = "url"
+KIND_HOST = "host"
+KIND_DOMAIN = "domain"
+_KEY_PREFIX = {KIND_URL: "u:", KIND_HOST: "h:", KIND_DOMAIN: "d:"}
+
+_MAGIC = b"NIVBLK01"
+# magic, bloom hash count, reserved, entry count, bloom size in bytes, metadata size in bytes
+_HEADER = struct.Struct("<8sIIQQQ")
+_HASH = struct.Struct("<Q")
+_SOURCE = struct.Struct("<H")
+_BLOOM_BITS_PER_ENTRY = 10
+_BLOOM_HASHES = 7
+_HOSTS_FILE_IGNORED = frozenset({"localhost", "localhost.localdomain", "local", "broadcasthost", "0.0.0.0"})
+
+
+class BlocklistIndexError(RuntimeError):
+    """The index file is missing, truncated or in an unknown format."""
+
+
+@dataclass(frozen=True)
+class BlocklistHit:
+    """A blocklist match: which key matched and the source file that listed it."""
+
+    kind: str
+    value: str
+    source: str
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _bloom_positions(value: int, bits: int, hashes: int) -> Iterator[int]:
+    low, high = value & 0xFFFFFFFF, (value >> 32) | 1
+    for probe in range(hashes):
+        yield (low + probe * high) % bits
+
+
+def _url_key(canonical: str) -> str:
+    return canonical.split("://", 1)[-1]
+
+
+def _is_ip(token: str) -> bool:
+    return ":" in token or (token.count(".") == 3 and all(part.isdigit() for part in token.split(".")))
+
+
+def parse_line(line: str) -> Optional[tuple[str, str]]:
+    """Parse one blocklist line into ``(kind, value)``, or ``None`` for comments and noise."""
+    line = line.strip()
+    if not line or line.startswith(("#", "!", ";")):
+        return None
+    line = line.split(" #", 1)[0].strip()
+    if line.startswith("||"):
+        host = url_extraction.normalize_host(line[2:].split("^", 1)[0].split("/", 1)[0])
+        return (KIND_DOMAIN, host) if host else None
+    if line.startswith("*."):
+        host = url_extraction.normalize_host(line[2:])
+        return (KIND_DOMAIN, host) if host else None
+
+    fields = line.split()
+    token = fields[0]
+    if len(fields) >= 2 and _is_ip(token):
+        token = fields[1]
+        if token.lower() in _HOSTS_FILE_IGNORED:
+            return None
+    if "://" in token or "/" in token:
+        canonical = url_extraction.canonicalize_url(token if "://" in token else f"http://{token}")
+        return (KIND_URL, _url_key(canonical)) if canonical else None
+    host = url_extraction.normalize_host(token)
+    if not host or "." not in host:
+        return None
+    return KIND_HOST, host
+
+
+def _read_entries(path: str) -> Iterator[tuple[str, str]]:
+    with open(path, encoding="utf-8", errors="replace") as handle:
+        for line in handle:
+            entry = parse_line(line)
+            if entry is not None:
+                yield entry
+
+
+def _pad(length: int) -> bytes:
+    return b"\0" * (-length % 8)
+
+
+def build_index(sources: Sequence[str], output: str) -> int:
+    """Compile blocklist files into ``output`` atomically; returns the number of distinct keys."""
+    names: list[str] = []
+    entries: dict[int, int] = {}
+    for path in sources:
+        source_id = len(names)
+        names.append(os.path.basename(path))
+        for kind, value in _read_entries(path):
+            entries.setdefault(_hash(_KEY_PREFIX[kind] + value), source_id)
+
+    hashes = sorted(entries)
+    bits = max(64, len(hashes) * _BLOOM_BITS_PER_ENTRY)
+    bits += -bits % 64
+    bloom = bytearray(bits // 8)
+    for value in hashes:
+        for position in _bloom_positions(value, bits, _BLOOM_HASHES):
+            bloom[position >> 3] |= 1 << (position & 7)
+    metadata = json.dumps({"sources": names, "built_at": int(time.time())}).encode("utf-8")
+
+    directory = os.path.dirname(os.path.abspath(output))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=".blocklist-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(_HEADER.pack(_MAGIC, _BLOOM_HASHES, 0, len(hashes), len(bloom), len(metadata)))
+            handle.write(metadata + _pad(len(metadata)))
+            handle.write(bloom)
+            handle.write(b"".join(_HASH.pack(value) for value in hashes))
+            handle.write(b"".join(_SOURCE.pack(entries[value]) for value in hashes))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, output)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_path)
+        raise
+    return len(hashes)
+
+
+class BlocklistIndex:
+    """Read-only, memory-mapped view of a compiled blocklist index."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as handle:
+            stat = os.fstat(handle.fileno())
+            if stat.st_size < _HEADER.size:
+                raise BlocklistIndexError(f"{path} is too small to be a blocklist index")
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self.identity = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        magic, self._hashes, _, self.count, bloom_size, metadata_size = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC:
+            raise BlocklistIndexError(f"{path} is not a blocklist index")
+        metadata_start = _HEADER.size
+        self._bloom_start = metadata_start + metadata_size + len(_pad(metadata_size))
+        self._bloom_bits = bloom_size * 8
+        self._hash_start = self._bloom_start + bloom_size
+        self._source_start = self._hash_start + self.count * _HASH.size
+        if len(self._map) < self._source_start + self.count * _SOURCE.size:
+            raise BlocklistIndexError(f"{path} is truncated")
+        metadata = json.loads(bytes(self._map[metadata_start:metadata_start + metadata_size]) or b"{}")
+        self.sources: list[str] = list(metadata.get("sources") or [])
+        self.built_at: Optional[int] = metadata.get("built_at")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _might_contain(self, value: int) -> bool:
+        start, data = self._bloom_start, self._map
+        return all(
+            data[start + (position >> 3)] & (1 << (position & 7))
+            for position in _bloom_positions(value, self._bloom_bits, self._hashes)
+        )
+
+    def _find(self, value: int) -> Optional[int]:
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            current = _HASH.unpack_from(self._map, self._hash_start + middle * _HASH.size)[0]
+            if current < value:
+                low = middle + 1
+            elif current > value:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def _source_of(self, key: str) -> Optional[str]:
+        value = _hash(key)
+        if not self.count or not self._might_contain(value):
+            return None
+        slot = self._find(value)
+        if slot is None:
+            return None
+        source_id = _SOURCE.unpack_from(self._map, self._source_start + slot * _SOURCE.size)[0]
+        return self.sources[source_id] if source_id < len(self.sources) else "unknown"
+
+    def contains(self, kind: str, value: str) -> bool:
+        return self._source_of(_KEY_PREFIX[kind] + value) is not None
+
+    def lookup(self, url: str) -> Optional[BlocklistHit]:
+        """Match a URL by exact URL, exact host, then each parent domain down to the registered one."""
+        canonical = url_extraction.canonicalize_url(url)
+        if canonical is None:
+            return None
+        host = url_extraction.normalize_host(urlsplit(canonical).hostname or "")
+        candidates = [(KIND_URL, _url_key(canonical)), (KIND_HOST, host)]
+        registered = url_extraction.registered_domain(host)
+        domain = host
+        while True:
+            candidates.append((KIND_DOMAIN, domain))
+            if domain == registered or "." not in domain:
+                break
+            domain = domain.split(".", 1)[1]
+        for kind, value in candidates:
+            source = self._source_of(_KEY_PREFIX[kind] + value)
+            if source is not None:
+                return BlocklistHit(kind=kind, value=value, source=source)
+        return None
+
+    def close(self) -> None:
+        self._map.close()
+
+
+_lock = threading.Lock()
+_index: Optional[BlocklistIndex] = None
+_checked_at = float("-inf")
+_rebuild: Optional[threading.Thread] = None
+
+
+def _stale(index_mtime: float, sources: Iterable[str]) -> bool:
+    for path in sources:
+        try:
+            if os.stat(path).st_mtime > index_mtime:
+                return True
+        except OSError:
+            continue
+    return False
+
+
+def _rebuild_in_background(sources: Sequence[str], path: str) -> None:
+    global _rebuild, _checked_at
+    if _rebuild is not None and _rebuild.is_alive():
+        return
+
+    def run() -> None:
+        global _checked_at
+        try:
+            build_index(sources, path)
+        except OSError:
+            return
+        _checked_at = float("-inf")
+
+    _rebuild = threading.Thread(target=run, name="blocklist-rebuild", daemon=True)
+    _rebuild.start()
+
+
+def _refresh(path: str, sources: Sequence[str]) -> None:
+    global _index
+    try:
+        stat = os.stat(path)
+    except OSError:
+        stat = None
+    existing_sources = [source for source in sources if os.path.exists(source)]
+    if existing_sources and (stat is None or _stale(stat.st_mtime, existing_sources)):
+        # Readers keep using the current mapping (or none) until the new file lands.
+        _rebuild_in_background(existing_sources, path)
+    if stat is None:
+        return
+    if _index is not None and _index.identity == (stat.st_ino, stat.st_size, stat.st_mtime_ns):
+        return
+    try:
+        _index = BlocklistIndex(path)
+    except (OSError, ValueError, BlocklistIndexError):
+        return
+
+
+def shared_index() -> Optional[BlocklistIndex]:
+    """The process-wide index at ``BLOCKLIST_INDEX_PATH``, re-checked every ``BLOCKLIST_RELOAD_INTERVAL_S``."""
+    global _checked_at
+    if not BLOCKLIST_ENABLED:
+        return None
+    if time.monotonic() - _checked_at < BLOCKLIST_RELOAD_INTERVAL_S:
+        return _index
+    with _lock:
+        now = time.monotonic()
+        if now - _checked_at >= BLOCKLIST_RELOAD_INTERVAL_S:
+            _checked_at = now
+            _refresh(BLOCKLIST_INDEX_PATH, BLOCKLIST_SOURCES)
+    return _index
+
+
+def lookup(url: str) -> Optional[BlocklistHit]:
+    """Check ``url`` against the shared index; ``None`` when unlisted or no index is available."""
+    index = shared_index()
+    return index.lookup(url) if index is not None else None
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compile blocklist files into a memory-mapped reputation index.")
+    parser.add_argument("sources", nargs="+", help="blocklist files (URLs, hostnames, hosts files, ||domain^ rules)")
+    parser.add_argument("--output", default=BLOCKLIST_INDEX_PATH)
+    parser.add_argument("--check", action="append", default=[], metavar="URL", help="look up URLs after building")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    count = build_index(args.sources, args.output)
+    print(f"{count} keys from {len(args.sources)} files -> {args.output} in {time.perf_counter() - started:.2f}s")
+    if args.check:
+        index = BlocklistIndex(args.output)
+        for url in args.check:
+            hit = index.lookup(url)
+            print(f"{url}: {f'{hit.kind} {hit.value} ({hit.source})' if hit else 'not listed'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""Disk-backed TTL cache with LRU eviction shared by the API clients."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+"""
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Hit/miss counters for a cache since the process started."""
+
+    hits: int
+    misses: int
+    writes: int
+    evictions: int
+    entries: int
+    errors: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        if total <= 0:
+            return 0.0
+        return round(self.hits / total, 4)
+
+
+class SqliteTTLCache:
+    """JSON value cache persisted in SQLite.
+
+    Every entry carries its own expiry so callers can pick a TTL per value. Expired and
+    least recently read entries are evicted every few writes (at most
+    ``EVICT_INTERVAL``, or a tenth of ``max_entries``), so the table may briefly run
+    that far past ``max_entries``. The database runs in WAL mode so several worker
+    processes can share one file.
+
+    A cache must never fail the lookup it fronts: SQLite errors, or an unusable cache
+    directory, count as a miss in :meth:`get` and skip the write in :meth:`set`.
+    """
+
+    EVICT_INTERVAL = 100
+
+    def __init__(self, path: str, *, max_entries: int) -> None:
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self._evict_every = max(1, min(self.EVICT_INTERVAL, self.max_entries // 10))
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+        self._errors = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key`` or ``None`` when missing or expired."""
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connection()
+                row = conn.execute("SELECT value, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is None or row[1] <= now:
+                    if row is not None:
+                        conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    self._misses += 1
+                    return None
+                conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+            except (sqlite3.Error, OSError):
+                self._errors += 1
+                self._misses += 1
+                return None
+            self._hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, *, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds; non-positive TTLs are ignored."""
+        if ttl <= 0:
+            return
+        now = time.time()
+        encoded = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                    (key, encoded, now + ttl, now),
+                )
+                self._writes += 1
+                if (self._writes - 1) % self._evict_every == 0:
+                    self._evict(conn, now)
+            except (sqlite3.Error, OSError):
+                self._errors += 1
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        (count,) = conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY last_access ASC LIMIT ?)",
+                (overflow,),
+            )
+            self._evictions += overflow
+
+    def invalidate(self, key: str) -> bool:
+        """Drop a single entry; returns ``True`` when something was removed."""
+        with self._lock:
+            cursor = self._connection().execute("DELETE FROM entries WHERE key = ?", (key,))
+        return cursor.rowcount > 0
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._connection().execute("DELETE FROM entries")
+
+    def stats(self) -> CacheStats:
+        """Return the hit/miss counters and the current entry count."""
+        with self._lock:
+            (count,) = self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                writes=self._writes,
+                evictions=self._evictions,
+                entries=count,
+                errors=self._errors,
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,222 @@
+"""Per-provider circuit breakers for the outbound API clients.
+
+Once a provider's recent failure ratio crosses the threshold, its breaker opens. While
+open, calls fail immediately with :class:`CircuitOpenError` instead of waiting out the
+client timeout. That error is a ``requests.RequestException``, so each client turns it
+into its usual error type and the tools return their normal ``status: "error"`` payload.
+After the cooldown a limited number of probe requests go through. If the probes succeed
+the breaker closes again; if they fail it reopens.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+import requests
+
+from ..config import (
+    BREAKER_COOLDOWN,
+    BREAKER_ENABLED,
+    BREAKER_FAILURE_RATIO,
+    BREAKER_HALF_OPEN_PROBES,
+    BREAKER_MIN_REQUESTS,
+    BREAKER_WINDOW,
+)
+from . import deadline
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request while the provider's breaker is open."""
+
+
+@dataclass(frozen=True)
+class BreakerStats:
+    """Current state and counters for one provider's breaker."""
+
+    provider: str
+    state: str
+    failure_ratio: float
+    window: int
+    rejected: int
+    opened: int
+    retry_in_s: float
+
+
+class _Call:
+    __slots__ = ("failed",)
+
+    def __init__(self) -> None:
+        self.failed = False
+
+    def mark_failed(self) -> None:
+        """Count the call as a failure even though no exception was raised (e.g. HTTP 5xx)."""
+        self.failed = True
+
+
+class CircuitBreaker:
+    """Failure-ratio breaker over the last ``window`` calls with half-open probing."""
+
+    def __init__(
+        self,
+        provider: str,
+        *,
+        window: int = BREAKER_WINDOW,
+        min_requests: int = BREAKER_MIN_REQUESTS,
+        failure_ratio: float = BREAKER_FAILURE_RATIO,
+        cooldown: float = BREAKER_COOLDOWN,
+        half_open_probes: int = BREAKER_HALF_OPEN_PROBES,
+    ) -> None:
+        self.provider = provider
+        self.min_requests = max(1, min_requests)
+        self.failure_ratio = failure_ratio
+        self.cooldown = cooldown
+        self.half_open_probes = max(1, half_open_probes)
+        self._lock = threading.Lock()
+        self._outcomes: deque[bool] = deque(maxlen=max(1, window))
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._rejected = 0
+        self._opened = 0
+
+    def _failure_ratio(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for ok in self._outcomes if not ok) / len(self._outcomes)
+
+    def _open(self, now: float) -> None:
+        self._state = STATE_OPEN
+        self._opened_at = now
+        self._probes_in_flight = 0
+        self._opened += 1
+
+    def _admit(self) -> bool:
+        """Return whether the call is a half-open probe; raise when the breaker rejects it."""
+        with self._lock:
+            now = time.monotonic()
+            if self._state == STATE_OPEN and now - self._opened_at >= self.cooldown:
+                self._state = STATE_HALF_OPEN
+            if self._state == STATE_CLOSED:
+                return False
+            if self._state == STATE_HALF_OPEN and self._probes_in_flight < self.half_open_probes:
+                self._probes_in_flight += 1
+                return True
+            self._rejected += 1
+            retry_in = max(0.0, self.cooldown - (now - self._opened_at))
+        raise CircuitOpenError(f"circuit open for {self.provider}; retry in {retry_in:.1f}s")
+
+    def _settle(self, *, probe: bool, ok: Optional[bool]) -> None:
+        """Record an outcome; ``ok=None`` means the call was abandoned without a verdict."""
+        with self._lock:
+            if probe:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if ok is None or (not probe and self._state != STATE_CLOSED):
+                return
+            now = time.monotonic()
+            if probe:
+                if self._state != STATE_HALF_OPEN:
+                    return
+                if ok:
+                    self._state = STATE_CLOSED
+                    self._outcomes.clear()
+                else:
+                    self._open(now)
+                return
+            self._outcomes.append(ok)
+            if len(self._outcomes) >= self.min_requests and self._failure_ratio() >= self.failure_ratio:
+                self._open(now)
+
+    @contextlib.contextmanager
+    def guard(self) -> Iterator[_Call]:
+        """Admit one call and record its outcome.
+
+        A ``requests.RequestException`` raised inside the block counts as a failure, and so
+        does :meth:`_Call.mark_failed`. Any other exception (such as a cancellation) only
+        releases the probe slot, as does running out of request deadline, which says
+        nothing about the provider's health.
+        """
+        probe = self._admit()
+        call = _Call()
+        try:
+            yield call
+        except deadline.DeadlineExceeded:
+            self._settle(probe=probe, ok=None)
+            raise
+        except requests.RequestException:
+            self._settle(probe=probe, ok=False)
+            raise
+        except BaseException:
+            self._settle(probe=probe, ok=None)
+            raise
+        self._settle(probe=probe, ok=not call.failed)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = STATE_CLOSED
+            self._outcomes.clear()
+            self._probes_in_flight = 0
+
+    def stats(self) -> BreakerStats:
+        with self._lock:
+            now = time.monotonic()
+            state = self._state
+            if state == STATE_OPEN and now - self._opened_at >= self.cooldown:
+                state = STATE_HALF_OPEN
+            return BreakerStats(
+                provider=self.provider,
+                state=state,
+                failure_ratio=round(self._failure_ratio(), 4),
+                window=len(self._outcomes),
+                rejected=self._rejected,
+                opened=self._opened,
+                retry_in_s=round(max(0.0, self.cooldown - (now - self._opened_at)), 3) if state == STATE_OPEN else 0.0,
+            )
+
+
+_breakers_lock = threading.Lock()
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def breaker_for(provider: str) -> Optional[CircuitBreaker]:
+    """Return the breaker for ``provider``, or ``None`` when breakers are disabled."""
+    if not BREAKER_ENABLED:
+        return None
+    breaker = _breakers.get(provider)
+    if breaker is not None:
+        return breaker
+    with _breakers_lock:
+        if provider not in _breakers:
+            _breakers[provider] = CircuitBreaker(provider)
+        return _breakers[provider]
+
+
+def guard(provider: str) -> contextlib.AbstractContextManager[_Call]:
+    """Context manager around one call to ``provider``; a no-op when breakers are disabled."""
+    breaker = breaker_for(provider)
+    if breaker is None:
+        return contextlib.nullcontext(_Call())
+    return breaker.guard()
+
+
+def reset(provider: Optional[str] = None) -> None:
+    """Close one provider's breaker (or all of them) and forget recorded outcomes."""
+    with _breakers_lock:
+        breakers = [_breakers[provider]] if provider in _breakers else ([] if provider else list(_breakers.values()))
+    for breaker in breakers:
+        breaker.reset()
+
+
+def stats() -> dict[str, BreakerStats]:
+    """Snapshot every breaker that has seen traffic."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.provider: breaker.stats() for breaker in breakers}
@@ -0,0 +1,388 @@
+"""Local full-text index of ClaimReview records, ranked with SQLite FTS5 BM25.
+
+Ingest accepts JSON or JSONL in two shapes: Fact Check API responses or claims
+(``{"text": ..., "claimReview": [...]}``), and schema.org ``ClaimReview`` objects,
+including ``DataFeed`` dumps that wrap them in ``dataFeedElement``/``item`` lists.
+Records are upserted on their review URL, and files whose size and mtime have not
+changed since the last ingest are skipped, so re-running ingest over a growing dump
+directory is incremental. Searches return :class:`factcheck_client.FactCheckReview`
+values, so the fact tools aggregate local and remote results the same way.
+
+Usage::
+
+    python -m news_info_verification.services.claimreview_index ingest claimreview_dump.json more/*.jsonl
+    python -m news_info_verification.services.claimreview_index search "5G towers spread viruses"
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Optional
+
+from ..config import FACTCHECK_LOCAL_INDEX_ENABLED, FACTCHECK_LOCAL_INDEX_PATH, FACTCHECK_LOCAL_MIN_MATCH
+from .factcheck_client import FactCheckReview
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    id INTEGER PRIMARY KEY,
+    review_key TEXT NOT NULL UNIQUE,
+    claim_text TEXT NOT NULL,
+    publisher TEXT NOT NULL,
+    url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    textual_rating TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    review_date TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS reviews_fts USING fts5(
+    claim_text, title, summary, content='reviews', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS reviews_ai AFTER INSERT ON reviews BEGIN
+    INSERT INTO reviews_fts (rowid, claim_text, title, summary) VALUES (new.id, new.claim_text, new.title, new.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS reviews_ad AFTER DELETE ON reviews BEGIN
+    INSERT INTO reviews_fts (reviews_fts, rowid, claim_text, title, summary)
+    VALUES ('delete', old.id, old.claim_text, old.title, old.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS reviews_au AFTER UPDATE ON reviews BEGIN
+    INSERT INTO reviews_fts (reviews_fts, rowid, claim_text, title, summary)
+    VALUES ('delete', old.id, old.claim_text, old.title, old.summary);
+    INSERT INTO reviews_fts (rowid, claim_text, title, summary) VALUES (new.id, new.claim_text, new.title, new.summary);
+END;
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    ingested_at REAL NOT NULL
+);
+"""
+
+_UPSERT = """
+INSERT INTO reviews (review_key, claim_text, publisher, url, title, textual_rating, summary, review_date, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (review_key) DO UPDATE SET
+    claim_text = excluded.claim_text,
+    publisher = excluded.publisher,
+    url = excluded.url,
+    title = excluded.title,
+    textual_rating = excluded.textual_rating,
+    summary = excluded.summary,
+    review_date = excluded.review_date,
+    updated_at = excluded.updated_at
+WHERE (claim_text, publisher, title, textual_rating, summary, review_date) IS NOT
+    (excluded.claim_text, excluded.publisher, excluded.title, excluded.textual_rating, excluded.summary, excluded.review_date)
+"""
+
+# BM25 column weights: claim text, title, summary.
+_BM25 = "bm25(reviews_fts, 4.0, 2.0, 1.0)"
+_SEARCH = f"""
+SELECT r.claim_text, r.publisher, r.url, r.title, r.textual_rating, r.summary, r.review_date
+FROM reviews_fts JOIN reviews AS r ON r.id = reviews_fts.rowid
+WHERE reviews_fts MATCH ?
+ORDER BY {_BM25}
+LIMIT ?
+"""
+
+_TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+_STOPWORDS = frozenset(
+    "a an and are as at be but by did do does for from has have how i in is it its of on or that the this to was were"
+    " what when which who why will with you your".split()
+)
+_MAX_QUERY_TERMS = 24
+# Candidates fetched per requested result before the term-coverage filter.
+_CANDIDATE_FACTOR = 4
+
+
+@dataclass(frozen=True)
+class IngestStats:
+    """Outcome of one ingest run."""
+
+    files: int
+    skipped_files: int
+    records: int
+    changed: int
+
+
+def _text(value: Any) -> str:
+    return value.strip() if isinstance(value, str) else ""
+
+
+def _from_api_claim(claim: dict[str, Any]) -> Iterator[FactCheckReview]:
+    claim_text = _text(claim.get("text"))
+    for review in claim.get("claimReview") or []:
+        if not isinstance(review, dict):
+            continue
+        yield FactCheckReview(
+            claim_text=claim_text,
+            publisher=_text((review.get("publisher") or {}).get("name")) or "Unknown",
+            url=_text(review.get("url")),
+            title=_text(review.get("title")) or claim_text,
+            textual_rating=_text(review.get("textualRating")),
+            summary=_text(review.get("text")),
+            review_date=review.get("reviewDate"),
+        )
+
+
+def _from_schema_org(review: dict[str, Any]) -> Iterator[FactCheckReview]:
+    claim_text = _text(review.get("claimReviewed"))
+    rating = review.get("reviewRating") or {}
+    author = review.get("author") or {}
+    if isinstance(author, list):
+        author = author[0] if author else {}
+    yield FactCheckReview(
+        claim_text=claim_text,
+        publisher=_text(author.get("name")) or "Unknown",
+        url=_text(review.get("url")),
+        title=_text(review.get("name")) or _text(review.get("headline")) or claim_text,
+        textual_rating=_text(rating.get("alternateName")) or _text(rating.get("ratingExplanation")),
+        summary=_text(review.get("description")) or _text(rating.get("ratingExplanation")),
+        review_date=review.get("datePublished"),
+    )
+
+
+def reviews_from(document: Any) -> Iterator[FactCheckReview]:
+    """Yield the ClaimReview records found anywhere in a parsed JSON document."""
+    if isinstance(document, list):
+        for item in document:
+            yield from reviews_from(item)
+        return
+    if not isinstance(document, dict):
+        return
+    if "claimReview" in document:
+        yield from _from_api_claim(document)
+    elif document.get("@type") == "ClaimReview" or "claimReviewed" in document:
+        yield from _from_schema_org(document)
+    else:
+        for key in ("claims", "dataFeedElement", "item", "@graph"):
+            if key in document:
+                yield from reviews_from(document[key])
+
+
+def _read_documents(path: str) -> Iterator[Any]:
+    with open(path, encoding="utf-8") as handle:
+        if not path.endswith((".jsonl", ".ndjson")):
+            try:
+                document = json.load(handle)
+            except ValueError:
+                # Not a single JSON document; fall back to one document per line.
+                handle.seek(0)
+            else:
+                yield document
+                return
+        for line in handle:
+            line = line.strip()
+            if line:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+def _review_key(review: FactCheckReview) -> str:
+    if review.url:
+        return review.url
+    material = "\x1f".join((review.publisher, review.claim_text, review.textual_rating))
+    return "sha256:" + hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _match_query(query: str) -> tuple[str, list[str]]:
+    terms: list[str] = []
+    for term in _TERM_PATTERN.findall(query.lower()):
+        if len(term) > 1 and term not in _STOPWORDS and term not in terms:
+            terms.append(term)
+    terms = terms[:_MAX_QUERY_TERMS]
+    return " OR ".join(f'"{term}"' for term in terms), terms
+
+
+def _anchors(query: str) -> list[str]:
+    """Numbers and capitalized words of the query, which a local match must not swap."""
+    anchors: list[str] = []
+    for word in _TERM_PATTERN.findall(query):
+        folded = word.lower()
+        if any(char.isdigit() for char in word) or (word[0].isupper() and folded not in _STOPWORDS):
+            if folded not in anchors:
+                anchors.append(folded)
+    return anchors
+
+
+def _prefix(term: str) -> str:
+    # Compare five-character prefixes so simple inflections ("vaccines"/"vaccinated") count;
+    # terms with digits ("2020"/"2021", "5g") must match exactly.
+    return term if any(char.isdigit() for char in term) else term[:5]
+
+
+def _matches(terms: list[str], anchors: list[str], review: FactCheckReview, min_match: float) -> bool:
+    text = f"{review.claim_text} {review.title} {review.summary}".lower()
+    prefixes = {_prefix(word) for word in _TERM_PATTERN.findall(text)}
+    if not all(_prefix(anchor) in prefixes for anchor in anchors):
+        return False
+    return sum(_prefix(term) in prefixes for term in terms) / len(terms) >= min_match
+
+
+class ClaimReviewIndex:
+    """SQLite FTS5 index of ClaimReview records, safe to share between threads."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def add(self, reviews: Iterable[FactCheckReview]) -> tuple[int, int]:
+        """Upsert reviews; returns ``(records seen, records inserted or changed)``."""
+        now = time.time()
+        rows = [
+            (
+                _review_key(review),
+                review.claim_text,
+                review.publisher,
+                review.url,
+                review.title,
+                review.textual_rating,
+                review.summary,
+                review.review_date,
+                now,
+            )
+            for review in reviews
+            if review.claim_text or review.title
+        ]
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN")
+            try:
+                cursor = conn.executemany(_UPSERT, rows)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            return len(rows), max(0, cursor.rowcount)
+
+    def ingest(self, paths: Iterable[str], *, force: bool = False) -> IngestStats:
+        """Load JSON/JSONL dumps, skipping files unchanged since their last ingest unless ``force``."""
+        files = skipped = records = changed = 0
+        for path in paths:
+            stat = os.stat(path)
+            key = os.path.abspath(path)
+            with self._lock:
+                row = self._connection().execute("SELECT size, mtime_ns FROM sources WHERE path = ?", (key,)).fetchone()
+            files += 1
+            if not force and row == (stat.st_size, stat.st_mtime_ns):
+                skipped += 1
+                continue
+            seen, updated = self.add(review for document in _read_documents(path) for review in reviews_from(document))
+            records += seen
+            changed += updated
+            with self._lock:
+                self._connection().execute(
+                    "INSERT OR REPLACE INTO sources (path, size, mtime_ns, ingested_at) VALUES (?, ?, ?, ?)",
+                    (key, stat.st_size, stat.st_mtime_ns, time.time()),
+                )
+        return IngestStats(files=files, skipped_files=skipped, records=records, changed=changed)
+
+    def search(
+        self, query: str, *, max_results: int = 6, min_match: float = FACTCHECK_LOCAL_MIN_MATCH
+    ) -> list[FactCheckReview]:
+        """BM25-ranked reviews whose text covers at least ``min_match`` of the query terms.
+
+        Every number and name (capitalized word) of the query must also appear in the
+        review, so "Biden won the 2020 election" never answers "Trump won the 2020 election".
+        """
+        expression, terms = _match_query(query or "")
+        if not terms:
+            return []
+        with self._lock:
+            rows = self._connection().execute(_SEARCH, (expression, max_results * _CANDIDATE_FACTOR)).fetchall()
+        reviews = [FactCheckReview(*row) for row in rows]
+        anchors = _anchors(query)
+        return [review for review in reviews if _matches(terms, anchors, review, min_match)][:max_results]
+
+    def count(self) -> int:
+        with self._lock:
+            (total,) = self._connection().execute("SELECT COUNT(*) FROM reviews").fetchone()
+        return total
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_index_lock = threading.Lock()
+_index: Optional[ClaimReviewIndex] = None
+
+
+def shared_index() -> Optional[ClaimReviewIndex]:
+    """The index at ``FACTCHECK_LOCAL_INDEX_PATH``; ``None`` when disabled or nothing was ingested yet."""
+    global _index
+    if not FACTCHECK_LOCAL_INDEX_ENABLED:
+        return None
+    with _index_lock:
+        if _index is None:
+            if not os.path.exists(FACTCHECK_LOCAL_INDEX_PATH):
+                return None
+            _index = ClaimReviewIndex(FACTCHECK_LOCAL_INDEX_PATH)
+        return _index
+
+
+def search(query: str, *, max_results: int = 6) -> list[FactCheckReview]:
+    """Search the shared local index; an unreadable index counts as a miss."""
+    index = shared_index()
+    if index is None:
+        return []
+    try:
+        return index.search(query, max_results=max_results)
+    except sqlite3.Error:
+        return []
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Maintain the local ClaimReview full-text index.")
+    parser.add_argument("--index", default=FACTCHECK_LOCAL_INDEX_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+    ingest = commands.add_parser("ingest", help="load ClaimReview JSON/JSONL dumps")
+    ingest.add_argument("paths", nargs="+")
+    ingest.add_argument("--force", action="store_true", help="re-read files even if unchanged")
+    lookup = commands.add_parser("search", help="run a query against the index")
+    lookup.add_argument("query")
+    lookup.add_argument("--max-results", type=int, default=6)
+    args = parser.parse_args(argv)
+
+    index = ClaimReviewIndex(args.index)
+    if args.command == "ingest":
+        started = time.perf_counter()
+        stats = index.ingest(args.paths, force=args.force)
+        print(
+            f"{stats.files} files ({stats.skipped_files} unchanged), {stats.records} records, {stats.changed} changed; "
+            f"{index.count()} reviews indexed in {time.perf_counter() - started:.2f}s"
+        )
+    else:
+        for review in index.search(args.query, max_results=args.max_results):
+            print(f"[{review.textual_rating or 'Unrated'}] {review.publisher}: {review.claim_text} <{review.url}>")
+    index.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from datetime import datetime, timezone
+from typing import Iterable, Optional
 
 from google.genai import types
 
@@ -36,3 +37,12 @@ def extract_latest_user_text(ctx: ReadonlyContext) -> str:
         if candidate:
             return candidate
     return ""
+
+
+def latest_user_timestamp(ctx: ReadonlyContext) -> Optional[str]:
+    """Return the ISO-8601 UTC time of the latest user event, if any."""
+    for event in reversed(ctx.session.events):
+        if event.author == "user" and event.timestamp:
+            submitted = datetime.fromtimestamp(event.timestamp, tz=timezone.utc)
+            return submitted.isoformat(timespec="seconds")
+    return None
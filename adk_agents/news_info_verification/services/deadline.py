@@ -0,0 +1,71 @@
+"""Request-level deadlines shared by the agents and the HTTP transport.
+
+The root agent starts a deadline for each verification. It lives in a context variable,
+so parallel lanes, AgentTool sub-runs and worker threads all see the same deadline.
+The transport shortens each request timeout to the time that is left, and the lane
+fan-outs stop waiting for workers once their share of the budget is spent.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import time
+from typing import Iterator, Optional
+
+import requests
+
+# Below this many seconds a request is not worth sending.
+MIN_REQUEST_TIMEOUT = 0.05
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(requests.Timeout):
+    """The deadline left no time for an outbound request, or cut one short.
+
+    It is a ``requests.Timeout``, so each client turns it into its usual error type.
+    """
+
+
+def start(seconds: Optional[float]) -> Optional[float]:
+    """Set the current request's deadline ``seconds`` from now; ``None`` or ``<= 0`` clears it."""
+    expires_at = time.monotonic() + seconds if seconds and seconds > 0 else None
+    _deadline.set(expires_at)
+    return expires_at
+
+
+@contextlib.contextmanager
+def scope(seconds: float) -> Iterator[None]:
+    """Tighten the deadline for the block; an earlier outer deadline still wins."""
+    expires_at = time.monotonic() + max(0.0, seconds)
+    current = _deadline.get()
+    token = _deadline.set(expires_at if current is None else min(current, expires_at))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the deadline (never negative), or ``None`` without a deadline."""
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return max(0.0, expires_at - time.monotonic())
+
+
+def expired() -> bool:
+    """Whether too little time is left to send another request."""
+    left = remaining()
+    return left is not None and left < MIN_REQUEST_TIMEOUT
+
+
+def clamp(timeout: float) -> float:
+    """Shorten ``timeout`` to the time left; raise :class:`DeadlineExceeded` when none is."""
+    left = remaining()
+    if left is None:
+        return timeout
+    if left < MIN_REQUEST_TIMEOUT:
+        raise DeadlineExceeded("request deadline exceeded")
+    return min(timeout, left)
@@ -2,12 +2,28 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import hashlib
+import os
+import threading
+from dataclasses import astuple, dataclass
 from typing import Optional
 
 import requests
 
+from ..config import (
+    CACHE_DIR,
+    FACTCHECK_CACHE_ENABLED,
+    FACTCHECK_CACHE_MAX_ENTRIES,
+    FACTCHECK_CACHE_TTL,
+    FACTCHECK_CACHE_TTL_EMPTY,
+)
+from . import http_transport
+from .cache_store import CacheStats, SqliteTTLCache
+from .text_utils import normalize_query
+
 API_URL = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
+PROVIDER = "factcheck"
 
 
 class FactCheckClientError(RuntimeError):
@@ -27,20 +43,80 @@ class FactCheckReview:
     review_date: Optional[str]
 
 
-def search_fact_checks(query: str, api_key: str, *, max_results: int = 6) -> list[FactCheckReview]:
-    """Search for fact checks matching the provided query."""
-    params = {
+_cache_lock = threading.Lock()
+_cache: Optional[SqliteTTLCache] = None
+
+
+def query_cache() -> Optional[SqliteTTLCache]:
+    """Return the shared query cache, or ``None`` when caching is disabled."""
+    global _cache
+    if not FACTCHECK_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = SqliteTTLCache(
+                os.path.join(CACHE_DIR, "factcheck_queries.sqlite3"),
+                max_entries=FACTCHECK_CACHE_MAX_ENTRIES,
+            )
+        return _cache
+
+
+def cache_stats() -> Optional[CacheStats]:
+    """Hit/miss counters for the query cache, if enabled."""
+    cache = query_cache()
+    return cache.stats() if cache else None
+
+
+def _cache_key(params: dict) -> str:
+    material = "\x1f".join(
+        (normalize_query(params["query"]), params["languageCode"], str(params["pageSize"]))
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def invalidate_query(query: str, *, max_results: int = 6) -> bool:
+    """Drop the cached reviews for ``query``; returns ``True`` if an entry was removed."""
+    cache = query_cache()
+    if cache is None:
+        return False
+    return cache.invalidate(_cache_key(_build_params(query, "", max_results)))
+
+
+def clear_cache() -> None:
+    """Drop every cached Fact Check query."""
+    cache = query_cache()
+    if cache is not None:
+        cache.clear()
+
+
+def _cached_reviews(params: dict) -> Optional[list[FactCheckReview]]:
+    cache = query_cache()
+    if cache is None:
+        return None
+    cached = cache.get(_cache_key(params))
+    if cached is None:
+        return None
+    return [FactCheckReview(*entry) for entry in cached]
+
+
+def _store_reviews(params: dict, reviews: list[FactCheckReview]) -> None:
+    cache = query_cache()
+    if cache is None:
+        return
+    ttl = FACTCHECK_CACHE_TTL if reviews else FACTCHECK_CACHE_TTL_EMPTY
+    cache.set(_cache_key(params), [astuple(review) for review in reviews], ttl=ttl)
+
+
+def _build_params(query: str, api_key: str, max_results: int) -> dict:
+    return {
         "key": api_key,
         "languageCode": "en-US",
         "pageSize": max(1, min(max_results, 10)),
         "query": query,
     }
 
-    try:
-        response = requests.get(API_URL, params=params, timeout=10)
-    except requests.RequestException as exc:  # pragma: no cover - network error handling
-        raise FactCheckClientError(str(exc)) from exc
 
+def _parse_reviews(response: requests.Response, limit: int) -> list[FactCheckReview]:
     if response.status_code != requests.codes.ok:
         raise FactCheckClientError(f"HTTP {response.status_code}: {response.text}")
 
@@ -68,4 +144,38 @@ def search_fact_checks(query: str, api_key: str, *, max_results: int = 6) -> lis
                     review_date=review_date,
                 )
             )
-    return reviews[: params["pageSize"]]
+    return reviews[:limit]
+
+
+def search_fact_checks(query: str, api_key: str, *, max_results: int = 6) -> list[FactCheckReview]:
+    """Search for fact checks matching the provided query."""
+    params = _build_params(query, api_key, max_results)
+    cached = _cached_reviews(params)
+    if cached is not None:
+        return cached
+
+    try:
+        response = http_transport.request("GET", API_URL, params=params, timeout=10, provider=PROVIDER)
+    except requests.RequestException as exc:  # pragma: no cover - network error handling
+        raise FactCheckClientError(str(exc)) from exc
+
+    reviews = _parse_reviews(response, params["pageSize"])
+    _store_reviews(params, reviews)
+    return reviews
+
+
+async def search_fact_checks_async(query: str, api_key: str, *, max_results: int = 6) -> list[FactCheckReview]:
+    """Async variant of :func:`search_fact_checks`; the cache is read and written in a worker thread."""
+    params = _build_params(query, api_key, max_results)
+    cached = await asyncio.to_thread(_cached_reviews, params)
+    if cached is not None:
+        return cached
+
+    try:
+        response = await http_transport.request_async("GET", API_URL, params=params, timeout=10, provider=PROVIDER)
+    except requests.RequestException as exc:  # pragma: no cover - network error handling
+        raise FactCheckClientError(str(exc)) from exc
+
+    reviews = _parse_reviews(response, params["pageSize"])
+    await asyncio.to_thread(_store_reviews, params, reviews)
+    return reviews
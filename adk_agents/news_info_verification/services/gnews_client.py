@@ -8,7 +8,10 @@ from urllib.parse import urlparse
 
 import requests
 
+from . import http_transport
+
 API_URL = "https://gnews.io/api/v4/search"
+PROVIDER = "gnews"
 
 _INVALID_URL_SENTINELS = {"", "invalid url", "null", "none", "n/a"}
 
@@ -67,9 +70,8 @@ def _extract_article_url(entry: dict) -> str:
     return ""
 
 
-def fetch_articles(query: str, api_key: str, *, max_results: int = 5) -> list[GNewsArticle]:
-    """Fetch relevant news articles for the query."""
-    params = {
+def _build_params(query: str, api_key: str, max_results: int) -> dict:
+    return {
         "q": query,
         "token": api_key,
         "lang": "en",
@@ -77,18 +79,15 @@ def fetch_articles(query: str, api_key: str, *, max_results: int = 5) -> list[GN
         "sortby": "publishedAt",
     }
 
-    try:
-        response = requests.get(API_URL, params=params, timeout=10)
-    except requests.RequestException as exc:  # pragma: no cover - network error handling
-        raise GNewsClientError(str(exc)) from exc
 
+def _parse_articles(response: requests.Response, limit: int) -> list[GNewsArticle]:
     if response.status_code != requests.codes.ok:
         raise GNewsClientError(f"HTTP {response.status_code}: {response.text}")
 
     data = response.json()
     raw_articles = data.get("articles") or []
     normalized: list[GNewsArticle] = []
-    for entry in raw_articles[: params["max"]]:
+    for entry in raw_articles[:limit]:
         title = (entry.get("title") or "").strip()
         url = _extract_article_url(entry)
         source_name = (entry.get("source") or {}).get("name") or "Unknown"
@@ -106,3 +105,27 @@ def fetch_articles(query: str, api_key: str, *, max_results: int = 5) -> list[GN
             )
         )
     return normalized
+
+
+def fetch_articles(query: str, api_key: str, *, max_results: int = 5) -> list[GNewsArticle]:
+    """Fetch relevant news articles for the query."""
+    params = _build_params(query, api_key, max_results)
+
+    try:
+        response = http_transport.request("GET", API_URL, params=params, timeout=10, provider=PROVIDER)
+    except requests.RequestException as exc:  # pragma: no cover - network error handling
+        raise GNewsClientError(str(exc)) from exc
+
+    return _parse_articles(response, params["max"])
+
+
+async def fetch_articles_async(query: str, api_key: str, *, max_results: int = 5) -> list[GNewsArticle]:
+    """Async variant of :func:`fetch_articles`."""
+    params = _build_params(query, api_key, max_results)
+
+    try:
+        response = await http_transport.request_async("GET", API_URL, params=params, timeout=10, provider=PROVIDER)
+    except requests.RequestException as exc:  # pragma: no cover - network error handling
+        raise GNewsClientError(str(exc)) from exc
+
+    return _parse_articles(response, params["max"])
@@ -0,0 +1,508 @@
+"""Shared pooled HTTP transport used by every external API client."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..config import (
+    HTTP_HEDGE_ENABLED,
+    HTTP_HEDGE_MIN_DELAY,
+    HTTP_HEDGE_MIN_SAMPLES,
+    HTTP_HEDGE_PERCENTILE,
+    HTTP_HEDGE_PROVIDERS,
+    HTTP_POOL_HOSTS,
+    HTTP_POOL_MAXSIZE,
+    RATE_LIMIT_MAX_RETRIES,
+)
+from . import circuit_breaker, deadline, metrics, rate_limiter
+
+_PREWARM_TIMEOUT = 5
+_LATENCY_SAMPLES = 256
+
+_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+_pool_hosts = HTTP_POOL_HOSTS
+_pool_maxsize = HTTP_POOL_MAXSIZE
+_hedge_pool: Optional[ThreadPoolExecutor] = None
+
+
+@dataclass(frozen=True)
+class HostPoolStats:
+    """Connection pool counters for a single scheme/host/port."""
+
+    host: str
+    requests: int
+    connections_opened: int
+    open_connections: int
+    idle_connections: int
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Share of requests served over an already-established connection."""
+        if self.requests <= 0:
+            return 0.0
+        reused = max(0, self.requests - self.connections_opened)
+        return round(reused / self.requests, 4)
+
+
+@dataclass(frozen=True)
+class TransportStats:
+    """Aggregated pool statistics across every host the transport has contacted."""
+
+    hosts: tuple[HostPoolStats, ...]
+
+    @property
+    def requests(self) -> int:
+        return sum(host.requests for host in self.hosts)
+
+    @property
+    def connections_opened(self) -> int:
+        return sum(host.connections_opened for host in self.hosts)
+
+    @property
+    def open_connections(self) -> int:
+        return sum(host.open_connections for host in self.hosts)
+
+    @property
+    def reuse_ratio(self) -> float:
+        total = self.requests
+        if total <= 0:
+            return 0.0
+        reused = max(0, total - self.connections_opened)
+        return round(reused / total, 4)
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    """Hedging counters and the current hedge delay for one provider."""
+
+    provider: str
+    samples: int
+    hedge_delay_s: Optional[float]
+    hedged: int
+    backup_wins: int
+
+
+class _LatencyWindow:
+    """Recent successful request latencies for one provider."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._samples: deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+        self.hedged = 0
+        self.backup_wins = 0
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def count(self, *, backup_won: bool) -> None:
+        with self._lock:
+            self.hedged += 1
+            self.backup_wins += int(backup_won)
+
+    def hedge_delay(self) -> Optional[float]:
+        """The configured latency percentile, or ``None`` until enough samples exist."""
+        with self._lock:
+            if len(self._samples) < max(1, HTTP_HEDGE_MIN_SAMPLES):
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(HTTP_HEDGE_PERCENTILE / 100 * len(ordered)) - 1))
+        return max(HTTP_HEDGE_MIN_DELAY, ordered[index])
+
+    def stats(self, provider: str) -> HedgeStats:
+        delay = self.hedge_delay()
+        with self._lock:
+            return HedgeStats(
+                provider=provider,
+                samples=len(self._samples),
+                hedge_delay_s=round(delay, 4) if delay is not None else None,
+                hedged=self.hedged,
+                backup_wins=self.backup_wins,
+            )
+
+
+_latencies: dict[str, _LatencyWindow] = {}
+
+
+def _latency_window(provider: str) -> _LatencyWindow:
+    window = _latencies.get(provider)
+    if window is None:
+        with _lock:
+            window = _latencies.setdefault(provider, _LatencyWindow())
+    return window
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=max(1, _pool_hosts),
+        pool_maxsize=max(1, _pool_maxsize),
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def configure(*, pool_hosts: Optional[int] = None, pool_maxsize: Optional[int] = None) -> None:
+    """Resize the connection pools; open connections are closed and re-established lazily."""
+    global _pool_hosts, _pool_maxsize
+    if pool_hosts is not None:
+        _pool_hosts = pool_hosts
+    if pool_maxsize is not None:
+        _pool_maxsize = pool_maxsize
+    close()
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide keep-alive session, creating it on first use."""
+    global _session
+    session = _session
+    if session is not None:
+        return session
+    with _lock:
+        if _session is None:
+            _session = _build_session()
+        return _session
+
+
+def close() -> None:
+    """Close every pooled connection and drop the shared session."""
+    global _session
+    with _lock:
+        session, _session = _session, None
+    if session is not None:
+        session.close()
+
+
+def _send(method: str, url: str, *, timeout: float, **kwargs: Any) -> requests.Response:
+    return get_session().request(method, url, timeout=timeout, **kwargs)
+
+
+def _timed_send(window: _LatencyWindow, method: str, url: str, *, timeout: float, **kwargs: Any) -> requests.Response:
+    started = time.monotonic()
+    response = _send(method, url, timeout=timeout, **kwargs)
+    if response.status_code < 500:
+        window.add(time.monotonic() - started)
+    return response
+
+
+def _hedge_delay(provider: str, method: str, window: _LatencyWindow) -> Optional[float]:
+    """Delay before a backup request, or ``None`` when this call must not be hedged."""
+    if not HTTP_HEDGE_ENABLED or method.upper() != "GET" or provider not in HTTP_HEDGE_PROVIDERS:
+        return None
+    return window.hedge_delay()
+
+
+def _hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_pool
+    if _hedge_pool is None:
+        with _lock:
+            if _hedge_pool is None:
+                _hedge_pool = ThreadPoolExecutor(max_workers=max(2, _pool_maxsize * 2), thread_name_prefix="http-hedge")
+    return _hedge_pool
+
+
+def _discard(future: Any) -> None:
+    """Close the response of a request that lost the hedge race."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def _may_hedge(bucket: Optional[rate_limiter.TokenBucket]) -> bool:
+    # A backup request still has to fit the provider's quota; never queue for one.
+    return bucket is None or bucket.try_acquire()
+
+
+def _send_hedged(
+    window: _LatencyWindow,
+    delay: float,
+    bucket: Optional[rate_limiter.TokenBucket],
+    method: str,
+    url: str,
+    **kwargs: Any,
+) -> requests.Response:
+    pool = _hedge_executor()
+    primary = pool.submit(_timed_send, window, method, url, **kwargs)
+    try:
+        return primary.result(timeout=delay)
+    except FutureTimeoutError:
+        pass
+    if not _may_hedge(bucket):
+        return primary.result()
+    backup = pool.submit(_timed_send, window, method, url, **kwargs)
+    futures: list[Future] = [primary, backup]
+    failure: Optional[BaseException] = None
+    for future in as_completed(futures):
+        try:
+            response = future.result()
+        except requests.RequestException as exc:
+            failure = exc
+            continue
+        window.count(backup_won=future is backup)
+        for other in futures:
+            if other is not future:
+                other.add_done_callback(_discard)
+        return response
+    assert failure is not None
+    raise failure
+
+
+async def _send_hedged_async(
+    window: _LatencyWindow,
+    delay: float,
+    bucket: Optional[rate_limiter.TokenBucket],
+    method: str,
+    url: str,
+    **kwargs: Any,
+) -> requests.Response:
+    primary = asyncio.ensure_future(asyncio.to_thread(_timed_send, window, method, url, **kwargs))
+    done, _ = await asyncio.wait({primary}, timeout=delay)
+    if done or not _may_hedge(bucket):
+        return await primary
+    backup = asyncio.ensure_future(asyncio.to_thread(_timed_send, window, method, url, **kwargs))
+    pending = {primary, backup}
+    failure: Optional[BaseException] = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    window.count(backup_won=task is backup)
+                    return task.result()
+                failure = task.exception()
+    finally:
+        for task in pending:
+            task.add_done_callback(_discard)
+    assert failure is not None
+    raise failure
+
+
+def _throttled(bucket: Optional[rate_limiter.TokenBucket], response: requests.Response, attempt: int) -> bool:
+    """Pause the provider's queue on HTTP 429 and report whether the request should be retried."""
+    if bucket is None or response.status_code != requests.codes.too_many_requests:
+        return False
+    retry_after = rate_limiter.parse_retry_after(response.headers.get("Retry-After"))
+    bucket.pause(retry_after if retry_after is not None else 2.0 ** attempt)
+    return attempt < RATE_LIMIT_MAX_RETRIES
+
+
+def _acquire(bucket: rate_limiter.TokenBucket) -> None:
+    try:
+        bucket.acquire(timeout=deadline.remaining())
+    except TimeoutError as exc:
+        raise deadline.DeadlineExceeded("request deadline passed while waiting for a rate-limit token") from exc
+
+
+async def _acquire_async(bucket: rate_limiter.TokenBucket) -> None:
+    try:
+        await bucket.acquire_async(timeout=deadline.remaining())
+    except TimeoutError as exc:
+        raise deadline.DeadlineExceeded("request deadline passed while waiting for a rate-limit token") from exc
+
+
+@contextlib.contextmanager
+def _bounded_by_deadline(budget: float, timeout: float) -> Iterator[None]:
+    """Report a timeout caused by the shortened ``budget`` as :class:`deadline.DeadlineExceeded`."""
+    try:
+        yield
+    except deadline.DeadlineExceeded:
+        raise
+    except requests.Timeout as exc:
+        if budget < timeout:
+            raise deadline.DeadlineExceeded(f"request cut short by the deadline after {budget:.2f}s") from exc
+        raise
+
+
+def _record(provider: str, started: float, response: Optional[requests.Response], error: Optional[BaseException]) -> None:
+    """Record one provider call (after retries) in the client metrics."""
+    metrics.CLIENT_DURATION.observe(time.perf_counter() - started, provider)
+    if response is not None:
+        metrics.CLIENT_REQUESTS.inc(provider, response.status_code)
+        metrics.CLIENT_RESPONSE_BYTES.observe(len(response.content or b""), provider)
+    elif isinstance(error, circuit_breaker.CircuitOpenError):
+        metrics.CLIENT_REQUESTS.inc(provider, "circuit_open")
+    elif isinstance(error, deadline.DeadlineExceeded):
+        metrics.CLIENT_REQUESTS.inc(provider, "deadline")
+    elif isinstance(error, requests.Timeout):
+        metrics.CLIENT_REQUESTS.inc(provider, "timeout")
+    else:
+        metrics.CLIENT_REQUESTS.inc(provider, "error")
+
+
+def request(method: str, url: str, *, timeout: float, provider: Optional[str] = None, **kwargs: Any) -> requests.Response:
+    """Issue an HTTP request over the shared pooled session.
+
+    With ``provider`` set, the provider's circuit breaker may reject the call immediately
+    with :class:`circuit_breaker.CircuitOpenError`. Otherwise the request waits for the
+    provider's rate limiter, an HTTP 429 is retried after the advertised ``Retry-After``,
+    and slow GETs can be hedged with a backup request. Provider calls are recorded in
+    :mod:`metrics` when metrics are enabled.
+
+    Under a request deadline (:mod:`deadline`), ``timeout`` is shortened to the time left,
+    and :class:`deadline.DeadlineExceeded` is raised once there is none.
+    """
+    if provider is None:
+        budget = deadline.clamp(timeout)
+        with _bounded_by_deadline(budget, timeout):
+            return _send(method, url, timeout=budget, **kwargs)
+    if not metrics.enabled():
+        return _request(method, url, timeout=timeout, provider=provider, **kwargs)
+    started = time.perf_counter()
+    try:
+        response = _request(method, url, timeout=timeout, provider=provider, **kwargs)
+    except requests.RequestException as exc:
+        _record(provider, started, None, exc)
+        raise
+    _record(provider, started, response, None)
+    return response
+
+
+def _request(method: str, url: str, *, timeout: float, provider: str, **kwargs: Any) -> requests.Response:
+    bucket = rate_limiter.limiter_for(provider)
+    window = _latency_window(provider)
+    attempt = 0
+    while True:
+        # Fail fast, before taking a breaker probe slot or queueing for a token.
+        deadline.clamp(timeout)
+        with circuit_breaker.guard(provider) as call:
+            if bucket is not None:
+                _acquire(bucket)
+            budget = deadline.clamp(timeout)
+            delay = _hedge_delay(provider, method, window)
+            with _bounded_by_deadline(budget, timeout):
+                if delay is None:
+                    response = _timed_send(window, method, url, timeout=budget, **kwargs)
+                else:
+                    response = _send_hedged(window, delay, bucket, method, url, timeout=budget, **kwargs)
+            if response.status_code >= 500:
+                call.mark_failed()
+        if not _throttled(bucket, response, attempt):
+            return response
+        response.close()
+        attempt += 1
+
+
+async def request_async(
+    method: str, url: str, *, timeout: float, provider: Optional[str] = None, **kwargs: Any
+) -> requests.Response:
+    """Awaitable variant of :func:`request` that keeps the event loop free while waiting on I/O."""
+    if provider is None:
+        budget = deadline.clamp(timeout)
+        with _bounded_by_deadline(budget, timeout):
+            return await asyncio.to_thread(_send, method, url, timeout=budget, **kwargs)
+    if not metrics.enabled():
+        return await _request_async(method, url, timeout=timeout, provider=provider, **kwargs)
+    started = time.perf_counter()
+    try:
+        response = await _request_async(method, url, timeout=timeout, provider=provider, **kwargs)
+    except requests.RequestException as exc:
+        _record(provider, started, None, exc)
+        raise
+    _record(provider, started, response, None)
+    return response
+
+
+async def _request_async(method: str, url: str, *, timeout: float, provider: str, **kwargs: Any) -> requests.Response:
+    bucket = rate_limiter.limiter_for(provider)
+    window = _latency_window(provider)
+    attempt = 0
+    while True:
+        # Fail fast, before taking a breaker probe slot or queueing for a token.
+        deadline.clamp(timeout)
+        with circuit_breaker.guard(provider) as call:
+            if bucket is not None:
+                await _acquire_async(bucket)
+            budget = deadline.clamp(timeout)
+            delay = _hedge_delay(provider, method, window)
+            with _bounded_by_deadline(budget, timeout):
+                if delay is None:
+                    response = await asyncio.to_thread(_timed_send, window, method, url, timeout=budget, **kwargs)
+                else:
+                    response = await _send_hedged_async(window, delay, bucket, method, url, timeout=budget, **kwargs)
+            if response.status_code >= 500:
+                call.mark_failed()
+        if not _throttled(bucket, response, attempt):
+            return response
+        response.close()
+        attempt += 1
+
+
+def hedge_stats() -> dict[str, HedgeStats]:
+    """Per-provider latency samples, current hedge delay and hedge outcomes."""
+    with _lock:
+        windows = dict(_latencies)
+    return {provider: window.stats(provider) for provider, window in windows.items()}
+
+
+def _origin(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}/"
+
+
+def _warm(url: str) -> bool:
+    try:
+        request("HEAD", url, timeout=_PREWARM_TIMEOUT, allow_redirects=False)
+    except requests.RequestException:
+        return False
+    return True
+
+
+def prewarm(urls: Iterable[str], *, connections_per_host: int = 1) -> int:
+    """Open keep-alive connections to each host ahead of the first real request.
+
+    Returns the number of connections that were established successfully.
+    """
+    origins = list(dict.fromkeys(_origin(url) for url in urls if url))
+    targets = [origin for origin in origins for _ in range(max(1, connections_per_host))]
+    if not targets:
+        return 0
+    with ThreadPoolExecutor(max_workers=min(len(targets), max(1, _pool_maxsize))) as pool:
+        return sum(pool.map(_warm, targets))
+
+
+def _host_stats(pool: Any) -> HostPoolStats:
+    queue = getattr(pool, "pool", None)
+    idle_slots = list(getattr(queue, "queue", ()) or ())
+    idle = sum(1 for conn in idle_slots if conn is not None and getattr(conn, "sock", None) is not None)
+    in_use = max(0, (getattr(pool, "maxsize", 0) or 0) - len(idle_slots)) if queue is not None else 0
+    return HostPoolStats(
+        host=f"{pool.scheme}://{pool.host}:{pool.port}",
+        requests=getattr(pool, "num_requests", 0),
+        connections_opened=getattr(pool, "num_connections", 0),
+        open_connections=idle + in_use,
+        idle_connections=idle,
+    )
+
+
+def pool_stats() -> TransportStats:
+    """Snapshot the per-host pool counters of the shared session."""
+    session = _session
+    if session is None:
+        return TransportStats(hosts=())
+    stats: list[HostPoolStats] = []
+    seen: set[int] = set()
+    for adapter in session.adapters.values():
+        if id(adapter) in seen:
+            continue
+        seen.add(id(adapter))
+        pools = adapter.poolmanager.pools
+        with pools.lock:
+            snapshot = [pools._container[key] for key in pools.keys()]  # noqa: SLF001 - read without LRU touch
+        stats.extend(_host_stats(pool) for pool in snapshot)
+    return TransportStats(hosts=tuple(stats))
+
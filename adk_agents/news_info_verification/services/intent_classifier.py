@@ -0,0 +1,110 @@
+"""Keyword/regex intent pre-classifier that can route unambiguous submissions locally."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+from . import text_utils
+
+LANES = ("news", "fact", "scam")
+
+_PAYMENT_PATTERN = re.compile(
+    r"\b(?:gift ?cards?|wire (?:transfer|the money)|bank (?:account|details|transfer)|send (?:money|payment|funds)"
+    r"|pay(?:ment)? (?:now|immediately|fee|required)|processing fee|bitcoin|crypto(?:currency)?|usdt|western union"
+    r"|moneygram|paypal|venmo|zelle|credit card|card (?:number|details)|cvv|otp|one[- ]time (?:code|password)"
+    r"|password|login details|verify your (?:account|identity)|confirm your (?:account|details)|ssn|social security)\b",
+    re.IGNORECASE,
+)
+_PRESSURE_PATTERN = re.compile(
+    r"\b(?:urgent(?:ly)?|immediately|act now|within 24 hours|final (?:notice|warning)|account (?:has been )?"
+    r"(?:suspended|locked|blocked|compromised)|unusual (?:activity|sign-?in)|you(?:'ve| have)? won|winner|prize"
+    r"|lottery|claim your|refund|click (?:here|the link|below)|limited time|congratulations)\b",
+    re.IGNORECASE,
+)
+_NEWS_PATTERN = re.compile(
+    r"\b(?:breaking|just in|reported|reports|reporting|according to|announced|news|headline|press release"
+    r"|officials? (?:said|say|confirmed)|sources say|bbc|cnn|reuters|associated press|ap news|nytimes|new york times"
+    r"|washington post|guardian|fox news|al jazeera|bloomberg|today|yesterday|this morning|tonight|last night)\b",
+    re.IGNORECASE,
+)
+_FACT_PATTERN = re.compile(
+    r"\b(?:is it true|true that|fact|myth|proven|prove[sd]?|studies show|scientists|research shows|causes?|cures?"
+    r"|percent|%|million|billion|always|never|every|is the (?:largest|smallest|first|only)|was born|invented)\b",
+    re.IGNORECASE,
+)
+_QUESTION_PATTERN = re.compile(r"\?\s*$")
+
+
+@dataclass(frozen=True)
+class IntentDecision:
+    """Lane selection produced by the local pre-classifier."""
+
+    lanes: tuple[str, ...]
+    confidence: float
+    skip_reasons: dict[str, str] = field(default_factory=dict)
+    scores: dict[str, float] = field(default_factory=dict)
+
+    def is_confident(self, threshold: float) -> bool:
+        return bool(self.lanes) and self.confidence >= threshold
+
+
+def _count(pattern: re.Pattern[str], text: str) -> int:
+    return sum(1 for _ in pattern.finditer(text))
+
+
+def classify_intents(text: str) -> IntentDecision:
+    """Score the news/fact/scam intents of ``text`` and pick lanes when the signal is clear."""
+    if not text or not text.strip():
+        return IntentDecision(lanes=(), confidence=0.0)
+
+    urls = text_utils.extract_urls(text, limit=1)
+    payment_hits = _count(_PAYMENT_PATTERN, text)
+    pressure_hits = _count(_PRESSURE_PATTERN, text)
+    news_hits = _count(_NEWS_PATTERN, text)
+    fact_hits = _count(_FACT_PATTERN, text)
+    words = len(text.split())
+
+    short_statement = words <= 40 and not urls and not payment_hits and not pressure_hits
+    question = bool(_QUESTION_PATTERN.search(text.strip()))
+    scam = min(1.0, (0.45 if urls else 0.0) + 0.25 * payment_hits + 0.15 * pressure_hits)
+    news = min(1.0, 0.3 * news_hits)
+    fact = min(
+        1.0,
+        (0.6 if short_statement else 0.15) + 0.1 * fact_hits + (0.2 if short_statement and not question else 0.0),
+    )
+    scores = {"news": round(news, 2), "fact": round(fact, 2), "scam": round(scam, 2)}
+
+    lanes: tuple[str, ...]
+    if urls and (payment_hits or pressure_hits):
+        # Links plus payment/credential or pressure language: a solicitation, not a claim to fact-check.
+        lanes = ("scam",)
+        confidence = scam * (0.6 if news_hits else 1.0)
+    elif short_statement and news_hits:
+        lanes = ("news", "fact")
+        confidence = min(1.0, 0.6 + news / 2)
+    elif short_statement:
+        lanes = ("fact",)
+        confidence = fact
+    else:
+        lanes = tuple(lane for lane in LANES if scores[lane] >= 0.5)
+        confidence = 0.4 if lanes else 0.0
+
+    skip_reasons: dict[str, str] = {}
+    if "scam" not in lanes:
+        skip_reasons["scam"] = (
+            "no URLs, payment requests or credential prompts detected"
+            if not urls
+            else "links present but no payment, credential or pressure language detected"
+        )
+    if "news" not in lanes:
+        skip_reasons["news"] = "no breaking-news or media-coverage cues detected"
+    if "fact" not in lanes:
+        skip_reasons["fact"] = "message is a solicitation rather than a factual assertion"
+
+    return IntentDecision(
+        lanes=lanes,
+        confidence=round(confidence, 2),
+        skip_reasons=skip_reasons,
+        scores=scores,
+    )
@@ -0,0 +1,290 @@
+"""In-process metrics registry with Prometheus text exposition.
+
+Counters and histograms are kept per label set. Recording a sample costs a dict lookup, a
+bisect and a few additions under a per-series lock. :func:`render` formats the registry
+in the Prometheus text format (version 0.0.4), and :func:`serve` exposes it at
+``/metrics`` from a background thread.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, Optional, Sequence
+
+from ..config import METRICS_ENABLED
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SIZE_BUCKETS = (128, 512, 2048, 8192, 32768, 131072, 524288, 2097152)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _CounterSeries:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class _HistogramSeries:
+    __slots__ = ("_lock", "_bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self._lock = threading.Lock()
+        self._bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def snapshot(self) -> tuple[list[int], float, int]:
+        with self._lock:
+            return list(self.counts), self.sum, self.count
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, ...], Any] = {}
+
+    def _new_series(self) -> Any:
+        raise NotImplementedError
+
+    def labels(self, *values: Any) -> Any:
+        """Return the series for one label combination, creating it on first use."""
+        key = tuple(str(value) for value in values)
+        series = self._series.get(key)
+        if series is not None:
+            return series
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+        with self._lock:
+            return self._series.setdefault(key, self._new_series())
+
+    def _items(self) -> list[tuple[tuple[str, ...], Any]]:
+        with self._lock:
+            return sorted(self._series.items())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def _render_samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {_escape(self.documentation)}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self._render_samples()
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set."""
+
+    kind = "counter"
+
+    def _new_series(self) -> _CounterSeries:
+        return _CounterSeries()
+
+    def inc(self, *labelvalues: Any, amount: float = 1.0) -> None:
+        self.labels(*labelvalues).inc(amount)
+
+    def value(self, *labelvalues: Any) -> float:
+        series = self._series.get(tuple(str(value) for value in labelvalues))
+        return series.value if series is not None else 0.0
+
+    def _render_samples(self) -> Iterator[str]:
+        for key, series in self._items():
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(series.value)}"
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+
+    def _new_series(self) -> _HistogramSeries:
+        return _HistogramSeries(self.buckets)
+
+    def observe(self, value: float, *labelvalues: Any) -> None:
+        self.labels(*labelvalues).observe(value)
+
+    def _render_samples(self) -> Iterator[str]:
+        for key, series in self._items():
+            counts, total, count = series.snapshot()
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+_registry_lock = threading.Lock()
+_registry: dict[str, _Metric] = {}
+
+
+def _register(metric: _Metric) -> Any:
+    with _registry_lock:
+        existing = _registry.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                raise ValueError(f"metric {metric.name} is already registered with a different shape")
+            return existing
+        _registry[metric.name] = metric
+        return metric
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    """Return the registered counter ``name``, creating it on first use."""
+    return _register(Counter(name, documentation, labelnames))
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    *,
+    buckets: Sequence[float] = LATENCY_BUCKETS,
+) -> Histogram:
+    """Return the registered histogram ``name``, creating it on first use."""
+    return _register(Histogram(name, documentation, labelnames, buckets=buckets))
+
+
+def render() -> str:
+    """The whole registry in Prometheus text exposition format."""
+    with _registry_lock:
+        metrics = sorted(_registry.values(), key=lambda metric: metric.name)
+    lines = [line for metric in metrics for line in metric.render()]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def reset() -> None:
+    """Drop every recorded sample while keeping the registered metrics."""
+    with _registry_lock:
+        metrics = list(_registry.values())
+    for metric in metrics:
+        metric.clear()
+
+
+def enabled() -> bool:
+    return METRICS_ENABLED
+
+
+AGENT_DURATION = histogram(
+    "verification_agent_duration_seconds", "Wall-clock time of one agent run.", ("agent",)
+)
+AGENT_RUNS = counter("verification_agent_runs_total", "Completed agent runs.", ("agent",))
+TOOL_DURATION = histogram("verification_tool_duration_seconds", "FunctionTool call latency.", ("tool",))
+TOOL_CALLS = counter(
+    "verification_tool_calls_total", "FunctionTool calls by returned payload status.", ("tool", "status")
+)
+TOOL_PAYLOAD_BYTES = histogram(
+    "verification_tool_payload_bytes", "Size of the JSON payload a tool returned.", ("tool",), buckets=SIZE_BUCKETS
+)
+CLIENT_DURATION = histogram(
+    "verification_client_request_duration_seconds",
+    "Outbound provider request latency, including rate-limit waits and retries.",
+    ("provider",),
+)
+CLIENT_REQUESTS = counter(
+    "verification_client_requests_total", "Outbound provider requests by HTTP status or error.", ("provider", "status")
+)
+CLIENT_RESPONSE_BYTES = histogram(
+    "verification_client_response_bytes",
+    "Size of provider response bodies.",
+    ("provider",),
+    buckets=SIZE_BUCKETS,
+)
+LLM_TOKENS = counter(
+    "verification_llm_tokens_total", "Model tokens by provider, agent, lane and kind.", ("provider", "agent", "lane", "kind")
+)
+LLM_COST = counter(
+    "verification_llm_cost_usd_total", "Estimated model spend in USD.", ("provider", "agent", "lane")
+)
+LLM_BUDGET_SKIPS = counter(
+    "verification_llm_budget_skips_total", "Model calls skipped because the request token budget ran out.", ("provider", "agent")
+)
+NEAR_DUPLICATE_LOOKUPS = counter(
+    "verification_near_duplicate_lookups_total", "Near-duplicate claim lookups by result.", ("result",)
+)
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args: Any) -> None:
+        return
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+_server: Optional[ThreadingHTTPServer] = None
+
+
+def serve(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Expose :func:`render` at ``http://host:port/metrics`` from a daemon thread."""
+    global _server
+    with _registry_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), _Handler)
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name="metrics-http", daemon=True).start()
+        return _server
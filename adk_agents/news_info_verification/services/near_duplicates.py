@@ -0,0 +1,313 @@
+"""Near-duplicate detection for claims that were already verified.
+
+A viral claim arrives in many lightly reworded variants. Completed verifications are
+kept in a bounded in-memory MinHash/LSH index. Before routing, a new claim is looked up
+there, and a close enough match lets the router reuse the earlier lane summaries and
+report instead of running every lane again.
+
+Claims are normalized (NFKC, casefolded, punctuation dropped, URLs canonicalized) and
+shingled into character 5-grams. A MinHash signature of ``NEAR_DUPLICATE_NUM_PERM``
+values estimates the Jaccard similarity of two shingle sets. The signature is split
+into ``NEAR_DUPLICATE_BANDS`` bands, and claims that share any band bucket become
+candidates. A candidate matches when its estimated similarity is at least the
+threshold. It must also carry the same *anchors*: its URLs, numbers, names and
+negations. "Drinking bleach cures COVID" and "Drinking bleach does not cure COVID" share
+most of their shingles, but they are not the same claim, and neither are "The president
+of France resigned" and "The president of Germany resigned". Names are the capitalized
+words of the original text, minus common words that are only capitalized because they
+open a sentence; number words count as numbers. The anchors keep matching conservative,
+so reuse is opt-in (``NEAR_DUPLICATE_ENABLED``).
+
+The index holds at most ``NEAR_DUPLICATE_MAX_ENTRIES`` claims. The oldest entry is
+evicted first, and entries expire after ``NEAR_DUPLICATE_TTL_S``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+import threading
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+
+from ..config import (
+    NEAR_DUPLICATE_BANDS,
+    NEAR_DUPLICATE_ENABLED,
+    NEAR_DUPLICATE_MAX_ENTRIES,
+    NEAR_DUPLICATE_NUM_PERM,
+    NEAR_DUPLICATE_THRESHOLD,
+    NEAR_DUPLICATE_TTL_S,
+)
+from . import metrics, url_extraction
+
+SHINGLE_SIZE = 5
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 61) - 1
+_WORD_PATTERN = re.compile(r"\w+")
+_NUMBER_PATTERN = re.compile(r"\d+(?:[.,]\d+)*")
+_CONTRACTED_NOT = re.compile(r"n['\u2019]t\b")
+_NEGATIONS = frozenset(
+    {"no", "not", "never", "none", "nobody", "nothing", "neither", "nor", "cannot", "without", "fake", "false", "hoax"}
+)
+_NUMBER_WORDS = frozenset(
+    {
+        "zero", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten", "eleven", "twelve",
+        "twenty", "thirty", "forty", "fifty", "hundred", "thousand", "million", "billion", "trillion",
+        "dozen", "half", "double", "triple", "first", "second", "third", "last",
+    }
+)
+# Words that are capitalized at the start of a sentence without being names.
+_COMMON_WORDS = frozenset(
+    {
+        "a", "an", "the", "this", "that", "these", "those", "there", "here", "it", "its", "i", "he", "she", "we",
+        "you", "they", "his", "her", "our", "your", "their", "my", "in", "on", "at", "for", "from", "by", "with",
+        "after", "before", "during", "since", "as", "if", "when", "while", "why", "how", "what", "who", "which",
+        "where", "and", "but", "or", "so", "yet", "also", "just", "now", "today", "yesterday", "tomorrow",
+        "breaking", "new", "report", "reports", "reportedly", "according", "officials", "experts", "scientists",
+        "study", "people", "everyone", "all", "some", "many", "most", "every", "do", "does", "did", "is", "are",
+        "was", "were", "has", "have", "had", "will", "would", "can", "could", "should", "may", "might", "must",
+        "please", "dear", "hi", "hello", "urgent", "warning", "alert", "update", "watch", "look", "see", "read",
+        "share", "check", "confirmed", "claim", "video", "photo", "viral", "says", "said", "one",
+    }
+)
+_SENTENCE_BREAKS = frozenset('.!?:;"()[]\u201c\u201d\u2014')
+
+
+@dataclass(frozen=True)
+class NearDuplicate:
+    """A previously verified claim matching a new submission."""
+
+    claim: str
+    score: float
+    state: Mapping[str, Any]
+    verified_at: float
+
+
+@dataclass
+class _Entry:
+    claim: str
+    signature: array
+    anchors: frozenset
+    state: Mapping[str, Any]
+    verified_at: float
+
+
+def _names(prose: str) -> set[str]:
+    """Casefolded capitalized words of ``prose``, skipping common words that open a sentence."""
+    names = set()
+    for match in _WORD_PATTERN.finditer(prose):
+        word = match.group()
+        if not word[0].isupper():
+            continue
+        folded = word.casefold()
+        if folded in _NEGATIONS:
+            continue
+        if folded in _COMMON_WORDS:
+            before = match.start() - 1
+            while before >= 0 and prose[before].isspace():
+                before -= 1
+            if before < 0 or prose[before] in _SENTENCE_BREAKS:
+                continue
+        names.add(folded)
+    return names
+
+
+def _fingerprint_text(text: str) -> tuple[str, frozenset]:
+    """Return the normalized claim text and its anchors (URLs, numbers, names, negations)."""
+    urls = []
+    remainder = []
+    position = 0
+    for match in url_extraction.iter_urls(text or ""):
+        start = text.find(match.raw, position)
+        if start < 0:
+            continue
+        remainder.append(text[position:start])
+        position = start + len(match.raw)
+        urls.append(match.canonical)
+    remainder.append((text or "")[position:])
+    original = unicodedata.normalize("NFKC", " ".join(remainder))
+    prose = _CONTRACTED_NOT.sub(" not", original.casefold())
+    words = _WORD_PATTERN.findall(prose)
+    anchors = {f"url:{url}" for url in urls}
+    anchors.update(f"num:{number}" for number in _NUMBER_PATTERN.findall(prose))
+    anchors.update(f"num:{word}" for word in words if word in _NUMBER_WORDS)
+    anchors.update(f"name:{name}" for name in _names(original))
+    anchors.update(f"neg:{word}" for word in words if word in _NEGATIONS)
+    return " ".join(words + urls), frozenset(anchors)
+
+
+def fingerprint(claim: str) -> str:
+    """Stable key for a claim: equal after normalization means equal fingerprint."""
+    normalized, _ = _fingerprint_text(claim)
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _shingle_hashes(normalized: str) -> set[int]:
+    if len(normalized) <= SHINGLE_SIZE:
+        shingles = {normalized}
+    else:
+        shingles = {normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+    return {
+        int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little") & _MAX_HASH
+        for shingle in shingles
+    }
+
+
+class MinHashLSH:
+    """Bounded MinHash/LSH index from claim text to the state of its verification."""
+
+    def __init__(
+        self,
+        *,
+        threshold: float = NEAR_DUPLICATE_THRESHOLD,
+        num_perm: int = NEAR_DUPLICATE_NUM_PERM,
+        bands: int = NEAR_DUPLICATE_BANDS,
+        max_entries: int = NEAR_DUPLICATE_MAX_ENTRIES,
+        ttl: float = NEAR_DUPLICATE_TTL_S,
+    ) -> None:
+        if num_perm <= 0 or bands <= 0 or num_perm % bands:
+            raise ValueError("num_perm must be a positive multiple of bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        rng = random.Random(0x5EED)
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._buckets: dict[tuple[int, bytes], set[int]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def signature(self, normalized: str) -> array:
+        """MinHash signature of the character shingles of ``normalized`` text."""
+        hashes = _shingle_hashes(normalized)
+        return array(
+            "Q", (min((a * value + b) % _MERSENNE_PRIME for value in hashes) for a, b in self._permutations)
+        )
+
+    def _band_keys(self, signature: array) -> list[tuple[int, bytes]]:
+        return [
+            (band, signature[band * self.rows:(band + 1) * self.rows].tobytes()) for band in range(self.bands)
+        ]
+
+    def _similarity(self, left: array, right: array) -> float:
+        return sum(1 for a, b in zip(left, right) if a == b) / self.num_perm
+
+    def _remove(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        for key in self._band_keys(entry.signature):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def _expire(self, now: float) -> None:
+        while self._entries:
+            entry_id, entry = next(iter(self._entries.items()))
+            if len(self._entries) <= self.max_entries and (self.ttl <= 0 or now - entry.verified_at < self.ttl):
+                break
+            self._remove(entry_id)
+
+    def add(self, claim: str, state: Mapping[str, Any]) -> None:
+        """Index ``claim`` with the verification ``state`` to reuse for its near-duplicates."""
+        normalized, anchors = _fingerprint_text(claim)
+        if not normalized:
+            return
+        signature = self.signature(normalized)
+        now = time.time()
+        with self._lock:
+            # A re-verified claim replaces its earlier entry rather than accumulating copies.
+            stale = self._candidates(signature, anchors, exact=True)
+            for entry_id in stale:
+                self._remove(entry_id)
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = _Entry(claim, signature, anchors, dict(state), now)
+            for key in self._band_keys(signature):
+                self._buckets.setdefault(key, set()).add(entry_id)
+            self._expire(now)
+
+    def _candidates(self, signature: array, anchors: frozenset, *, exact: bool = False) -> list[int]:
+        found: set[int] = set()
+        for key in self._band_keys(signature):
+            found.update(self._buckets.get(key, ()))
+        return [
+            entry_id
+            for entry_id in found
+            if self._entries[entry_id].anchors == anchors
+            and (not exact or self._entries[entry_id].signature == signature)
+        ]
+
+    def query(self, claim: str) -> Optional[NearDuplicate]:
+        """Return the most similar fresh entry at or above the threshold, if any."""
+        normalized, anchors = _fingerprint_text(claim)
+        if not normalized:
+            return None
+        signature = self.signature(normalized)
+        with self._lock:
+            self._expire(time.time())
+            best: Optional[tuple[float, _Entry]] = None
+            for entry_id in self._candidates(signature, anchors):
+                entry = self._entries[entry_id]
+                score = self._similarity(signature, entry.signature)
+                if score >= self.threshold and (best is None or score > best[0]):
+                    best = (score, entry)
+        if best is None:
+            return None
+        score, entry = best
+        return NearDuplicate(entry.claim, round(score, 3), dict(entry.state), entry.verified_at)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_shared: Optional[MinHashLSH] = None
+_shared_lock = threading.Lock()
+
+
+def shared_index(*, enabled: Optional[bool] = None) -> Optional[MinHashLSH]:
+    """The process-wide index, or ``None`` when near-duplicate reuse is disabled.
+
+    ``enabled`` overrides ``NEAR_DUPLICATE_ENABLED``, e.g. for a router built with
+    ``reuse_near_duplicates=True``.
+    """
+    global _shared
+    if not (NEAR_DUPLICATE_ENABLED if enabled is None else enabled):
+        return None
+    with _shared_lock:
+        if _shared is None:
+            _shared = MinHashLSH()
+        return _shared
+
+
+def find(claim: str, *, enabled: Optional[bool] = None) -> Optional[NearDuplicate]:
+    """Look ``claim`` up in the shared index."""
+    index = shared_index(enabled=enabled)
+    if index is None or not claim:
+        return None
+    match = index.query(claim)
+    metrics.NEAR_DUPLICATE_LOOKUPS.inc("hit" if match else "miss")
+    return match
+
+
+def remember(claim: str, state: Mapping[str, Any], *, enabled: Optional[bool] = None) -> None:
+    """Record a completed verification of ``claim`` in the shared index."""
+    index = shared_index(enabled=enabled)
+    if index is not None and claim:
+        index.add(claim, state)
@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import os
 import re
-from dataclasses import dataclass
+import threading
+from dataclasses import asdict, dataclass
 from typing import Any, Iterable, Optional
 
 import requests
 
+from ..config import CACHE_DIR, PERPLEXITY_CACHE_ENABLED, PERPLEXITY_CACHE_MAX_ENTRIES
+from . import http_transport
+from .cache_store import CacheStats, SqliteTTLCache
+from .text_utils import normalize_query
+
 PERPLEXITY_API_URL = "https://api.perplexity.ai/chat/completions"
+PROVIDER = "perplexity"
 
 
 class PerplexityClientError(RuntimeError):
@@ -73,41 +82,120 @@ def _build_headers(api_key: str) -> dict[str, str]:
     }
 
 
-def _post_payload(payload: dict[str, Any], *, timeout: int = 30) -> dict[str, Any]:
+def _api_key() -> str:
     api_key = os.getenv("PERPLEXITY_API_KEY")
     if not api_key:
         raise PerplexityClientError("PERPLEXITY_API_KEY environment variable is not configured.")
+    return api_key
+
+
+def _decode_response(response: requests.Response) -> dict[str, Any]:
+    if response.status_code != requests.codes.ok:
+        raise PerplexityClientError(f"HTTP {response.status_code}: {response.text}")
+
+    return response.json()
+
+
+def _post_payload(payload: dict[str, Any], *, timeout: int = 30) -> dict[str, Any]:
+    api_key = _api_key()
 
     try:
-        response = requests.post(
+        response = http_transport.request(
+            "POST",
             PERPLEXITY_API_URL,
             headers=_build_headers(api_key),
             json=payload,
             timeout=timeout,
+            provider=PROVIDER,
         )
     except requests.RequestException as exc:  # pragma: no cover - network error handling
         raise PerplexityClientError(str(exc)) from exc
 
-    if response.status_code != requests.codes.ok:
-        raise PerplexityClientError(f"HTTP {response.status_code}: {response.text}")
+    return _decode_response(response)
 
-    return response.json()
 
+async def _post_payload_async(payload: dict[str, Any], *, timeout: int = 30) -> dict[str, Any]:
+    api_key = _api_key()
 
-def complete_json(
-    *,
-    user_prompt: str,
-    schema_description: str,
-    system_prompt: str,
-    model: str = "sonar-pro",
-    temperature: float = 0.1,
-    max_tokens: int = 800,
-) -> tuple[dict[str, Any], PerplexityResponse]:
-    """Request a JSON-formatted completion from Perplexity.
+    try:
+        response = await http_transport.request_async(
+            "POST",
+            PERPLEXITY_API_URL,
+            headers=_build_headers(api_key),
+            json=payload,
+            timeout=timeout,
+            provider=PROVIDER,
+        )
+    except requests.RequestException as exc:  # pragma: no cover - network error handling
+        raise PerplexityClientError(str(exc)) from exc
 
-    Returns a tuple of the parsed JSON payload defined by the schema description and
-    the raw Perplexity response metadata.
-    """
+    return _decode_response(response)
+
+
+_cache_lock = threading.Lock()
+_cache: Optional[SqliteTTLCache] = None
+
+
+def response_cache() -> Optional[SqliteTTLCache]:
+    """Return the shared completion cache, or ``None`` when caching is disabled."""
+    global _cache
+    if not PERPLEXITY_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = SqliteTTLCache(
+                os.path.join(CACHE_DIR, "perplexity_completions.sqlite3"),
+                max_entries=PERPLEXITY_CACHE_MAX_ENTRIES,
+            )
+        return _cache
+
+
+def cache_stats() -> Optional[CacheStats]:
+    """Hit/miss counters for the completion cache, if enabled."""
+    cache = response_cache()
+    return cache.stats() if cache else None
+
+
+def _cache_key(*, model: str, system_directive: str, schema_description: str, user_prompt: str) -> str:
+    material = "\x1f".join((model, system_directive, schema_description.strip(), normalize_query(user_prompt)))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _cached_usage(token_usage: dict[str, Any]) -> dict[str, Any]:
+    """Mark a replayed completion as free so spend totals only count real API calls."""
+    usage = {key: 0 for key, value in token_usage.items() if isinstance(value, (int, float))}
+    usage["cached"] = True
+    usage["cached_usage"] = token_usage
+    return usage
+
+
+def _cached_completion(key: str, cache_ttl: Optional[int]) -> Optional[tuple[dict[str, Any], PerplexityResponse]]:
+    cache = response_cache() if cache_ttl else None
+    if cache is None:
+        return None
+    cached = cache.get(key)
+    if cached is None:
+        return None
+    meta = cached["response"]
+    response = PerplexityResponse(
+        message=meta["message"],
+        search_results=[PerplexitySearchResult(**entry) for entry in meta["search_results"]],
+        token_usage=_cached_usage(meta["token_usage"]),
+    )
+    return cached["payload"], response
+
+
+def _store_completion(
+    key: str, cache_ttl: Optional[int], result: tuple[dict[str, Any], PerplexityResponse]
+) -> None:
+    cache = response_cache() if cache_ttl else None
+    if cache is None:
+        return
+    payload, response = result
+    cache.set(key, {"payload": payload, "response": asdict(response)}, ttl=cache_ttl)
+
+
+def _build_system_directive(system_prompt: str, schema_description: str) -> str:
     system_directive = (
         "You are a meticulous research assistant. Respond ONLY with a JSON object that conforms to "
         "the provided schema. Do not include code fences, prose, or explanations outside the JSON."
@@ -116,8 +204,18 @@ def complete_json(
         system_directive += "\n" + system_prompt.strip()
     if schema_description:
         system_directive += "\nSchema:\n" + schema_description.strip()
+    return system_directive
 
-    payload = {
+
+def _build_payload(
+    *,
+    user_prompt: str,
+    system_directive: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+) -> dict[str, Any]:
+    return {
         "model": model,
         "messages": [
             {
@@ -134,7 +232,8 @@ def complete_json(
         "return_images": False,
     }
 
-    raw = _post_payload(payload)
+
+def _parse_completion(raw: dict[str, Any]) -> tuple[dict[str, Any], PerplexityResponse]:
     choices = raw.get("choices") or []
     if not choices:
         raise PerplexityClientError("Perplexity response did not include choices.")
@@ -147,4 +246,78 @@ def complete_json(
         search_results=_coerce_search_results(raw.get("search_results")),
         token_usage=raw.get("usage", {}),
     )
-    return json_payload, response
\ No newline at end of file
+    return json_payload, response
+
+
+def complete_json(
+    *,
+    user_prompt: str,
+    schema_description: str,
+    system_prompt: str,
+    model: str = "sonar-pro",
+    temperature: float = 0.1,
+    max_tokens: int = 800,
+    cache_ttl: Optional[int] = None,
+) -> tuple[dict[str, Any], PerplexityResponse]:
+    """Request a JSON-formatted completion from Perplexity.
+
+    Returns a tuple of the parsed JSON payload defined by the schema description and
+    the raw Perplexity response metadata. When ``cache_ttl`` is set, identical requests
+    within that many seconds are served from the completion cache and their
+    ``token_usage`` is zeroed and flagged with ``cached: True``.
+    """
+    system_directive = _build_system_directive(system_prompt, schema_description)
+    key = _cache_key(
+        model=model,
+        system_directive=system_directive,
+        schema_description=schema_description,
+        user_prompt=user_prompt,
+    )
+    cached = _cached_completion(key, cache_ttl)
+    if cached is not None:
+        return cached
+
+    payload = _build_payload(
+        user_prompt=user_prompt,
+        system_directive=system_directive,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+    )
+    result = _parse_completion(_post_payload(payload))
+    _store_completion(key, cache_ttl, result)
+    return result
+
+
+async def complete_json_async(
+    *,
+    user_prompt: str,
+    schema_description: str,
+    system_prompt: str,
+    model: str = "sonar-pro",
+    temperature: float = 0.1,
+    max_tokens: int = 800,
+    cache_ttl: Optional[int] = None,
+) -> tuple[dict[str, Any], PerplexityResponse]:
+    """Async variant of :func:`complete_json`; the cache is read and written in a worker thread."""
+    system_directive = _build_system_directive(system_prompt, schema_description)
+    key = _cache_key(
+        model=model,
+        system_directive=system_directive,
+        schema_description=schema_description,
+        user_prompt=user_prompt,
+    )
+    cached = await asyncio.to_thread(_cached_completion, key, cache_ttl)
+    if cached is not None:
+        return cached
+
+    payload = _build_payload(
+        user_prompt=user_prompt,
+        system_directive=system_directive,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+    )
+    result = _parse_completion(await _post_payload_async(payload))
+    await asyncio.to_thread(_store_completion, key, cache_ttl, result)
+    return result
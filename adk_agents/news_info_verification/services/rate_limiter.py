@@ -0,0 +1,291 @@
+"""Per-provider token-bucket rate limiting with priority classes.
+
+Requests to a provider wait in a priority queue until the bucket has a token, instead of
+going out and coming back as HTTP 429. Interactive verifications are served before
+batch and backfill traffic. A ``Retry-After`` from the provider pauses its whole queue.
+The same limiter serves threads (sync clients) and event loops (async clients).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterator, Optional
+
+from ..config import RATE_LIMIT_ENABLED, RATE_LIMITS
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 1
+PRIORITY_BACKFILL = 2
+PRIORITY_CLASSES = {
+    "interactive": PRIORITY_INTERACTIVE,
+    "batch": PRIORITY_BATCH,
+    "backfill": PRIORITY_BACKFILL,
+}
+
+# Upper bound on a single sleep so waiters re-check after a missed wake-up.
+_MAX_SLEEP = 1.0
+
+_current_priority: contextvars.ContextVar[int] = contextvars.ContextVar(
+    "rate_limit_priority", default=PRIORITY_INTERACTIVE
+)
+
+
+@contextlib.contextmanager
+def priority_class(priority: int) -> Iterator[None]:
+    """Tag outbound requests made inside the block (and tasks it spawns) with ``priority``."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> int:
+    return _current_priority.get()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass(frozen=True)
+class LimiterStats:
+    """Queue and wait counters for one provider since the process started."""
+
+    provider: str
+    rate_per_s: float
+    burst: int
+    queue_depth: int
+    granted: int
+    throttled: int
+    total_wait_s: float
+    max_wait_s: float
+    paused_for_s: float
+
+    @property
+    def avg_wait_s(self) -> float:
+        if self.granted <= 0:
+            return 0.0
+        return round(self.total_wait_s / self.granted, 4)
+
+
+def _sleep_for(delay: float, started: float, timeout: Optional[float]) -> float:
+    """How long a waiter may sleep before re-checking; raises once ``timeout`` has passed."""
+    if timeout is None:
+        return min(delay, _MAX_SLEEP)
+    left = started + timeout - time.monotonic()
+    if left <= 0:
+        raise TimeoutError("rate limiter wait exceeded the timeout")
+    return min(delay, _MAX_SLEEP, left)
+
+
+class _Waiter:
+    __slots__ = ("priority", "seq", "wake")
+
+    def __init__(self, priority: int, seq: int, wake: Callable[[], None]) -> None:
+        self.priority = priority
+        self.seq = seq
+        self.wake = wake
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate_per_s`` up to ``burst``, granting tokens in priority order."""
+
+    def __init__(self, provider: str, *, rate_per_s: float, burst: int) -> None:
+        self.provider = provider
+        self.rate_per_s = rate_per_s
+        self.burst = max(1, burst)
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._queue: list[_Waiter] = []
+        self._seq = itertools.count()
+        self._granted = 0
+        self._throttled = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_s)
+        self._updated = now
+
+    def _enqueue(self, priority: int, wake: Callable[[], None]) -> _Waiter:
+        with self._lock:
+            waiter = _Waiter(priority, next(self._seq), wake)
+            heapq.heappush(self._queue, waiter)
+            return waiter
+
+    def _try_grant(self, waiter: _Waiter) -> Optional[float]:
+        """Take a token for ``waiter`` if it is at the head; otherwise return how long to sleep."""
+        with self._lock:
+            if self._queue[0] is not waiter:
+                return _MAX_SLEEP
+            now = time.monotonic()
+            self._refill(now)
+            delay = max(self._paused_until - now, (1 - self._tokens) / self.rate_per_s if self._tokens < 1 else 0.0)
+            if delay > 0:
+                return delay
+            self._tokens -= 1
+            heapq.heappop(self._queue)
+            head = self._queue[0] if self._queue else None
+        if head is not None:
+            head.wake()
+        return None
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        with self._lock:
+            if waiter not in self._queue:
+                return
+            self._queue.remove(waiter)
+            heapq.heapify(self._queue)
+            head = self._queue[0] if self._queue else None
+        if head is not None:
+            head.wake()
+
+    def _record(self, waited: float) -> float:
+        with self._lock:
+            self._granted += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+        return waited
+
+    def acquire(self, priority: Optional[int] = None, *, timeout: Optional[float] = None) -> float:
+        """Block the calling thread until a token is granted; returns the seconds waited.
+
+        Raises ``TimeoutError`` if no token is granted within ``timeout`` seconds.
+        """
+        started = time.monotonic()
+        event = threading.Event()
+        waiter = self._enqueue(current_priority() if priority is None else priority, event.set)
+        try:
+            while True:
+                # Clear before checking so a wake-up that lands mid-check is not lost.
+                event.clear()
+                delay = self._try_grant(waiter)
+                if delay is None:
+                    break
+                event.wait(_sleep_for(delay, started, timeout))
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        return self._record(time.monotonic() - started)
+
+    async def acquire_async(self, priority: Optional[int] = None, *, timeout: Optional[float] = None) -> float:
+        """Await a token without blocking the event loop; returns the seconds waited.
+
+        Raises ``TimeoutError`` if no token is granted within ``timeout`` seconds.
+        """
+        started = time.monotonic()
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        waiter = self._enqueue(
+            current_priority() if priority is None else priority,
+            lambda: loop.call_soon_threadsafe(event.set),
+        )
+        try:
+            while True:
+                event.clear()
+                delay = self._try_grant(waiter)
+                if delay is None:
+                    break
+                sleep = _sleep_for(delay, started, timeout)
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(event.wait(), timeout=sleep)
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        return self._record(time.monotonic() - started)
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is free right now and nobody is queued ahead."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._queue or self._tokens < 1 or self._paused_until > now:
+                return False
+            self._tokens -= 1
+            self._granted += 1
+            return True
+
+    def pause(self, seconds: float) -> None:
+        """Hold every queued request for ``seconds`` (e.g. after a 429 with ``Retry-After``)."""
+        with self._lock:
+            self._throttled += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + max(0.0, seconds))
+            self._tokens = min(self._tokens, 0.0)
+
+    def stats(self) -> LimiterStats:
+        with self._lock:
+            return LimiterStats(
+                provider=self.provider,
+                rate_per_s=self.rate_per_s,
+                burst=self.burst,
+                queue_depth=len(self._queue),
+                granted=self._granted,
+                throttled=self._throttled,
+                total_wait_s=round(self._total_wait, 4),
+                max_wait_s=round(self._max_wait, 4),
+                paused_for_s=round(max(0.0, self._paused_until - time.monotonic()), 4),
+            )
+
+
+_buckets_lock = threading.Lock()
+_buckets: dict[str, TokenBucket] = {}
+
+
+def limiter_for(provider: str) -> Optional[TokenBucket]:
+    """Return the bucket for ``provider``, or ``None`` when it is not rate limited."""
+    if not RATE_LIMIT_ENABLED:
+        return None
+    bucket = _buckets.get(provider)
+    if bucket is not None:
+        return bucket
+    rate_per_min, burst = RATE_LIMITS.get(provider, (0, 0))
+    if rate_per_min <= 0:
+        return None
+    with _buckets_lock:
+        if provider not in _buckets:
+            _buckets[provider] = TokenBucket(provider, rate_per_s=rate_per_min / 60.0, burst=burst)
+        return _buckets[provider]
+
+
+def configure(provider: str, *, rate_per_min: float, burst: int) -> None:
+    """Override a provider's limits at runtime; ``rate_per_min <= 0`` removes the limit."""
+    with _buckets_lock:
+        _buckets.pop(provider, None)
+        RATE_LIMITS[provider] = (rate_per_min, burst)
+
+
+def stats() -> dict[str, LimiterStats]:
+    """Snapshot queue depth and wait times for every provider that has seen traffic."""
+    with _buckets_lock:
+        buckets = list(_buckets.values())
+    return {bucket.provider: bucket.stats() for bucket in buckets}
+
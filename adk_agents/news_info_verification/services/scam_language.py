@@ -0,0 +1,252 @@
+"""Local scam-language scorer: a phrase lexicon matched with Aho-Corasick.
+
+Scores the manipulation cues that ScamSentimentAgent otherwise asks Gemini for:
+urgency, fear, authority impersonation, reward framing, and requests for money or
+credentials. All phrases are compiled into one Aho-Corasick automaton, so a message
+is scanned once, in time linear in its length, however large the lexicon grows.
+Matching is case-insensitive, treats runs of whitespace and curly apostrophes like
+their plain forms, and only accepts whole-word hits.
+
+:func:`score` returns the ScamSentimentAgent payload (``status``, ``risk_level``,
+``confidence``, ``triggers`` with the exact excerpts, ``notes``). It adds ``score`` in
+[0, 1], and ``ambiguous`` when the score falls between ``SCAM_SCORER_GATE_LOW`` and
+``SCAM_SCORER_GATE_HIGH``; in gate mode, only those messages go to the LLM.
+
+Fear, authority and reward phrases also appear in ordinary news ("the police department
+says the lottery winner claimed the jackpot"). A scam asks the reader to do something,
+so without a request or urgency cue those categories only count for
+``_CONTEXT_ONLY_FACTOR`` of their weight.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections import deque
+from typing import Any, Iterable, Iterator, Mapping
+
+from ..config import SCAM_SCORER_GATE_HIGH, SCAM_SCORER_GATE_LOW, SCAM_SCORER_MAX_CHARS
+
+MAX_TRIGGERS = 10
+
+# Category -> weight of its strongest hit. Further distinct hits add _REPEAT_BONUS each.
+CATEGORY_WEIGHTS = {
+    "urgency": 0.2,
+    "fear": 0.25,
+    "authority": 0.2,
+    "reward": 0.25,
+    "request": 0.3,
+}
+_REPEAT_BONUS = 0.05
+# Categories that ask the reader to act; without one, the others are scaled down.
+_ACTION_CATEGORIES = frozenset({"request", "urgency"})
+_CONTEXT_ONLY_FACTOR = 0.4
+
+LEXICON: Mapping[str, tuple[str, ...]] = {
+    "urgency": (
+        "act now", "act fast", "act immediately", "urgent", "urgently", "immediately", "right away",
+        "as soon as possible", "within 24 hours", "within 48 hours", "within 2 hours", "expires today",
+        "expires soon", "last chance", "final notice", "final warning", "limited time", "today only",
+        "don't delay", "do not delay", "before it's too late", "time sensitive", "respond now", "reply now",
+        "only a few hours", "offer ends", "hurry",
+    ),
+    "fear": (
+        "account has been suspended", "account suspended", "account will be suspended", "account has been locked",
+        "account locked", "account will be closed", "account will be deactivated", "unauthorized access",
+        "unauthorised access", "suspicious activity", "unusual activity", "unusual sign-in", "security alert",
+        "has been compromised", "legal action", "arrest warrant", "will be arrested", "lawsuit", "penalty",
+        "penalties", "fined", "your device is infected", "virus detected", "account frozen", "has been frozen",
+        "overdue", "failure to comply", "failure to respond",
+    ),
+    "authority": (
+        "irs", "hmrc", "social security administration", "internal revenue service", "fbi", "police department",
+        "customs", "tax office", "tax authority", "microsoft support", "apple support", "amazon security",
+        "paypal security", "bank security team", "fraud department", "government grant", "official notice",
+        "court order", "department of justice", "immigration office", "technical support", "tech support",
+        "your bank",
+    ),
+    "reward": (
+        "you have won", "you've won", "congratulations", "claim your prize", "claim your reward",
+        "cash prize", "free gift", "lottery", "jackpot", "winner", "guaranteed returns",
+        "guaranteed profit", "double your money", "risk-free", "risk free", "inheritance", "unclaimed funds",
+        "refund", "tax rebate", "bonus", "exclusive offer", "100% free", "investment opportunity",
+    ),
+    "request": (
+        "verify your account", "verify your identity", "confirm your account", "confirm your identity",
+        "confirm your password", "verify your password", "update your password", "enter your password",
+        "enter your pin", "one-time code", "one time code", "otp", "verification code", "security code",
+        "bank details", "card details", "card number", "account number", "routing number",
+        "social security number", "wire transfer", "wire the money", "send money", "gift card", "gift cards",
+        "itunes card", "bitcoin", "crypto wallet", "western union", "moneygram", "processing fee", "pay the fee",
+        "release fee", "click the link", "click here", "click below", "log in to", "login to",
+        "update your payment", "update your billing", "download the attachment", "remote access",
+    ),
+}
+
+
+class PhraseMatcher:
+    """Aho-Corasick automaton over lowercase phrases.
+
+    :meth:`finditer` yields ``(start, end, phrase_index)`` for every occurrence,
+    including overlapping ones, in a single pass over the text.
+    """
+
+    def __init__(self, phrases: Iterable[str]) -> None:
+        self.phrases = tuple(phrases)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        for index, phrase in enumerate(self.phrases):
+            node = 0
+            for char in phrase:
+                following = self._goto[node].get(char)
+                if following is None:
+                    following = len(self._goto)
+                    self._goto[node][char] = following
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                node = following
+            self._out[node] += (index,)
+        # Breadth-first failure links; each node inherits the outputs of its fallback.
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, following in self._goto[node].items():
+                queue.append(following)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[following] = target if target != following else 0
+                self._out[following] += self._out[self._fail[following]]
+
+    def finditer(self, text: str) -> Iterator[tuple[int, int, int]]:
+        goto, fail, out, phrases = self._goto, self._fail, self._out, self.phrases
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for index in out[node]:
+                yield position - len(phrases[index]) + 1, position + 1, index
+
+
+_APOSTROPHES = str.maketrans({"’": "'", "‘": "'", "ʼ": "'"})
+
+
+def _normalize(text: str) -> tuple[str, list[int]]:
+    """Lowercase text with whitespace runs collapsed, plus each character's offset in ``text``."""
+    chars: list[str] = []
+    offsets: list[int] = []
+    previous_space = True
+    for offset, char in enumerate(text.translate(_APOSTROPHES)):
+        if char.isspace():
+            if previous_space:
+                continue
+            char = " "
+            previous_space = True
+        else:
+            lowered = char.lower()
+            char = lowered if len(lowered) == 1 else char
+            previous_space = False
+        chars.append(char)
+        offsets.append(offset)
+    return "".join(chars), offsets
+
+
+@functools.lru_cache(maxsize=1)
+def _matcher() -> tuple[PhraseMatcher, tuple[str, ...]]:
+    entries = [(" ".join(phrase.lower().split()), category) for category, phrases in LEXICON.items() for phrase in phrases]
+    return PhraseMatcher(phrase for phrase, _ in entries), tuple(category for _, category in entries)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def find_triggers(text: str) -> list[tuple[str, str, str]]:
+    """Whole-word lexicon hits in ``text`` as ``(category, phrase, excerpt)``, in text order.
+
+    Only the first ``SCAM_SCORER_MAX_CHARS`` characters are scanned; hits contained in a
+    longer hit of the same category are dropped.
+    """
+    sample = text[:SCAM_SCORER_MAX_CHARS] if SCAM_SCORER_MAX_CHARS > 0 else text
+    normalized, offsets = _normalize(sample)
+    matcher, categories = _matcher()
+    spans: list[tuple[int, int, int]] = []
+    for start, end, index in matcher.finditer(normalized):
+        if start > 0 and _is_word_char(normalized[start - 1]) and _is_word_char(normalized[start]):
+            continue
+        if end < len(normalized) and _is_word_char(normalized[end]) and _is_word_char(normalized[end - 1]):
+            continue
+        spans.append((start, end, index))
+    spans.sort(key=lambda span: (span[0], -span[1]))
+    hits: list[tuple[str, str, str]] = []
+    covered: dict[str, int] = {}
+    for start, end, index in spans:
+        category = categories[index]
+        if end <= covered.get(category, -1):
+            continue
+        covered[category] = end
+        hits.append((category, matcher.phrases[index], sample[offsets[start]:offsets[end - 1] + 1]))
+    return hits
+
+
+def _confidence(value: float, level: str) -> float:
+    if level == "high":
+        span = max(1e-9, 1.0 - SCAM_SCORER_GATE_HIGH)
+        return round(0.6 + 0.35 * min(1.0, (value - SCAM_SCORER_GATE_HIGH) / span), 2)
+    if level == "low" and value <= SCAM_SCORER_GATE_LOW:
+        return round(0.6 + 0.3 * (1.0 - value / SCAM_SCORER_GATE_LOW), 2) if SCAM_SCORER_GATE_LOW > 0 else 0.9
+    return 0.4
+
+
+def score(text: str) -> dict[str, Any]:
+    """Score ``text`` for scam language and return a ScamSentimentAgent-shaped payload."""
+    if not text or not text.strip():
+        return {
+            "status": "no_data",
+            "risk_level": "low",
+            "confidence": 0.0,
+            "triggers": [],
+            "notes": "No message text to score.",
+            "score": 0.0,
+            "ambiguous": False,
+        }
+    hits = find_triggers(text)
+    by_category: dict[str, set[str]] = {}
+    for category, phrase, _ in hits:
+        by_category.setdefault(category, set()).add(phrase)
+    weights = [CATEGORY_WEIGHTS[category] + _REPEAT_BONUS * (len(phrases) - 1) for category, phrases in by_category.items()]
+    value = min(1.0, float(sum(weights)))
+    context_only = bool(by_category) and not _ACTION_CATEGORIES & by_category.keys()
+    if context_only:
+        value *= _CONTEXT_ONLY_FACTOR
+    if value >= SCAM_SCORER_GATE_HIGH:
+        level = "high"
+    elif value > SCAM_SCORER_GATE_LOW:
+        level = "medium"
+    else:
+        level = "low"
+
+    triggers = []
+    seen: set[tuple[str, str]] = set()
+    for category, _, excerpt in hits:
+        if (category, excerpt.lower()) in seen:
+            continue
+        seen.add((category, excerpt.lower()))
+        triggers.append({"excerpt": excerpt, "pattern": category})
+        if len(triggers) >= MAX_TRIGGERS:
+            break
+    cues = ", ".join(f"{category} ({len(phrases)})" for category, phrases in by_category.items())
+    if context_only:
+        cues += "; no request or urgency cue"
+    return {
+        "status": "ok",
+        "risk_level": level,
+        "confidence": _confidence(value, level),
+        "triggers": triggers,
+        "notes": f"Lexicon cues: {cues}; score {value:.2f}." if cues else "No scam-language cues in the lexicon matched.",
+        "score": round(value, 3),
+        "ambiguous": SCAM_SCORER_GATE_LOW < value < SCAM_SCORER_GATE_HIGH,
+    }
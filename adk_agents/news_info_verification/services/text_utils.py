@@ -5,27 +5,22 @@ from __future__ import annotations
 import re
 from typing import Iterable, Optional
 
-_URL_REGEX = re.compile(
-    r"(?P<url>(?:https?://|www\.)[\w\-._~:/?#\[\]@!$&'()*+,;=%]+)",
-    re.IGNORECASE,
-)
+from . import url_extraction
+
 _SENTENCE_SPLIT_REGEX = re.compile(r"(?<=[.!?])\s+")
+_WHITESPACE_REGEX = re.compile(r"\s+")
 
 
-def extract_urls(text: str) -> list[str]:
-    """Return a de-duplicated list of URLs discovered in text."""
-    if not text:
-        return []
-    matches = _URL_REGEX.finditer(text)
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for match in matches:
-        url = match.group("url")
-        normalized = url if url.startswith("http") else f"https://{url}"
-        if normalized not in seen:
-            seen.add(normalized)
-            ordered.append(normalized)
-    return ordered
+def extract_urls(text: str, *, limit: Optional[int] = None) -> list[str]:
+    """Return the URLs in text as written, de-duplicated on their canonical form.
+
+    Bare ``www.`` links get an ``https://`` prefix. Use :func:`url_extraction.extract`
+    when the canonical form is needed too.
+    """
+    return [
+        url.raw if url.raw[:4].lower() != "www." else f"https://{url.raw}"
+        for url in url_extraction.iter_urls(text, limit=limit)
+    ]
 
 
 def truncate_sentences(sentences: Iterable[str], *, limit: int = 80) -> str:
@@ -48,3 +43,10 @@ def split_sentences(text: str, *, max_sentences: Optional[int] = None) -> list[s
     if max_sentences is None:
         return sentences
     return sentences[:max_sentences]
+
+
+def normalize_query(text: str) -> str:
+    """Lowercase text and collapse whitespace so equivalent queries share cache keys."""
+    if not text:
+        return ""
+    return _WHITESPACE_REGEX.sub(" ", text).strip().strip(".!?;:,").strip().lower()
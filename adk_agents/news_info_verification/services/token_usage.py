@@ -0,0 +1,175 @@
+"""Token and cost accounting for Gemini and Perplexity calls.
+
+Each verification request gets a :class:`UsageLedger`, carried in a context variable so
+that parallel lanes, AgentTool sub-runs and worker threads all charge the same ledger.
+Every recorded call is also added to the process-wide counters in :mod:`metrics`. A
+ledger with a ``budget`` reports :meth:`UsageLedger.exhausted` once the prompt plus
+completion tokens reach it, and callers stop issuing model calls from then on.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Mapping, Optional
+
+from ..config import LLM_PRICES
+from . import metrics
+
+PROVIDER_GEMINI = "gemini"
+PROVIDER_PERPLEXITY = "perplexity"
+
+STATUS_BUDGET_EXCEEDED = "budget_exceeded"
+BUDGET_EXCEEDED_NOTE = "Skipped: the request's token budget is exhausted."
+
+_current_ledger: contextvars.ContextVar[Optional["UsageLedger"]] = contextvars.ContextVar(
+    "token_usage_ledger", default=None
+)
+
+
+def estimate_cost(provider: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Estimated USD cost of one call from the ``LLM_PRICES`` table."""
+    input_per_m, output_per_m, per_request = LLM_PRICES.get(provider, (0.0, 0.0, 0.0))
+    return prompt_tokens * input_per_m / 1_000_000 + completion_tokens * output_per_m / 1_000_000 + per_request
+
+
+@dataclass
+class Usage:
+    """Token and cost totals for one slice of a request (an agent, a lane, a provider)."""
+
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def add(self, prompt_tokens: int, completion_tokens: int, cost_usd: float) -> None:
+        self.calls += 1
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.cost_usd += cost_usd
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "total_tokens": self.total_tokens, "cost_usd": round(self.cost_usd, 6)}
+
+
+class UsageLedger:
+    """Per-request usage, broken down by provider, agent and lane."""
+
+    def __init__(self, budget: Optional[int] = None) -> None:
+        self.budget = budget if budget and budget > 0 else None
+        self._lock = threading.Lock()
+        self.total = Usage()
+        self.by_provider: dict[str, Usage] = {}
+        self.by_agent: dict[str, Usage] = {}
+        self.by_lane: dict[str, Usage] = {}
+        self.skipped_calls = 0
+
+    def add(self, provider: str, agent: str, lane: str, prompt_tokens: int, completion_tokens: int, cost_usd: float) -> None:
+        with self._lock:
+            self.total.add(prompt_tokens, completion_tokens, cost_usd)
+            for bucket, key in ((self.by_provider, provider), (self.by_agent, agent), (self.by_lane, lane)):
+                bucket.setdefault(key, Usage()).add(prompt_tokens, completion_tokens, cost_usd)
+
+    def exhausted(self) -> bool:
+        return self.budget is not None and self.total.total_tokens >= self.budget
+
+    def skip(self) -> None:
+        with self._lock:
+            self.skipped_calls += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-friendly view written to session state."""
+        with self._lock:
+            return {
+                **self.total.as_dict(),
+                "budget_tokens": self.budget,
+                "budget_exhausted": self.exhausted(),
+                "skipped_calls": self.skipped_calls,
+                "by_provider": {key: usage.as_dict() for key, usage in sorted(self.by_provider.items())},
+                "by_agent": {key: usage.as_dict() for key, usage in sorted(self.by_agent.items())},
+                "by_lane": {key: usage.as_dict() for key, usage in sorted(self.by_lane.items())},
+            }
+
+
+def start(budget: Optional[int] = None) -> UsageLedger:
+    """Open a ledger for the current request; tasks and threads started afterwards inherit it."""
+    ledger = UsageLedger(budget)
+    _current_ledger.set(ledger)
+    return ledger
+
+
+def finish() -> None:
+    _current_ledger.set(None)
+
+
+def current() -> Optional[UsageLedger]:
+    return _current_ledger.get()
+
+
+def budget_exhausted() -> bool:
+    """Whether the current request has used up its token budget."""
+    ledger = _current_ledger.get()
+    return ledger is not None and ledger.exhausted()
+
+
+def record(
+    provider: str,
+    agent: str,
+    lane: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    *,
+    cost_usd: Optional[float] = None,
+) -> None:
+    """Charge one model call to the current request's ledger and the cumulative metrics."""
+    prompt_tokens = max(0, int(prompt_tokens or 0))
+    completion_tokens = max(0, int(completion_tokens or 0))
+    if cost_usd is None:
+        cost_usd = estimate_cost(provider, prompt_tokens, completion_tokens)
+    ledger = _current_ledger.get()
+    if ledger is not None:
+        ledger.add(provider, agent, lane, prompt_tokens, completion_tokens, cost_usd)
+    if metrics.enabled():
+        metrics.LLM_TOKENS.inc(provider, agent, lane, "prompt", amount=prompt_tokens)
+        metrics.LLM_TOKENS.inc(provider, agent, lane, "completion", amount=completion_tokens)
+        metrics.LLM_COST.inc(provider, agent, lane, amount=cost_usd)
+
+
+def record_skip(provider: str, agent: str) -> None:
+    """Count a model call that was not made because the budget was exhausted."""
+    ledger = _current_ledger.get()
+    if ledger is not None:
+        ledger.skip()
+    if metrics.enabled():
+        metrics.LLM_BUDGET_SKIPS.inc(provider, agent)
+
+
+def record_perplexity(usage: Mapping[str, Any], agent: str, lane: str) -> None:
+    """Charge a Perplexity ``usage`` block; cache hits (``cached: True``) cost nothing."""
+    if not isinstance(usage, Mapping) or usage.get("cached"):
+        return
+    cost = usage.get("cost")
+    reported = cost.get("total_cost") if isinstance(cost, Mapping) else None
+    record(
+        PROVIDER_PERPLEXITY,
+        agent,
+        lane,
+        usage.get("prompt_tokens") or 0,
+        usage.get("completion_tokens") or 0,
+        cost_usd=float(reported) if isinstance(reported, (int, float)) else None,
+    )
+
+
+def accumulate(previous: Optional[Mapping[str, Any]], snapshot: Mapping[str, Any]) -> dict[str, Any]:
+    """Add one request's snapshot to a session's running totals."""
+    totals = dict(previous or {})
+    totals["requests"] = int(totals.get("requests", 0)) + 1
+    for key in ("calls", "prompt_tokens", "completion_tokens", "total_tokens", "skipped_calls"):
+        totals[key] = int(totals.get(key, 0)) + int(snapshot.get(key, 0))
+    totals["cost_usd"] = round(float(totals.get("cost_usd", 0.0)) + float(snapshot.get("cost_usd", 0.0)), 6)
+    return totals
@@ -0,0 +1,170 @@
+"""URL extraction and canonicalization for user submissions.
+
+Submissions can be multi-megabyte pasted email dumps, so extraction only looks at the
+first ``URL_SCAN_MAX_CHARS`` characters. It scans them in ``URL_SCAN_CHUNK_CHARS``
+windows with a single-character-class pattern, which keeps the work linear in the
+input, and it can stop as soon as ``limit`` distinct URLs have been found.
+
+Every hit keeps the ``raw`` text as it appeared, minus trailing punctuation, and a
+``canonical`` form used for de-duplication and cache keys. Canonicalization lowercases
+the scheme and host, IDNA-encodes the host, drops default ports, ``utm_*`` and click-id
+parameters, and the fragment, and gives bare ``www.`` links an ``https`` scheme.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterator, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from ..config import URL_MAX_LENGTH, URL_SCAN_CHUNK_CHARS, URL_SCAN_MAX_CHARS
+
+_URL_PATTERN = re.compile(
+    r"(?<![\w.\-])(?:https?://|www\.)[\w\-._~:/?#\[\]@!$&'()*+,;=%]+",
+    re.IGNORECASE,
+)
+_TRAILING_PUNCTUATION = ".,;:!?'\"*"
+_CLOSING_BRACKETS = {")": "(", "]": "["}
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_TRACKING_PREFIXES = ("utm_",)
+_TRACKING_PARAMS = frozenset(
+    {"fbclid", "gclid", "dclid", "gbraid", "wbraid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid", "_hsenc", "_hsmi"}
+)
+_IPV4_PATTERN = re.compile(r"^\d{1,3}(?:\.\d{1,3}){3}$")
+_SECOND_LEVEL_SUFFIXES = frozenset(
+    f"{second}.{country}"
+    for country in (
+        "uk", "au", "nz", "za", "jp", "in", "br", "mx", "sg", "hk", "tw", "kr", "tr", "ar", "ng", "ke", "id", "my", "ph", "th"
+    )
+    for second in ("co", "com", "net", "org", "gov", "edu", "ac", "or", "ne", "go")
+)
+
+
+@dataclass(frozen=True)
+class ExtractedUrl:
+    """A URL found in text: ``raw`` as written (trimmed) and its ``canonical`` form."""
+
+    raw: str
+    canonical: str
+
+
+def trim_url(candidate: str) -> str:
+    """Strip sentence punctuation and unbalanced closing brackets from the end of a URL."""
+    url = candidate
+    while url:
+        last = url[-1]
+        if last in _TRAILING_PUNCTUATION:
+            url = url[:-1]
+        elif last in _CLOSING_BRACKETS and url.count(last) > url.count(_CLOSING_BRACKETS[last]):
+            url = url[:-1]
+        else:
+            break
+    return url
+
+
+def normalize_host(host: str) -> str:
+    """Lowercase ``host``, drop a trailing dot and IDNA-encode non-ASCII labels."""
+    host = host.strip().rstrip(".").lower()
+    if host.isascii():
+        return host
+    try:
+        return host.encode("idna").decode("ascii")
+    except UnicodeError:
+        return host
+
+
+def registered_domain(host: str) -> str:
+    """Approximate the registrable domain of a normalized host (``a.b.example.co.uk`` -> ``example.co.uk``).
+
+    This is a heuristic without the Public Suffix List: it keeps the last two labels, or
+    three when the last two form a common second-level suffix such as ``co.uk``.
+    """
+    labels = host.split(".")
+    if len(labels) <= 2 or _IPV4_PATTERN.match(host) or ":" in host:
+        return host
+    keep = 3 if ".".join(labels[-2:]) in _SECOND_LEVEL_SUFFIXES else 2
+    return ".".join(labels[-keep:])
+
+
+def _is_tracking(param: str) -> bool:
+    key = param.split("=", 1)[0].lower()
+    return key in _TRACKING_PARAMS or key.startswith(_TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: str) -> Optional[str]:
+    """Return the canonical form of an http(s) URL, or ``None`` when it has no usable host."""
+    candidate = url.strip()
+    if candidate[:4].lower() == "www.":
+        candidate = f"https://{candidate}"
+    try:
+        parts = urlsplit(candidate)
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    host = normalize_host(parts.hostname or "")
+    if scheme not in _DEFAULT_PORTS or not host:
+        return None
+
+    netloc = host
+    if ":" in netloc:
+        netloc = f"[{netloc}]"
+    if port is not None and port != _DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{port}"
+    # Credentials stay: "https://bank.example@evil.example" must not look like bank.example.
+    userinfo = parts.netloc.rpartition("@")[0]
+    if userinfo:
+        netloc = f"{userinfo}@{netloc}"
+
+    query = "&".join(param for param in parts.query.split("&") if param and not _is_tracking(param))
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
+def _windows(length: int, chunk_chars: int) -> Iterator[tuple[int, int]]:
+    step = max(chunk_chars, URL_MAX_LENGTH + 1)
+    for start in range(0, length, step):
+        yield start, min(length, start + step)
+
+
+def iter_urls(
+    text: str,
+    *,
+    limit: Optional[int] = None,
+    max_chars: int = URL_SCAN_MAX_CHARS,
+    chunk_chars: int = URL_SCAN_CHUNK_CHARS,
+) -> Iterator[ExtractedUrl]:
+    """Yield URLs from ``text`` in order, de-duplicated on their canonical form.
+
+    Only the first ``max_chars`` characters are scanned (``<= 0`` scans everything).
+    URLs longer than ``URL_MAX_LENGTH`` are skipped.
+    """
+    if not text:
+        return
+    end = min(len(text), max_chars) if max_chars > 0 else len(text)
+    seen: set[str] = set()
+    position = 0
+    for window_start, window_end in _windows(end, chunk_chars):
+        # A URL that straddles the previous window was already taken in full.
+        for match in _URL_PATTERN.finditer(text, max(position, window_start), window_end):
+            stop = match.end()
+            if stop == window_end < end:
+                # The URL may continue in the next window; finish it there.
+                extended = _URL_PATTERN.match(text, match.start(), min(end, match.start() + URL_MAX_LENGTH + 1))
+                stop = extended.end() if extended else stop
+            position = stop
+            raw = trim_url(text[match.start():stop])
+            if len(raw) > URL_MAX_LENGTH:
+                continue
+            canonical = canonicalize_url(raw)
+            if canonical is None or canonical in seen:
+                continue
+            seen.add(canonical)
+            yield ExtractedUrl(raw=raw, canonical=canonical)
+            if limit is not None and len(seen) >= limit:
+                return
+
+
+def extract(text: str, *, limit: Optional[int] = None) -> list[ExtractedUrl]:
+    """List the distinct URLs in ``text``; see :func:`iter_urls`."""
+    return list(iter_urls(text, limit=limit))
@@ -0,0 +1,296 @@
+"""Durable per-lane verdicts keyed by claim fingerprint.
+
+Completed verifications are kept in SQLite so a repeated claim does not rerun every
+lane after a restart. Each lane's Markdown summary and raw worker signals form one row
+with its own expiry, because the lanes age differently:
+
+* news results go stale in minutes (``VERDICT_TTL_NEWS``);
+* fact-check results last days (``VERDICT_TTL_FACT``);
+* scam results last ``VERDICT_TTL_SCAM`` at most, and never beyond the earliest
+  ``valid_until`` in the VirusTotal signal, i.e. the URL's last analysis plus the
+  VirusTotal cache TTL for its verdict.
+
+A lane whose workers errored or timed out is not stored. The final report is stored
+alongside and expires with the first of its lanes. Claims are keyed by
+:func:`near_duplicates.fingerprint`, so case, punctuation and tracking-parameter
+variants share rows.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+
+from ..config import (
+    STATE_KEYS,
+    VERDICT_STORE_ENABLED,
+    VERDICT_STORE_MAX_CLAIMS,
+    VERDICT_STORE_PATH,
+    VERDICT_TTL_FACT,
+    VERDICT_TTL_NEWS,
+    VERDICT_TTL_SCAM,
+)
+
+# Lane -> (summary state key, worker signal state keys).
+LANE_KEYS = {
+    "news": (STATE_KEYS.NEWS_SUMMARY, (STATE_KEYS.NEWS_API, STATE_KEYS.NEWS_FACT, STATE_KEYS.NEWS_PERPLEXITY)),
+    "fact": (STATE_KEYS.FACT_SUMMARY, (STATE_KEYS.FACT_PRIMARY, STATE_KEYS.FACT_PERPLEXITY)),
+    "scam": (
+        STATE_KEYS.SCAM_SUMMARY,
+        (STATE_KEYS.SCAM_SENTIMENT, STATE_KEYS.SCAM_PERPLEXITY, STATE_KEYS.SCAM_LINK),
+    ),
+}
+LANE_TTLS = {"news": VERDICT_TTL_NEWS, "fact": VERDICT_TTL_FACT, "scam": VERDICT_TTL_SCAM}
+
+_FAILED_STATUSES = frozenset({"error", "timeout"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS lanes (
+    fingerprint TEXT NOT NULL,
+    lane TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    signals TEXT NOT NULL,
+    verified_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (fingerprint, lane)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS lanes_expires_at ON lanes (expires_at);
+CREATE TABLE IF NOT EXISTS reports (
+    fingerprint TEXT PRIMARY KEY,
+    claim TEXT NOT NULL,
+    report TEXT NOT NULL,
+    skip_reasons TEXT,
+    lanes TEXT NOT NULL,
+    verified_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reports_verified_at ON reports (verified_at);
+"""
+
+
+@dataclass(frozen=True)
+class LaneVerdict:
+    """One lane's stored result: its summary and the worker signals behind it."""
+
+    lane: str
+    summary: str
+    signals: dict[str, Any]
+    verified_at: float
+    expires_at: float
+
+
+@dataclass(frozen=True)
+class StoredReport:
+    """The final report of a stored verification and the lanes it was built from."""
+
+    report: str
+    skip_reasons: Optional[dict[str, str]]
+    lanes: tuple[str, ...]
+    verified_at: float
+    expires_at: float
+
+
+def lane_expiry(lane: str, signals: Mapping[str, Mapping[str, Any]], now: Optional[float] = None) -> float:
+    """When a lane result built from the parsed worker ``signals`` goes stale.
+
+    Returns ``now`` (already stale) when any worker failed.
+    """
+    now = time.time() if now is None else now
+    if any(signal.get("status") in _FAILED_STATUSES for signal in signals.values()):
+        return now
+    expires = now + LANE_TTLS.get(lane, 0)
+    valid_until = signals.get(STATE_KEYS.SCAM_LINK, {}).get("valid_until") if lane == "scam" else None
+    if isinstance(valid_until, (int, float)):
+        expires = min(expires, float(valid_until))
+    return expires
+
+
+class VerdictStore:
+    """SQLite-backed lane verdicts and reports, bounded to ``max_claims`` fingerprints.
+
+    Uses WAL mode like :class:`cache_store.SqliteTTLCache`, so several worker processes
+    can share one file. Expired rows are dropped on write, and past ``max_claims`` the
+    oldest claims go first.
+    """
+
+    def __init__(self, path: str, *, max_claims: int = VERDICT_STORE_MAX_CLAIMS) -> None:
+        self.path = path
+        self.max_claims = max(1, max_claims)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def fresh_lanes(self, fingerprint: str, *, now: Optional[float] = None) -> dict[str, LaneVerdict]:
+        """Stored lane results for ``fingerprint`` that have not expired yet."""
+        now = time.time() if now is None else now
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT lane, summary, signals, verified_at, expires_at FROM lanes WHERE fingerprint = ? AND expires_at > ?",
+                (fingerprint, now),
+            ).fetchall()
+        return {
+            lane: LaneVerdict(lane, summary, json.loads(signals), verified_at, expires_at)
+            for lane, summary, signals, verified_at, expires_at in rows
+        }
+
+    def report(self, fingerprint: str, *, now: Optional[float] = None) -> Optional[StoredReport]:
+        """The stored final report for ``fingerprint`` while every lane behind it is fresh."""
+        now = time.time() if now is None else now
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT report, skip_reasons, lanes, verified_at, expires_at FROM reports "
+                "WHERE fingerprint = ? AND expires_at > ?",
+                (fingerprint, now),
+            ).fetchone()
+        if row is None:
+            return None
+        report, skip_reasons, lanes, verified_at, expires_at = row
+        return StoredReport(
+            report, json.loads(skip_reasons) if skip_reasons else None, tuple(json.loads(lanes)), verified_at, expires_at
+        )
+
+    def save(
+        self,
+        fingerprint: str,
+        claim: str,
+        lanes: Mapping[str, LaneVerdict],
+        *,
+        report: Optional[str] = None,
+        skip_reasons: Optional[Mapping[str, str]] = None,
+        report_lanes: tuple[str, ...] = (),
+    ) -> None:
+        """Upsert lane results, and the report when every lane in ``report_lanes`` is stored."""
+        now = time.time()
+        fresh = {lane: verdict for lane, verdict in lanes.items() if verdict.expires_at > now}
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO lanes (fingerprint, lane, summary, signals, verified_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (fingerprint, lane, v.summary, json.dumps(v.signals, separators=(",", ":")), v.verified_at, v.expires_at)
+                        for lane, v in fresh.items()
+                    ],
+                )
+                placeholders = ",".join("?" * len(report_lanes))
+                expiries = (
+                    conn.execute(
+                        f"SELECT expires_at FROM lanes WHERE fingerprint = ? AND expires_at > ? AND lane IN ({placeholders})",
+                        (fingerprint, now, *report_lanes),
+                    ).fetchall()
+                    if report_lanes
+                    else []
+                )
+                if report and report_lanes and len(expiries) == len(report_lanes):
+                    conn.execute(
+                        "INSERT OR REPLACE INTO reports "
+                        "(fingerprint, claim, report, skip_reasons, lanes, verified_at, expires_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            fingerprint,
+                            claim,
+                            report,
+                            json.dumps(dict(skip_reasons)) if skip_reasons else None,
+                            json.dumps(list(report_lanes)),
+                            now,
+                            min(row[0] for row in expiries),
+                        ),
+                    )
+                else:
+                    conn.execute("DELETE FROM reports WHERE fingerprint = ?", (fingerprint,))
+                self._evict(conn, now)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute("DELETE FROM lanes WHERE expires_at <= ?", (now,))
+        conn.execute("DELETE FROM reports WHERE expires_at <= ?", (now,))
+        (count,) = conn.execute("SELECT COUNT(DISTINCT fingerprint) FROM lanes").fetchone()
+        overflow = count - self.max_claims
+        if overflow > 0:
+            oldest = "SELECT fingerprint FROM lanes GROUP BY fingerprint ORDER BY MAX(verified_at) ASC LIMIT ?"
+            conn.execute(f"DELETE FROM reports WHERE fingerprint IN ({oldest})", (overflow,))
+            conn.execute(f"DELETE FROM lanes WHERE fingerprint IN ({oldest})", (overflow,))
+
+    def clear(self) -> None:
+        """Remove every stored verdict."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM lanes")
+            conn.execute("DELETE FROM reports")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_store_lock = threading.Lock()
+_store: Optional[VerdictStore] = None
+
+
+def shared_store(*, enabled: Optional[bool] = None) -> Optional[VerdictStore]:
+    """The process-wide store at ``VERDICT_STORE_PATH``, or ``None`` when disabled.
+
+    ``enabled`` overrides ``VERDICT_STORE_ENABLED``, e.g. for a router built with
+    ``reuse_stored_verdicts=True``.
+    """
+    global _store
+    if not (VERDICT_STORE_ENABLED if enabled is None else enabled):
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = VerdictStore(VERDICT_STORE_PATH)
+        return _store
+
+
+def lookup(
+    fingerprint: str, *, enabled: Optional[bool] = None
+) -> tuple[dict[str, LaneVerdict], Optional[StoredReport]]:
+    """Fresh lane results and report for ``fingerprint``; empty when disabled or unreadable."""
+    store = shared_store(enabled=enabled)
+    if store is None or not fingerprint:
+        return {}, None
+    try:
+        return store.fresh_lanes(fingerprint), store.report(fingerprint)
+    except (sqlite3.Error, OSError):
+        return {}, None
+
+
+def record(
+    fingerprint: str,
+    claim: str,
+    lanes: Mapping[str, LaneVerdict],
+    *,
+    enabled: Optional[bool] = None,
+    **report: Any,
+) -> None:
+    """Store lane results (and the report, see :meth:`VerdictStore.save`); errors are ignored."""
+    store = shared_store(enabled=enabled)
+    if store is None or not fingerprint:
+        return
+    try:
+        store.save(fingerprint, claim, lanes, **report)
+    except (sqlite3.Error, OSError):
+        return
@@ -2,19 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
-from dataclasses import dataclass
+import os
+import threading
+from dataclasses import asdict, dataclass
 from typing import Optional
 
 import requests
 
+from ..config import (
+    CACHE_DIR,
+    VT_CACHE_ENABLED,
+    VT_CACHE_MAX_ENTRIES,
+    VT_CACHE_TTL_CLEAN,
+    VT_CACHE_TTL_MALICIOUS,
+    VT_CACHE_TTL_NOT_FOUND,
+    VT_CACHE_TTL_SUSPICIOUS,
+)
+from . import http_transport
+from .cache_store import CacheStats, SqliteTTLCache
+
 API_URL = "https://www.virustotal.com/api/v3/urls"
+PROVIDER = "virustotal"
 
 
 class VirusTotalClientError(RuntimeError):
     """Raised when the VirusTotal API call fails."""
 
 
+class VirusTotalNotFoundError(VirusTotalClientError):
+    """Raised when VirusTotal has no record for the URL."""
+
+
 @dataclass(frozen=True)
 class VirusTotalUrlReport:
     """Normalized VirusTotal URL intelligence snapshot."""
@@ -34,18 +54,70 @@ def _url_id(url: str) -> str:
     return encoded.decode("ascii").strip("=")
 
 
-def fetch_url_report(url: str, api_key: str) -> VirusTotalUrlReport:
-    """Fetch the latest VirusTotal verdict summary for a URL."""
-    url_identifier = _url_id(url)
-    headers = {"x-apikey": api_key}
+_NOT_FOUND_MARKER = {"not_found": True}
+
+_cache_lock = threading.Lock()
+_cache: Optional[SqliteTTLCache] = None
+
+
+def report_cache() -> Optional[SqliteTTLCache]:
+    """Return the shared URL report cache, or ``None`` when caching is disabled."""
+    global _cache
+    if not VT_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = SqliteTTLCache(
+                os.path.join(CACHE_DIR, "virustotal_reports.sqlite3"),
+                max_entries=VT_CACHE_MAX_ENTRIES,
+            )
+        return _cache
+
+
+def cache_stats() -> Optional[CacheStats]:
+    """Hit/miss counters for the URL report cache, if enabled."""
+    cache = report_cache()
+    return cache.stats() if cache else None
 
+
+def cache_ttl(report: VirusTotalUrlReport) -> int:
+    """Seconds a report stays trustworthy, by its verdict (``VT_CACHE_TTL_*``)."""
+    if report.malicious > 0:
+        return VT_CACHE_TTL_MALICIOUS
+    if report.suspicious > 0:
+        return VT_CACHE_TTL_SUSPICIOUS
+    return VT_CACHE_TTL_CLEAN
+
+
+def _cached_report(url: str, url_identifier: str) -> Optional[VirusTotalUrlReport]:
+    """Return a cached report; re-raise a cached "not found" lookup."""
+    cache = report_cache()
+    if cache is None:
+        return None
+    cached = cache.get(url_identifier)
+    if cached is None:
+        return None
+    if cached == _NOT_FOUND_MARKER:
+        raise VirusTotalNotFoundError("No VirusTotal record for URL")
+    return VirusTotalUrlReport(**{**cached, "url": url})
+
+
+def _parse_and_cache(url: str, url_identifier: str, response: requests.Response) -> VirusTotalUrlReport:
+    cache = report_cache()
     try:
-        response = requests.get(f"{API_URL}/{url_identifier}", headers=headers, timeout=10)
-    except requests.RequestException as exc:  # pragma: no cover - network error handling
-        raise VirusTotalClientError(str(exc)) from exc
+        report = _parse_report(url, response)
+    except VirusTotalNotFoundError:
+        if cache is not None:
+            cache.set(url_identifier, _NOT_FOUND_MARKER, ttl=VT_CACHE_TTL_NOT_FOUND)
+        raise
+    if cache is not None:
+        cache.set(url_identifier, asdict(report), ttl=cache_ttl(report))
+    return report
 
+
+def _parse_report(url: str, response: requests.Response) -> VirusTotalUrlReport:
     if response.status_code == requests.codes.not_found:
-        raise VirusTotalClientError("No VirusTotal record for URL")
+        raise VirusTotalNotFoundError("No VirusTotal record for URL")
 
     if response.status_code != requests.codes.ok:
         raise VirusTotalClientError(f"HTTP {response.status_code}: {response.text}")
@@ -63,3 +135,43 @@ def fetch_url_report(url: str, api_key: str) -> VirusTotalUrlReport:
         timeout=int(stats.get("timeout", 0)),
         last_analysis_date=attributes.get("last_analysis_date"),
     )
+
+
+def fetch_url_report(url: str, api_key: str, *, timeout: float = 10) -> VirusTotalUrlReport:
+    """Fetch the latest VirusTotal verdict summary for a URL.
+
+    ``timeout`` bounds the HTTP call itself; waiting for a rate-limit token is bounded by
+    the request deadline instead.
+    """
+    url_identifier = _url_id(url)
+    cached = _cached_report(url, url_identifier)
+    if cached is not None:
+        return cached
+    headers = {"x-apikey": api_key}
+
+    try:
+        response = http_transport.request(
+            "GET", f"{API_URL}/{url_identifier}", headers=headers, timeout=timeout, provider=PROVIDER
+        )
+    except requests.RequestException as exc:  # pragma: no cover - network error handling
+        raise VirusTotalClientError(str(exc)) from exc
+
+    return _parse_and_cache(url, url_identifier, response)
+
+
+async def fetch_url_report_async(url: str, api_key: str, *, timeout: float = 10) -> VirusTotalUrlReport:
+    """Async variant of :func:`fetch_url_report`; cache reads and writes run in a worker thread."""
+    url_identifier = _url_id(url)
+    cached = await asyncio.to_thread(_cached_report, url, url_identifier)
+    if cached is not None:
+        return cached
+    headers = {"x-apikey": api_key}
+
+    try:
+        response = await http_transport.request_async(
+            "GET", f"{API_URL}/{url_identifier}", headers=headers, timeout=timeout, provider=PROVIDER
+        )
+    except requests.RequestException as exc:  # pragma: no cover - network error handling
+        raise VirusTotalClientError(str(exc)) from exc
+
+    return await asyncio.to_thread(_parse_and_cache, url, url_identifier, response)
@@ -0,0 +1,234 @@
+"""Agent, model and tool instrumentation feeding :mod:`services.metrics` and token accounting."""
+
+from __future__ import annotations
+
+import functools
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Iterator, Mapping, Optional
+
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.tools.agent_tool import AgentTool
+from google.genai import types
+
+from .config import STATE_KEYS, TOKEN_BUDGET_PER_REQUEST
+from .services import context_helpers, metrics, token_usage
+
+# Runs that raise never reach the after-callback; cap how many start times are kept.
+_MAX_PENDING_RUNS = 4096
+
+LANE_ROUTER = "router"
+
+_started: "OrderedDict[tuple[str, str], float]" = OrderedDict()
+_agent_lanes: dict[str, str] = {}
+
+
+def walk_agents(agent: BaseAgent) -> Iterator[BaseAgent]:
+    """Yield every agent reachable from ``agent``, including AgentTool targets."""
+    seen: set[int] = set()
+    pending = [agent]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        yield current
+        pending.extend(current.sub_agents)
+        if isinstance(current, LlmAgent):
+            pending.extend(tool.agent for tool in current.tools if isinstance(tool, AgentTool))
+        for value in vars(current).values():
+            # Custom agents (e.g. the pre-classifier) hold lanes in plain fields.
+            if isinstance(value, BaseAgent):
+                pending.append(value)
+            elif isinstance(value, dict):
+                pending.extend(item for item in value.values() if isinstance(item, BaseAgent))
+
+
+def _append_callback(agent: BaseAgent, attr: str, callback: Callable[..., Any]) -> None:
+    current = getattr(agent, attr)
+    callbacks = list(current) if isinstance(current, list) else ([current] if current else [])
+    if callback not in callbacks:
+        setattr(agent, attr, [*callbacks, callback])
+
+
+def add_agent_callbacks(
+    agent: BaseAgent,
+    before: Optional[Callable[[CallbackContext], Any]] = None,
+    after: Optional[Callable[[CallbackContext], Any]] = None,
+) -> None:
+    """Append callbacks to ``agent`` without replacing the ones already set; repeats are ignored."""
+    if before is not None:
+        _append_callback(agent, "before_agent_callback", before)
+    if after is not None:
+        _append_callback(agent, "after_agent_callback", after)
+
+
+def lane_of(agent_name: str) -> str:
+    """The lane an agent belongs to, as registered by :func:`instrument_agents`."""
+    return _agent_lanes.get(agent_name, LANE_ROUTER)
+
+
+def _before_agent(callback_context: CallbackContext) -> None:
+    _started[(callback_context.invocation_id, callback_context.agent_name)] = time.perf_counter()
+    while len(_started) > _MAX_PENDING_RUNS:
+        _started.popitem(last=False)
+
+
+def _after_agent(callback_context: CallbackContext) -> None:
+    started = _started.pop((callback_context.invocation_id, callback_context.agent_name), None)
+    if started is None:
+        return
+    metrics.AGENT_DURATION.observe(time.perf_counter() - started, callback_context.agent_name)
+    metrics.AGENT_RUNS.inc(callback_context.agent_name)
+
+
+def _begin_request(callback_context: CallbackContext) -> None:
+    budget = callback_context.state.get(STATE_KEYS.TOKEN_BUDGET)
+    token_usage.start(int(budget) if budget is not None else TOKEN_BUDGET_PER_REQUEST)
+
+
+def _end_request(callback_context: CallbackContext) -> None:
+    ledger = token_usage.current()
+    if ledger is None:
+        return
+    snapshot = ledger.snapshot()
+    state = callback_context.state
+    state[STATE_KEYS.TOKEN_USAGE] = snapshot
+    state[STATE_KEYS.TOKEN_USAGE_TOTAL] = token_usage.accumulate(state.get(STATE_KEYS.TOKEN_USAGE_TOTAL), snapshot)
+    token_usage.finish()
+
+
+def _budget_response() -> LlmResponse:
+    payload = {"status": token_usage.STATUS_BUDGET_EXCEEDED, "notes": token_usage.BUDGET_EXCEEDED_NOTE}
+    return LlmResponse(content=types.Content(role="model", parts=[types.Part(text=json.dumps(payload))]))
+
+
+def _budget_report(callback_context: CallbackContext) -> LlmResponse:
+    """A ``# Verification Report`` from the lanes that finished, for agents that write the final report.
+
+    Their output lands in ``state["final_report"]``, so it must keep the report format
+    rather than carry the JSON skip payload the other agents get.
+    """
+    # Imported here: the reporting package pulls in the lanes, whose tools import this module.
+    from .reporting import render_final_report
+
+    state = callback_context.state
+    report = state.get(STATE_KEYS.FINAL_REPORT)
+    if not isinstance(report, str) or not report.strip():
+        report = render_final_report(
+            state,
+            claim=state.get(STATE_KEYS.CLAIM_TEXT) or context_helpers.extract_latest_user_text(callback_context),
+            submitted_at=state.get(STATE_KEYS.SUBMITTED_AT) or context_helpers.latest_user_timestamp(callback_context),
+            extra_risks=["token budget exhausted: report assembled from lane summaries without Gemini"],
+        )
+    return LlmResponse(content=types.Content(role="model", parts=[types.Part(text=report)]))
+
+
+def _before_model(callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+    if not token_usage.budget_exhausted():
+        return None
+    token_usage.record_skip(token_usage.PROVIDER_GEMINI, callback_context.agent_name)
+    return _budget_response()
+
+
+def _before_report_model(callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+    if not token_usage.budget_exhausted():
+        return None
+    token_usage.record_skip(token_usage.PROVIDER_GEMINI, callback_context.agent_name)
+    return _budget_report(callback_context)
+
+
+def _after_model(callback_context: CallbackContext, llm_response: LlmResponse) -> None:
+    usage = llm_response.usage_metadata
+    if usage is None or llm_response.partial:
+        return
+    name = callback_context.agent_name
+    token_usage.record(
+        token_usage.PROVIDER_GEMINI,
+        name,
+        lane_of(name),
+        usage.prompt_token_count or 0,
+        usage.candidates_token_count or 0,
+    )
+
+
+def instrument_agents(root: BaseAgent, *, lanes: Optional[Mapping[str, BaseAgent]] = None) -> int:
+    """Instrument every agent reachable from ``root``; returns how many agents were visited.
+
+    Each agent run is timed, each Gemini call is charged to the request's token ledger
+    (and skipped once its budget is exhausted; agents writing the final report then
+    return a template-rendered report instead), and ``root`` opens and closes the ledger,
+    writing the usage into session state. Agents under ``lanes[name]`` are attributed to
+    that lane; everything else belongs to the router.
+    """
+    for lane, lane_root in (lanes or {}).items():
+        for agent in walk_agents(lane_root):
+            _agent_lanes[agent.name] = lane
+    add_agent_callbacks(root, _begin_request, _end_request)
+    count = 0
+    for agent in walk_agents(root):
+        if metrics.enabled():
+            add_agent_callbacks(agent, _before_agent, _after_agent)
+        if isinstance(agent, LlmAgent):
+            writes_report = agent.output_key == STATE_KEYS.FINAL_REPORT
+            _append_callback(agent, "before_model_callback", _before_report_model if writes_report else _before_model)
+            _append_callback(agent, "after_model_callback", _after_model)
+        count += 1
+    return count
+
+
+def _payload_size(payload: Any) -> int:
+    try:
+        return len(json.dumps(payload, default=str))
+    except (TypeError, ValueError):
+        return len(str(payload))
+
+
+def _record_tool(name: str, started: float, payload: Any) -> None:
+    status = payload.get("status", "unknown") if isinstance(payload, dict) else "unknown"
+    metrics.TOOL_DURATION.observe(time.perf_counter() - started, name)
+    metrics.TOOL_CALLS.inc(name, status)
+    metrics.TOOL_PAYLOAD_BYTES.observe(_payload_size(payload), name)
+
+
+def instrument_tool(
+    func: Callable[..., Awaitable[dict[str, Any]]], *, llm_provider: Optional[str] = None
+) -> Callable[..., Awaitable[dict[str, Any]]]:
+    """Wrap an async tool function so each call records latency, payload status and size.
+
+    For ``llm_provider="perplexity"`` the payload's ``token_usage`` is also charged to the
+    calling agent. The wrapper keeps the function's name, docstring and signature, so
+    ``FunctionTool`` builds the same declaration for the model.
+    """
+    name = func.__name__
+
+    def _charge(payload: Any, kwargs: Mapping[str, Any]) -> None:
+        if llm_provider != token_usage.PROVIDER_PERPLEXITY or not isinstance(payload, dict):
+            return
+        tool_context = kwargs.get("tool_context")
+        agent = getattr(tool_context, "agent_name", None) or name
+        token_usage.record_perplexity(payload.get("token_usage") or {}, agent, lane_of(agent))
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        if not metrics.enabled():
+            payload = await func(*args, **kwargs)
+            _charge(payload, kwargs)
+            return payload
+        started = time.perf_counter()
+        try:
+            payload = await func(*args, **kwargs)
+        except Exception:
+            metrics.TOOL_DURATION.observe(time.perf_counter() - started, name)
+            metrics.TOOL_CALLS.inc(name, "exception")
+            raise
+        _record_tool(name, started, payload)
+        _charge(payload, kwargs)
+        return payload
+
+    return wrapper
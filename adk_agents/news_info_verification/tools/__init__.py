@@ -1,18 +1,35 @@
-"""Tool definitions for the news & information verification workflow."""
+"""Tool definitions for the news & information verification workflow.
+
+Each tool lives in its own module together with the client it calls. The modules are
+imported on first access, so an agent that needs one tool does not load every client.
+"""
+
+import importlib
+from typing import Any
+
+_TOOL_MODULES = {
+    "NEWS_API_TOOL": ".news_tools",
+    "FACT_CHECK_TOOL": ".fact_tools",
+    "VIRUSTOTAL_URL_TOOL": ".scam_tools",
+    "SCAM_LANGUAGE_TOOL": ".scam_language_tools",
+    "NEWS_PERPLEXITY_TOOL": ".perplexity_tools",
+    "FACT_PERPLEXITY_TOOL": ".perplexity_tools",
+    "SCAM_PERPLEXITY_TOOL": ".perplexity_tools",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _TOOL_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
 
-from .news_tools import NEWS_API_TOOL
-from .fact_tools import FACT_CHECK_TOOL
-from .scam_tools import VIRUSTOTAL_URL_TOOL
-from .perplexity_tools import (
-    NEWS_PERPLEXITY_TOOL,
-    FACT_PERPLEXITY_TOOL,
-    SCAM_PERPLEXITY_TOOL,
-)
 
 __all__ = [
     "NEWS_API_TOOL",
     "FACT_CHECK_TOOL",
     "VIRUSTOTAL_URL_TOOL",
+    "SCAM_LANGUAGE_TOOL",
     "NEWS_PERPLEXITY_TOOL",
     "FACT_PERPLEXITY_TOOL",
     "SCAM_PERPLEXITY_TOOL",
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import Any
 
 from google.adk.tools import FunctionTool
 from google.adk.tools import ToolContext
 
-from ..services import context_helpers, factcheck_client, text_utils
+from ..services import claimreview_index, context_helpers, factcheck_client, text_utils
+from ..telemetry import instrument_tool
 
 
 _RATING_FALSE_KEYWORDS = {"false", "pants on fire", "fiction", "fake", "incorrect", "scam"}
@@ -45,42 +47,26 @@ def _summarize_reviews(reviews: list[factcheck_client.FactCheckReview]) -> str:
     return text_utils.truncate_sentences(sentences, limit=240)
 
 
-def lookup_fact_checks(
-    claim: str, *, tool_context: ToolContext
-) -> dict[str, Any]:
-    """Query Google Fact Check Tools for reviews addressing the given claim."""
-    query = claim or context_helpers.extract_latest_user_text(tool_context)
-    api_key = os.getenv("GOOGLE_FACT_CHECK_API_KEY")
+def _error_payload(notes: str) -> dict[str, Any]:
+    return {
+        "status": "error",
+        "verdict": "inconclusive",
+        "confidence": 0.0,
+        "fact_checks": [],
+        "notes": notes,
+    }
 
-    if not query:
-        return {
-            "status": "error",
-            "verdict": "inconclusive",
-            "confidence": 0.0,
-            "fact_checks": [],
-            "notes": "No claim text was supplied for fact-check lookup.",
-        }
 
+def _precheck(query: str, api_key: str | None) -> dict[str, Any] | None:
+    """Return an error payload when the remote lookup cannot be attempted."""
+    if not query:
+        return _error_payload("No claim text was supplied for fact-check lookup.")
     if not api_key:
-        return {
-            "status": "error",
-            "verdict": "inconclusive",
-            "confidence": 0.0,
-            "fact_checks": [],
-            "notes": "GOOGLE_FACT_CHECK_API_KEY environment variable is not configured.",
-        }
+        return _error_payload("GOOGLE_FACT_CHECK_API_KEY environment variable is not configured.")
+    return None
 
-    try:
-        reviews = factcheck_client.search_fact_checks(query=query, api_key=api_key, max_results=6)
-    except factcheck_client.FactCheckClientError as exc:
-        return {
-            "status": "error",
-            "verdict": "inconclusive",
-            "confidence": 0.0,
-            "fact_checks": [],
-            "notes": f"Fact Check API failure: {exc}",
-        }
 
+def _build_payload(reviews: list[factcheck_client.FactCheckReview]) -> dict[str, Any]:
     if not reviews:
         return {
             "status": "no_data",
@@ -111,4 +97,48 @@ def lookup_fact_checks(
     }
 
 
-FACT_CHECK_TOOL = FunctionTool(func=lookup_fact_checks)
+async def lookup_fact_checks_async(
+    claim: str, *, tool_context: ToolContext
+) -> dict[str, Any]:
+    """Find fact-check reviews for the claim in the local ClaimReview index, then Google Fact Check Tools."""
+    query = claim or context_helpers.extract_latest_user_text(tool_context)
+    # The local ClaimReview index answers in milliseconds; the API only sees local misses.
+    # SQLite runs in a worker thread so the lookup never blocks the event loop.
+    local = await asyncio.to_thread(claimreview_index.search, query, max_results=6) if query else []
+    if local:
+        return _build_payload(local)
+    api_key = os.getenv("GOOGLE_FACT_CHECK_API_KEY")
+
+    failure = _precheck(query, api_key)
+    if failure:
+        return failure
+
+    try:
+        reviews = await factcheck_client.search_fact_checks_async(query=query, api_key=api_key, max_results=6)
+    except factcheck_client.FactCheckClientError as exc:
+        return _error_payload(f"Fact Check API failure: {exc}")
+
+    return _build_payload(reviews)
+
+
+def lookup_fact_checks(claim: str, *, tool_context: ToolContext) -> dict[str, Any]:
+    """Blocking variant of :func:`lookup_fact_checks_async` on the sync Fact Check client."""
+    query = claim or context_helpers.extract_latest_user_text(tool_context)
+    local = claimreview_index.search(query, max_results=6) if query else []
+    if local:
+        return _build_payload(local)
+    api_key = os.getenv("GOOGLE_FACT_CHECK_API_KEY")
+
+    failure = _precheck(query, api_key)
+    if failure:
+        return failure
+
+    try:
+        reviews = factcheck_client.search_fact_checks(query=query, api_key=api_key, max_results=6)
+    except factcheck_client.FactCheckClientError as exc:
+        return _error_payload(f"Fact Check API failure: {exc}")
+
+    return _build_payload(reviews)
+
+
+FACT_CHECK_TOOL = FunctionTool(func=instrument_tool(lookup_fact_checks_async))
@@ -9,6 +9,7 @@ from google.adk.tools import FunctionTool
 from google.adk.tools import ToolContext
 
 from ..services import context_helpers, gnews_client, text_utils
+from ..telemetry import instrument_tool
 
 
 def _format_sources(articles: list[gnews_client.GNewsArticle]) -> list[str]:
@@ -32,42 +33,26 @@ def _build_synopsis(articles: list[gnews_client.GNewsArticle]) -> str:
     return text_utils.truncate_sentences(sentences, limit=220)
 
 
-def fetch_news_evidence(
-    claim: str, *, tool_context: ToolContext
-) -> dict[str, Any]:
-    """Retrieve up to five recent English-language articles related to the claim via GNews."""
-    query = claim or context_helpers.extract_latest_user_text(tool_context)
-    api_key = os.getenv("GNEWS_API_TOKEN")
+def _error_payload(synopsis: str) -> dict[str, Any]:
+    return {
+        "status": "error",
+        "verdict": "inconclusive",
+        "confidence": 0.0,
+        "supporting_sources": [],
+        "synopsis": synopsis,
+    }
 
-    if not query:
-        return {
-            "status": "error",
-            "verdict": "inconclusive",
-            "confidence": 0.0,
-            "supporting_sources": [],
-            "synopsis": "No claim text provided for the GNews lookup.",
-        }
 
+def _precheck(query: str, api_key: str | None) -> dict[str, Any] | None:
+    """Return an error payload when the lookup cannot be attempted."""
+    if not query:
+        return _error_payload("No claim text provided for the GNews lookup.")
     if not api_key:
-        return {
-            "status": "error",
-            "verdict": "inconclusive",
-            "confidence": 0.0,
-            "supporting_sources": [],
-            "synopsis": "GNEWS_API_TOKEN environment variable is not configured.",
-        }
+        return _error_payload("GNEWS_API_TOKEN environment variable is not configured.")
+    return None
 
-    try:
-        articles = gnews_client.fetch_articles(query=query, api_key=api_key, max_results=5)
-    except gnews_client.GNewsClientError as exc:
-        return {
-            "status": "error",
-            "verdict": "inconclusive",
-            "confidence": 0.0,
-            "supporting_sources": [],
-            "synopsis": f"GNews lookup failed: {exc}",
-        }
 
+def _build_payload(articles: list[gnews_client.GNewsArticle]) -> dict[str, Any]:
     if not articles:
         return {
             "status": "no_data",
@@ -99,4 +84,40 @@ def fetch_news_evidence(
     }
 
 
-NEWS_API_TOOL = FunctionTool(func=fetch_news_evidence)
+async def fetch_news_evidence_async(
+    claim: str, *, tool_context: ToolContext
+) -> dict[str, Any]:
+    """Retrieve up to five recent English-language articles related to the claim via GNews."""
+    query = claim or context_helpers.extract_latest_user_text(tool_context)
+    api_key = os.getenv("GNEWS_API_TOKEN")
+
+    failure = _precheck(query, api_key)
+    if failure:
+        return failure
+
+    try:
+        articles = await gnews_client.fetch_articles_async(query=query, api_key=api_key, max_results=5)
+    except gnews_client.GNewsClientError as exc:
+        return _error_payload(f"GNews lookup failed: {exc}")
+
+    return _build_payload(articles)
+
+
+def fetch_news_evidence(claim: str, *, tool_context: ToolContext) -> dict[str, Any]:
+    """Blocking variant of :func:`fetch_news_evidence_async` on the sync GNews client."""
+    query = claim or context_helpers.extract_latest_user_text(tool_context)
+    api_key = os.getenv("GNEWS_API_TOKEN")
+
+    failure = _precheck(query, api_key)
+    if failure:
+        return failure
+
+    try:
+        articles = gnews_client.fetch_articles(query=query, api_key=api_key, max_results=5)
+    except gnews_client.GNewsClientError as exc:
+        return _error_payload(f"GNews lookup failed: {exc}")
+
+    return _build_payload(articles)
+
+
+NEWS_API_TOOL = FunctionTool(func=instrument_tool(fetch_news_evidence_async))
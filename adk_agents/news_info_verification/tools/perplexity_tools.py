@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import math
-from typing import Any
+from typing import Any, Callable
 
 from google.adk.tools import FunctionTool, ToolContext
 
-from ..services import context_helpers, perplexity_client, text_utils
+from ..config import PERPLEXITY_CACHE_TTL_FACT, PERPLEXITY_CACHE_TTL_NEWS, PERPLEXITY_CACHE_TTL_SCAM
+from ..services import context_helpers, perplexity_client, text_utils, token_usage
+from ..telemetry import instrument_tool
 
 
 def _fallback_confidence(num_sources: int, default: float = 0.5) -> float:
@@ -48,20 +50,24 @@ def _safe_confidence(value: Any, fallback: float) -> float:
     return round(max(0.0, min(1.0, numeric)), 2)
 
 
-def research_news_with_perplexity(claim: str, *, tool_context: ToolContext) -> dict[str, Any]:
-    """Investigate a breaking news claim using Perplexity's web-grounded research."""
+def _over_budget(error: Callable[[str], dict[str, Any]], tool_context: ToolContext) -> dict[str, Any]:
+    """Payload returned instead of calling Perplexity once the request's token budget is spent."""
+    token_usage.record_skip(token_usage.PROVIDER_PERPLEXITY, tool_context.agent_name)
+    return {**error(token_usage.BUDGET_EXCEEDED_NOTE), "status": token_usage.STATUS_BUDGET_EXCEEDED}
 
-    query = claim or context_helpers.extract_latest_user_text(tool_context)
-    if not query:
-        return {
-            "status": "error",
-            "verdict": "unknown",
-            "confidence": 0.0,
-            "reasoning_bullets": [],
-            "citations": [],
-            "notes": "No claim text provided for Perplexity research.",
-        }
 
+def _news_error(notes: str) -> dict[str, Any]:
+    return {
+        "status": "error",
+        "verdict": "unknown",
+        "confidence": 0.0,
+        "reasoning_bullets": [],
+        "citations": [],
+        "notes": notes,
+    }
+
+
+def _news_request(query: str) -> dict[str, Any]:
     schema = (
         "{"
         '"status": "ok" | "no_data" | "error", '
@@ -75,27 +81,21 @@ def research_news_with_perplexity(claim: str, *, tool_context: ToolContext) -> d
         "Summarize converging or conflicting coverage, prioritizing reputable outlets." \
         " Confidence should rise with multiple corroborating sources and fall with disagreements."
     )
+    return {
+        "user_prompt": (
+            "You must decide whether this news claim is supported by current reporting. "
+            "Focus on concrete details like who, what, when, and where.\n\nClaim: " + query
+        ),
+        "schema_description": schema,
+        "system_prompt": system,
+        "max_tokens": 900,
+        "cache_ttl": PERPLEXITY_CACHE_TTL_NEWS,
+    }
 
-    try:
-        payload, response = perplexity_client.complete_json(
-            user_prompt=(
-                "You must decide whether this news claim is supported by current reporting. "
-                "Focus on concrete details like who, what, when, and where.\n\nClaim: " + query
-            ),
-            schema_description=schema,
-            system_prompt=system,
-            max_tokens=900,
-        )
-    except perplexity_client.PerplexityClientError as exc:
-        return {
-            "status": "error",
-            "verdict": "unknown",
-            "confidence": 0.0,
-            "reasoning_bullets": [],
-            "citations": [],
-            "notes": f"Perplexity request failed: {exc}",
-        }
 
+def _news_payload(
+    payload: dict[str, Any], response: perplexity_client.PerplexityResponse
+) -> dict[str, Any]:
     citations = payload.get("citations") or []
     if not citations:
         citations = _citations_from_results(response.search_results)
@@ -115,20 +115,51 @@ def research_news_with_perplexity(claim: str, *, tool_context: ToolContext) -> d
     }
 
 
-def research_fact_with_perplexity(claim: str, *, tool_context: ToolContext) -> dict[str, Any]:
-    """Cross-check factual statements against authoritative references."""
+async def research_news_with_perplexity_async(claim: str, *, tool_context: ToolContext) -> dict[str, Any]:
+    """Investigate a breaking news claim using Perplexity's web-grounded research."""
+
+    query = claim or context_helpers.extract_latest_user_text(tool_context)
+    if not query:
+        return _news_error("No claim text provided for Perplexity research.")
+    if token_usage.budget_exhausted():
+        return _over_budget(_news_error, tool_context)
+
+    try:
+        payload, response = await perplexity_client.complete_json_async(**_news_request(query))
+    except perplexity_client.PerplexityClientError as exc:
+        return _news_error(f"Perplexity request failed: {exc}")
+
+    return _news_payload(payload, response)
+
 
+def research_news_with_perplexity(claim: str, *, tool_context: ToolContext) -> dict[str, Any]:
+    """Blocking variant of :func:`research_news_with_perplexity_async` on the sync Perplexity client."""
     query = claim or context_helpers.extract_latest_user_text(tool_context)
     if not query:
-        return {
-            "status": "error",
-            "verdict": "unknown",
-            "confidence": 0.0,
-            "reasoning": [],
-            "references": [],
-            "notes": "No claim text provided for Perplexity fact research.",
-        }
+        return _news_error("No claim text provided for Perplexity research.")
+    if token_usage.budget_exhausted():
+        return _over_budget(_news_error, tool_context)
 
+    try:
+        payload, response = perplexity_client.complete_json(**_news_request(query))
+    except perplexity_client.PerplexityClientError as exc:
+        return _news_error(f"Perplexity request failed: {exc}")
+
+    return _news_payload(payload, response)
+
+
+def _fact_error(notes: str) -> dict[str, Any]:
+    return {
+        "status": "error",
+        "verdict": "unknown",
+        "confidence": 0.0,
+        "reasoning": [],
+        "references": [],
+        "notes": notes,
+    }
+
+
+def _fact_request(query: str) -> dict[str, Any]:
     schema = (
         "{"
         '"status": "ok" | "no_data" | "error", '
@@ -143,27 +174,21 @@ def research_fact_with_perplexity(claim: str, *, tool_context: ToolContext) -> d
         "When evidence conflicts, mark the verdict as mixed and explain each side succinctly. "
         "Return references with full URLs."
     )
+    return {
+        "user_prompt": (
+            "Evaluate this factual assertion. Highlight corroborating or conflicting evidence and prefer primary sources.\n\n"
+            "Claim: " + query
+        ),
+        "schema_description": schema,
+        "system_prompt": system,
+        "max_tokens": 900,
+        "cache_ttl": PERPLEXITY_CACHE_TTL_FACT,
+    }
 
-    try:
-        payload, response = perplexity_client.complete_json(
-            user_prompt=(
-                "Evaluate this factual assertion. Highlight corroborating or conflicting evidence and prefer primary sources.\n\n"
-                "Claim: " + query
-            ),
-            schema_description=schema,
-            system_prompt=system,
-            max_tokens=900,
-        )
-    except perplexity_client.PerplexityClientError as exc:
-        return {
-            "status": "error",
-            "verdict": "unknown",
-            "confidence": 0.0,
-            "reasoning": [],
-            "references": [],
-            "notes": f"Perplexity request failed: {exc}",
-        }
 
+def _fact_payload(
+    payload: dict[str, Any], response: perplexity_client.PerplexityResponse
+) -> dict[str, Any]:
     references = payload.get("references") or _references_from_results(response.search_results)
     confidence = _safe_confidence(payload.get("confidence"), _fallback_confidence(len(references)))
 
@@ -183,20 +208,51 @@ def research_fact_with_perplexity(claim: str, *, tool_context: ToolContext) -> d
     }
 
 
-def research_scam_with_perplexity(claim: str, *, tool_context: ToolContext) -> dict[str, Any]:
-    """Compare the claim against known scam patterns using Perplexity."""
+async def research_fact_with_perplexity_async(claim: str, *, tool_context: ToolContext) -> dict[str, Any]:
+    """Cross-check factual statements against authoritative references."""
 
     query = claim or context_helpers.extract_latest_user_text(tool_context)
     if not query:
-        return {
-            "status": "error",
-            "verdict": "unclear",
-            "confidence": 0.0,
-            "pattern_matches": [],
-            "supporting_citations": [],
-            "notes": "No message text provided for scam analysis.",
-        }
+        return _fact_error("No claim text provided for Perplexity fact research.")
+    if token_usage.budget_exhausted():
+        return _over_budget(_fact_error, tool_context)
 
+    try:
+        payload, response = await perplexity_client.complete_json_async(**_fact_request(query))
+    except perplexity_client.PerplexityClientError as exc:
+        return _fact_error(f"Perplexity request failed: {exc}")
+
+    return _fact_payload(payload, response)
+
+
+def research_fact_with_perplexity(claim: str, *, tool_context: ToolContext) -> dict[str, Any]:
+    """Blocking variant of :func:`research_fact_with_perplexity_async` on the sync Perplexity client."""
+    query = claim or context_helpers.extract_latest_user_text(tool_context)
+    if not query:
+        return _fact_error("No claim text provided for Perplexity fact research.")
+    if token_usage.budget_exhausted():
+        return _over_budget(_fact_error, tool_context)
+
+    try:
+        payload, response = perplexity_client.complete_json(**_fact_request(query))
+    except perplexity_client.PerplexityClientError as exc:
+        return _fact_error(f"Perplexity request failed: {exc}")
+
+    return _fact_payload(payload, response)
+
+
+def _scam_error(notes: str) -> dict[str, Any]:
+    return {
+        "status": "error",
+        "verdict": "unclear",
+        "confidence": 0.0,
+        "pattern_matches": [],
+        "supporting_citations": [],
+        "notes": notes,
+    }
+
+
+def _scam_request(query: str) -> dict[str, Any]:
     schema = (
         "{"
         '"status": "ok" | "no_match" | "error", '
@@ -211,27 +267,21 @@ def research_scam_with_perplexity(claim: str, *, tool_context: ToolContext) -> d
         "Identify whether the message resembles common scam archetypes (phishing, advance-fee fraud, account suspension, "
         "investment fraud). Focus on red flags like urgency, payment requests, and suspicious links."
     )
+    return {
+        "user_prompt": (
+            "Analyse this message for scam indicators. Explain any matching patterns succinctly and cite reputable "
+            "sources that describe similar scams.\n\nMessage: " + query
+        ),
+        "schema_description": schema,
+        "system_prompt": system,
+        "max_tokens": 750,
+        "cache_ttl": PERPLEXITY_CACHE_TTL_SCAM,
+    }
 
-    try:
-        payload, response = perplexity_client.complete_json(
-            user_prompt=(
-                "Analyse this message for scam indicators. Explain any matching patterns succinctly and cite reputable "
-                "sources that describe similar scams.\n\nMessage: " + query
-            ),
-            schema_description=schema,
-            system_prompt=system,
-            max_tokens=750,
-        )
-    except perplexity_client.PerplexityClientError as exc:
-        return {
-            "status": "error",
-            "verdict": "unclear",
-            "confidence": 0.0,
-            "pattern_matches": [],
-            "supporting_citations": [],
-            "notes": f"Perplexity request failed: {exc}",
-        }
 
+def _scam_payload(
+    payload: dict[str, Any], response: perplexity_client.PerplexityResponse
+) -> dict[str, Any]:
     citations = payload.get("supporting_citations") or _citations_from_results(response.search_results)
     confidence = _safe_confidence(payload.get("confidence"), _fallback_confidence(len(citations), default=0.4))
 
@@ -246,13 +296,52 @@ def research_scam_with_perplexity(claim: str, *, tool_context: ToolContext) -> d
     }
 
 
-NEWS_PERPLEXITY_TOOL = FunctionTool(func=research_news_with_perplexity)
-FACT_PERPLEXITY_TOOL = FunctionTool(func=research_fact_with_perplexity)
-SCAM_PERPLEXITY_TOOL = FunctionTool(func=research_scam_with_perplexity)
+async def research_scam_with_perplexity_async(claim: str, *, tool_context: ToolContext) -> dict[str, Any]:
+    """Compare the claim against known scam patterns using Perplexity."""
+
+    query = claim or context_helpers.extract_latest_user_text(tool_context)
+    if not query:
+        return _scam_error("No message text provided for scam analysis.")
+    if token_usage.budget_exhausted():
+        return _over_budget(_scam_error, tool_context)
+
+    try:
+        payload, response = await perplexity_client.complete_json_async(**_scam_request(query))
+    except perplexity_client.PerplexityClientError as exc:
+        return _scam_error(f"Perplexity request failed: {exc}")
+
+    return _scam_payload(payload, response)
+
+
+def research_scam_with_perplexity(claim: str, *, tool_context: ToolContext) -> dict[str, Any]:
+    """Blocking variant of :func:`research_scam_with_perplexity_async` on the sync Perplexity client."""
+    query = claim or context_helpers.extract_latest_user_text(tool_context)
+    if not query:
+        return _scam_error("No message text provided for scam analysis.")
+    if token_usage.budget_exhausted():
+        return _over_budget(_scam_error, tool_context)
+
+    try:
+        payload, response = perplexity_client.complete_json(**_scam_request(query))
+    except perplexity_client.PerplexityClientError as exc:
+        return _scam_error(f"Perplexity request failed: {exc}")
+
+    return _scam_payload(payload, response)
+
+
+NEWS_PERPLEXITY_TOOL = FunctionTool(
+    func=instrument_tool(research_news_with_perplexity_async, llm_provider=token_usage.PROVIDER_PERPLEXITY)
+)
+FACT_PERPLEXITY_TOOL = FunctionTool(
+    func=instrument_tool(research_fact_with_perplexity_async, llm_provider=token_usage.PROVIDER_PERPLEXITY)
+)
+SCAM_PERPLEXITY_TOOL = FunctionTool(
+    func=instrument_tool(research_scam_with_perplexity_async, llm_provider=token_usage.PROVIDER_PERPLEXITY)
+)
 
 
 __all__ = [
     "NEWS_PERPLEXITY_TOOL",
     "FACT_PERPLEXITY_TOOL",
     "SCAM_PERPLEXITY_TOOL",
-]
+]
\ No newline at end of file
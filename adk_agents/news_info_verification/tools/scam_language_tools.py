@@ -0,0 +1,19 @@
+"""FunctionTool that scores scam language locally, without a model call."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from google.adk.tools import FunctionTool, ToolContext
+
+from ..services import context_helpers, scam_language
+from ..telemetry import instrument_tool
+
+
+async def score_scam_language(claim: str, *, tool_context: ToolContext) -> dict[str, Any]:
+    """Score urgency, fear, authority impersonation, reward framing and payment or credential requests."""
+    text = claim or context_helpers.extract_latest_user_text(tool_context)
+    return scam_language.score(text)
+
+
+SCAM_LANGUAGE_TOOL = FunctionTool(func=instrument_tool(score_scam_language))
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Any
 
 from google.adk.tools import FunctionTool
 from google.adk.tools import ToolContext
 
-from ..services import context_helpers, text_utils, virustotal_client
+from ..config import VT_CACHE_TTL_MALICIOUS, VT_LOOKUP_TIMEOUT, VT_SCAN_CONCURRENCY
+from ..services import blocklist_index, context_helpers, deadline, url_extraction, virustotal_client
+from ..telemetry import instrument_tool
+
+_MAX_URLS = 5
 
 
 def _risk_level(report: virustotal_client.VirusTotalUrlReport) -> str:
@@ -44,14 +52,50 @@ def _format_issue(report: virustotal_client.VirusTotalUrlReport) -> str:
     return ", ".join(parts)
 
 
-def scan_urls_with_virustotal(
-    claim: str, *, tool_context: ToolContext
-) -> dict[str, Any]:
-    """Check up to five URLs in the claim text against VirusTotal and return risk annotations."""
-    text = claim or context_helpers.extract_latest_user_text(tool_context)
-    urls = text_utils.extract_urls(text)
-    api_key = os.getenv("VT_API_KEY")
+def _target_urls(text: str) -> list[str]:
+    """Canonical URLs to scan, so tracking-parameter and case variants share one lookup and cache entry."""
+    return [url.canonical for url in url_extraction.iter_urls(text, limit=_MAX_URLS)]
+
+
+def _blocklisted(urls: list[str]) -> list[tuple[str, dict[str, Any]]]:
+    """High-risk assessments for URLs on the offline blocklist index.
+
+    A listing is trusted as long as a malicious VirusTotal verdict (``VT_CACHE_TTL_MALICIOUS``).
+    """
+    assessments = []
+    valid_until = int(time.time() + VT_CACHE_TTL_MALICIOUS)
+    for url in urls:
+        hit = blocklist_index.lookup(url)
+        if hit is not None:
+            assessments.append(
+                (
+                    "high",
+                    {
+                        "url": url,
+                        "issue": f"Listed on offline blocklist {hit.source} ({hit.kind} match: {hit.value})",
+                        "recommendation": _recommendation("high"),
+                        "valid_until": valid_until,
+                    },
+                )
+            )
+    return assessments
+
+
+def _unlisted(urls: list[str], listed: list[tuple[str, dict[str, Any]]]) -> list[str]:
+    listed_urls = {issue["url"] for _, issue in listed}
+    return [url for url in urls if url not in listed_urls]
 
+
+def _precheck(
+    urls: list[str], listed: list[tuple[str, dict[str, Any]]], api_key: str | None
+) -> dict[str, Any] | None:
+    """Return a terminal payload when no VirusTotal lookup should run.
+
+    ``urls`` are the URLs left after the ``listed`` blocklist hits; the hits are kept in
+    the payload, and without an API key the remaining URLs are reported as unchecked.
+    """
+    if not urls and listed:
+        return _build_payload(listed)
     if not urls:
         return {
             "status": "no_data",
@@ -61,6 +105,9 @@ def scan_urls_with_virustotal(
             "recommended_action": "No URLs were provided in the submission.",
         }
 
+    if not api_key and listed:
+        missing = virustotal_client.VirusTotalClientError("VT_API_KEY environment variable is missing")
+        return _build_payload(listed + [_assess_failure(url, missing) for url in urls])
     if not api_key:
         return {
             "status": "error",
@@ -69,41 +116,125 @@ def scan_urls_with_virustotal(
             "flagged_urls": [],
             "recommended_action": "VT_API_KEY environment variable is missing.",
         }
+    return None
+
+
+def _assess_report(url: str, report: virustotal_client.VirusTotalUrlReport) -> tuple[str, dict[str, Any]]:
+    level = _risk_level(report)
+    # The verdict is only as fresh as VirusTotal's last analysis of the URL.
+    analyzed_at = report.last_analysis_date or time.time()
+    return level, {
+        "url": url,
+        "issue": _format_issue(report),
+        "recommendation": _recommendation(level),
+        "valid_until": int(analyzed_at + virustotal_client.cache_ttl(report)),
+    }
 
-    issues: list[dict[str, str]] = []
-    highest_level = "low"
 
-    for url in urls[:5]:
-        try:
-            report = virustotal_client.fetch_url_report(url=url, api_key=api_key)
-            level = _risk_level(report)
-            if level == "high" or (level == "medium" and highest_level == "low"):
-                highest_level = level
-            issues.append(
-                {
-                    "url": url,
-                    "issue": _format_issue(report),
-                    "recommendation": _recommendation(level),
-                }
-            )
-        except virustotal_client.VirusTotalClientError as exc:
-            issues.append(
-                {
-                    "url": url,
-                    "issue": f"Lookup failed: {exc}",
-                    "recommendation": "Fallback to manual scanning before trusting this link.",
-                }
-            )
-            if highest_level == "low":
-                highest_level = "medium"
+def _assess_failure(url: str, exc: Exception) -> tuple[str, dict[str, Any]]:
+    return "medium", {
+        "url": url,
+        "issue": f"Lookup failed: {exc}",
+        "recommendation": "Fallback to manual scanning before trusting this link.",
+        "valid_until": int(time.time()),
+    }
 
-    return {
+
+def _build_payload(assessments: list[tuple[str, dict[str, Any]]]) -> dict[str, Any]:
+    issues: list[dict[str, Any]] = []
+    highest_level = "low"
+    for level, issue in assessments:
+        if level == "high" or (level == "medium" and highest_level == "low"):
+            highest_level = level
+        issues.append(issue)
+
+    payload = {
         "status": "ok",
         "risk_level": highest_level,
         "confidence": round(_confidence(highest_level), 2),
         "flagged_urls": issues,
         "recommended_action": _recommendation(highest_level),
     }
+    expiries = [issue["valid_until"] for issue in issues if "valid_until" in issue]
+    if expiries:
+        payload["valid_until"] = min(expiries)
+    return payload
+
+
+def _scan_plan(
+    claim: str, tool_context: ToolContext
+) -> tuple[list[str], list[tuple[str, dict[str, Any]]], str | None, dict[str, Any] | None]:
+    """URLs left to look up, blocklist hits, API key and terminal payload, shared by both scan paths."""
+    text = claim or context_helpers.extract_latest_user_text(tool_context)
+    urls = _target_urls(text)
+    # Blocklisted URLs are settled offline; only the others spend VirusTotal quota.
+    listed = _blocklisted(urls)
+    urls = _unlisted(urls, listed)
+    api_key = os.getenv("VT_API_KEY")
+    return urls, listed, api_key, _precheck(urls, listed, api_key)
+
+
+def _lookup(url: str, api_key: str) -> tuple[str, dict[str, Any]]:
+    # VT_LOOKUP_TIMEOUT bounds the whole lookup, including the wait for a rate-limit token
+    # (VirusTotal allows 4 lookups a minute); an earlier request deadline still wins.
+    try:
+        with deadline.scope(VT_LOOKUP_TIMEOUT):
+            report = virustotal_client.fetch_url_report(url=url, api_key=api_key, timeout=VT_LOOKUP_TIMEOUT)
+    except virustotal_client.VirusTotalClientError as exc:
+        return _assess_failure(url, exc)
+    return _assess_report(url, report)
+
+
+async def _lookup_async(
+    url: str, api_key: str, semaphore: asyncio.Semaphore
+) -> tuple[str, dict[str, Any]]:
+    async with semaphore:
+        # As in _lookup, VT_LOOKUP_TIMEOUT covers the token wait as well as the HTTP call.
+        try:
+            with deadline.scope(VT_LOOKUP_TIMEOUT):
+                report = await virustotal_client.fetch_url_report_async(
+                    url=url, api_key=api_key, timeout=VT_LOOKUP_TIMEOUT
+                )
+        except virustotal_client.VirusTotalClientError as exc:
+            return _assess_failure(url, exc)
+    return _assess_report(url, report)
+
+
+def scan_urls_with_virustotal(claim: str, *, tool_context: ToolContext) -> dict[str, Any]:
+    """Blocking variant of :func:`scan_urls_with_virustotal_async` on the sync VirusTotal client."""
+    urls, listed, api_key, terminal = _scan_plan(claim, tool_context)
+    if terminal:
+        return terminal
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(VT_SCAN_CONCURRENCY, len(urls))))
+    try:
+        # Copy the caller's context so worker threads keep its rate-limit priority class and deadline.
+        futures = [executor.submit(contextvars.copy_context().run, _lookup, url, api_key) for url in urls]
+        wait(futures, timeout=deadline.remaining())
+        assessments = [
+            future.result()
+            if future.done()
+            else _assess_failure(url, deadline.DeadlineExceeded("request deadline passed"))
+            for url, future in zip(urls, futures)
+        ]
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return _build_payload(listed + assessments)
+
+
+async def scan_urls_with_virustotal_async(
+    claim: str, *, tool_context: ToolContext
+) -> dict[str, Any]:
+    """Check up to five URLs in the claim text against VirusTotal and return risk annotations."""
+    urls, listed, api_key, terminal = _scan_plan(claim, tool_context)
+    if terminal:
+        return terminal
+
+    semaphore = asyncio.Semaphore(max(1, VT_SCAN_CONCURRENCY))
+    assessments = await asyncio.gather(
+        *(_lookup_async(url, api_key, semaphore) for url in urls)
+    )
+    return _build_payload(listed + list(assessments))
 
 
-VIRUSTOTAL_URL_TOOL = FunctionTool(func=scan_urls_with_virustotal)
+VIRUSTOTAL_URL_TOOL = FunctionTool(func=instrument_tool(scan_urls_with_virustotal_async))
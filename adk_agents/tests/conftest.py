@@ -0,0 +1,35 @@
+"""Shared pytest setup: import the package from ``adk_agents`` with a throwaway cache dir."""
+
+import json
+import os
+import sys
+import tempfile
+
+import pytest
+import requests
+
+# Settings are read at import time, so the cache dir must be set before the package loads.
+os.environ.setdefault("VERIFICATION_CACHE_DIR", tempfile.mkdtemp(prefix="verification-tests-"))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def json_response():
+    """Build a ``requests.Response`` whose body is the given payload as JSON."""
+
+    def build(payload, status_code=200):
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = json.dumps(payload).encode("utf-8")
+        response.headers["Content-Type"] = "application/json"
+        return response
+
+    return build
+
+
+@pytest.fixture
+def unusable_cache_dir(tmp_path):
+    """A cache path below a regular file, so creating its directory fails with ``OSError``."""
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    return blocker / "cache"
@@ -0,0 +1,66 @@
+import pytest
+
+from news_info_verification.services.blocklist_index import (
+    KIND_DOMAIN,
+    KIND_HOST,
+    KIND_URL,
+    BlocklistIndex,
+    BlocklistIndexError,
+    build_index,
+    parse_line,
+)
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        ("# comment", None),
+        ("", None),
+        ("0.0.0.0 Tracker.Example.com", (KIND_HOST, "tracker.example.com")),
+        ("127.0.0.1 localhost", None),
+        ("||ads.example.net^", (KIND_DOMAIN, "ads.example.net")),
+        ("*.phish.example", (KIND_DOMAIN, "phish.example")),
+        ("http://evil.example/login?utm_source=x", (KIND_URL, "evil.example/login")),
+        ("evil.example/pay  # inline comment", (KIND_URL, "evil.example/pay")),
+        ("nodot", None),
+    ],
+)
+def test_parse_line(line, expected):
+    assert parse_line(line) == expected
+
+
+@pytest.fixture
+def index(tmp_path):
+    urls = tmp_path / "urlhaus.txt"
+    urls.write_text("# URLhaus\nhttp://bad.example/malware.exe\n")
+    hosts = tmp_path / "hosts.txt"
+    hosts.write_text("0.0.0.0 tracker.example.com\n||phish.example^\n")
+    output = tmp_path / "blocklist.idx"
+    assert build_index([str(urls), str(hosts)], str(output)) == 3
+    compiled = BlocklistIndex(str(output))
+    yield compiled
+    compiled.close()
+
+
+def test_lookup_matches_url_host_and_parent_domains(index):
+    assert index.sources == ["urlhaus.txt", "hosts.txt"]
+    hit = index.lookup("https://BAD.example/malware.exe#x")
+    assert (hit.kind, hit.value, hit.source) == (KIND_URL, "bad.example/malware.exe", "urlhaus.txt")
+    hit = index.lookup("http://tracker.example.com/pixel")
+    assert (hit.kind, hit.source) == (KIND_HOST, "hosts.txt")
+    hit = index.lookup("https://login.secure.phish.example/")
+    assert (hit.kind, hit.value) == (KIND_DOMAIN, "phish.example")
+
+
+def test_lookup_misses_unlisted_urls(index):
+    assert index.lookup("http://bad.example/other") is None
+    assert index.lookup("http://sub.tracker.example.com/") is None
+    assert index.lookup("https://example.com/") is None
+    assert index.lookup("not a url") is None
+
+
+def test_rejects_files_that_are_not_an_index(tmp_path):
+    path = tmp_path / "junk.idx"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(BlocklistIndexError):
+        BlocklistIndex(str(path))
@@ -0,0 +1,73 @@
+import time
+
+import pytest
+
+from news_info_verification.services.cache_store import SqliteTTLCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    store = SqliteTTLCache(str(tmp_path / "cache.sqlite"), max_entries=10)
+    yield store
+    store.close()
+
+
+def test_round_trips_json_values(cache):
+    cache.set("key", {"status": "ok", "items": [1, 2]}, ttl=60)
+    assert cache.get("key") == {"status": "ok", "items": [1, 2]}
+    assert cache.get("other") is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.writes, stats.entries) == (1, 1, 1, 1)
+    assert stats.hit_ratio == 0.5
+
+
+def test_entries_expire(cache):
+    cache.set("key", "value", ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("key") is None
+    assert cache.stats().entries == 0
+
+
+def test_non_positive_ttl_is_not_stored(cache):
+    cache.set("key", "value", ttl=0)
+    assert cache.get("key") is None
+    assert cache.stats().writes == 0
+
+
+def test_least_recently_read_entries_are_evicted(cache):
+    for index in range(10):
+        cache.set(f"key{index}", index, ttl=60)
+    assert cache.get("key0") == 0
+    # Eviction runs every max_entries // 10 writes, so the next write trims the table.
+    cache.set("key10", 10, ttl=60)
+    assert cache.stats().entries == 10
+    assert cache.get("key0") == 0
+    assert cache.get("key1") is None
+    assert cache.stats().evictions == 1
+
+
+def test_corrupt_file_reads_as_a_miss(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    path.write_bytes(b"this is not a sqlite database" * 100)
+    cache = SqliteTTLCache(str(path), max_entries=10)
+    assert cache.get("key") is None
+    cache.set("key", "value", ttl=60)
+    assert cache._errors == 2
+    assert cache._misses == 1
+
+
+def test_invalidate_and_clear(cache):
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    assert cache.invalidate("a") is True
+    assert cache.invalidate("a") is False
+    cache.clear()
+    assert cache.get("b") is None
+
+
+def test_unusable_cache_directory_reads_as_a_miss(unusable_cache_dir):
+    cache = SqliteTTLCache(str(unusable_cache_dir / "cache.sqlite"), max_entries=10)
+    assert cache.get("key") is None
+    cache.set("key", "value", ttl=60)
+    assert cache.get("key") is None
+    assert cache._errors == 3
@@ -0,0 +1,91 @@
+import time
+
+import pytest
+import requests
+
+from news_info_verification.services.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+
+def _breaker(**overrides):
+    settings = {"window": 4, "min_requests": 4, "failure_ratio": 0.5, "cooldown": 0.05, "half_open_probes": 1}
+    settings.update(overrides)
+    return CircuitBreaker("test", **settings)
+
+
+def _fail(breaker):
+    with pytest.raises(requests.ConnectionError):
+        with breaker.guard():
+            raise requests.ConnectionError("down")
+
+
+def _succeed(breaker):
+    with breaker.guard():
+        pass
+
+
+def test_opens_once_the_failure_ratio_is_reached():
+    breaker = _breaker()
+    _succeed(breaker)
+    _succeed(breaker)
+    _fail(breaker)
+    assert breaker.stats().state == STATE_CLOSED
+    _fail(breaker)
+    assert breaker.stats().state == STATE_OPEN
+    with pytest.raises(CircuitOpenError):
+        _succeed(breaker)
+    assert breaker.stats().rejected == 1
+
+
+def test_mark_failed_counts_as_failure():
+    breaker = _breaker(min_requests=1, failure_ratio=1.0)
+    with breaker.guard() as call:
+        call.mark_failed()
+    assert breaker.stats().state == STATE_OPEN
+
+
+def test_open_error_is_a_requests_exception():
+    assert issubclass(CircuitOpenError, requests.RequestException)
+
+
+def test_successful_probe_closes_the_breaker():
+    breaker = _breaker(min_requests=1, failure_ratio=1.0)
+    _fail(breaker)
+    time.sleep(0.06)
+    assert breaker.stats().state == STATE_HALF_OPEN
+    _succeed(breaker)
+    assert breaker.stats().state == STATE_CLOSED
+    assert breaker.stats().window == 0
+
+
+def test_failed_probe_reopens_the_breaker():
+    breaker = _breaker(min_requests=1, failure_ratio=1.0)
+    _fail(breaker)
+    time.sleep(0.06)
+    _fail(breaker)
+    stats = breaker.stats()
+    assert stats.state == STATE_OPEN
+    assert stats.opened == 2
+
+
+def test_only_the_allowed_number_of_probes_go_through():
+    breaker = _breaker(min_requests=1, failure_ratio=1.0)
+    _fail(breaker)
+    time.sleep(0.06)
+    with breaker.guard():
+        with pytest.raises(CircuitOpenError):
+            _succeed(breaker)
+
+
+def test_cancellation_does_not_count_against_the_provider():
+    breaker = _breaker(min_requests=1, failure_ratio=1.0)
+    with pytest.raises(KeyboardInterrupt):
+        with breaker.guard():
+            raise KeyboardInterrupt
+    assert breaker.stats().state == STATE_CLOSED
+    assert breaker.stats().window == 0
@@ -0,0 +1,129 @@
+import asyncio
+import json
+
+import pytest
+
+from news_info_verification.services import claimreview_index, factcheck_client
+from news_info_verification.services.claimreview_index import ClaimReviewIndex, reviews_from
+from news_info_verification.tools import fact_tools
+
+API_CLAIMS = {
+    "claims": [
+        {
+            "text": "5G towers spread the coronavirus",
+            "claimReview": [
+                {
+                    "publisher": {"name": "FactCheckers"},
+                    "url": "https://factcheck.example/5g",
+                    "title": "No, 5G does not spread viruses",
+                    "textualRating": "False",
+                    "reviewDate": "2020-04-01",
+                }
+            ],
+        }
+    ]
+}
+SCHEMA_ORG_FEED = {
+    "dataFeedElement": [
+        {
+            "item": [
+                {
+                    "@type": "ClaimReview",
+                    "claimReviewed": "Drinking hot water kills the virus",
+                    "author": [{"name": "Health Desk"}],
+                    "url": "https://health.example/hot-water",
+                    "reviewRating": {"alternateName": "Misleading"},
+                    "datePublished": "2020-03-15",
+                }
+            ]
+        }
+    ]
+}
+
+
+@pytest.fixture
+def index(tmp_path):
+    store = ClaimReviewIndex(str(tmp_path / "claimreview.sqlite"))
+    yield store
+    store.close()
+
+
+def test_reviews_from_reads_both_shapes():
+    (api,) = reviews_from(API_CLAIMS)
+    assert (api.claim_text, api.publisher, api.textual_rating) == ("5G towers spread the coronavirus", "FactCheckers", "False")
+    (schema,) = reviews_from(SCHEMA_ORG_FEED)
+    assert (schema.publisher, schema.textual_rating, schema.title) == (
+        "Health Desk",
+        "Misleading",
+        "Drinking hot water kills the virus",
+    )
+
+
+def test_search_ranks_and_filters_by_coverage(index):
+    index.add(reviews_from([API_CLAIMS, SCHEMA_ORG_FEED]))
+    (hit,) = index.search("Do 5G towers spread viruses?", min_match=0.5)
+    assert hit.url == "https://factcheck.example/5g"
+    assert index.search("stock market crash", min_match=0.5) == []
+    assert index.search("the of and") == []
+
+
+def test_reingest_upserts_and_skips_unchanged_files(index, tmp_path):
+    dump = tmp_path / "dump.json"
+    dump.write_text(json.dumps(API_CLAIMS))
+    lines = tmp_path / "feed.jsonl"
+    lines.write_text(json.dumps(SCHEMA_ORG_FEED) + "\nnot json\n")
+
+    first = index.ingest([str(dump), str(lines)])
+    assert (first.files, first.skipped_files, first.records) == (2, 0, 2)
+    second = index.ingest([str(dump), str(lines)])
+    assert second.skipped_files == 2
+    forced = index.ingest([str(dump)], force=True)
+    assert forced.records == 1
+    assert index.count() == 2
+
+
+ELECTION_CLAIMS = {
+    "claims": [
+        {
+            "text": "Biden won the 2020 presidential election",
+            "claimReview": [
+                {
+                    "publisher": {"name": "Election Desk"},
+                    "url": "https://election.example/biden-2020",
+                    "textualRating": "True",
+                }
+            ],
+        }
+    ]
+}
+
+
+def test_search_requires_the_query_names_and_numbers(index):
+    index.add(reviews_from(ELECTION_CLAIMS))
+    assert [hit.url for hit in index.search("Biden won the 2020 presidential election")] == [
+        "https://election.example/biden-2020"
+    ]
+    assert index.search("Trump won the 2020 presidential election") == []
+    assert index.search("Biden won the 2024 presidential election") == []
+
+
+def test_weak_local_match_still_queries_the_api(index, monkeypatch):
+    index.add(reviews_from(ELECTION_CLAIMS))
+    monkeypatch.setattr(claimreview_index, "shared_index", lambda: index)
+    queries = []
+
+    async def fake_search(*, query, api_key, max_results):
+        queries.append(query)
+        return []
+
+    monkeypatch.setenv("GOOGLE_FACT_CHECK_API_KEY", "test-key")
+    monkeypatch.setattr(factcheck_client, "search_fact_checks_async", fake_search)
+
+    claim = "Trump won the 2020 presidential election"
+    result = asyncio.run(fact_tools.lookup_fact_checks_async(claim, tool_context=None))
+    assert queries == [claim]
+    assert result["status"] == "no_data"
+
+    local = asyncio.run(fact_tools.lookup_fact_checks_async("Biden won the 2020 presidential election", tool_context=None))
+    assert local["fact_checks"][0]["url"] == "https://election.example/biden-2020"
+    assert queries == [claim]
@@ -0,0 +1,72 @@
+import contextvars
+import time
+
+import pytest
+
+from news_info_verification.services import deadline
+from news_info_verification.services.circuit_breaker import STATE_CLOSED, CircuitBreaker
+
+
+def _in_context(function):
+    return contextvars.copy_context().run(function)
+
+
+def test_no_deadline_leaves_timeouts_alone():
+    def check():
+        deadline.start(None)
+        assert deadline.remaining() is None
+        assert deadline.expired() is False
+        assert deadline.clamp(10) == 10
+
+    _in_context(check)
+
+
+def test_clamp_shortens_to_the_time_left():
+    def check():
+        deadline.start(0.5)
+        assert 0.4 < deadline.clamp(10) <= 0.5
+        assert deadline.clamp(0.1) == 0.1
+
+    _in_context(check)
+
+
+def test_clamp_raises_once_expired():
+    def check():
+        deadline.start(0.01)
+        time.sleep(0.02)
+        assert deadline.remaining() == 0.0
+        assert deadline.expired() is True
+        with pytest.raises(deadline.DeadlineExceeded):
+            deadline.clamp(10)
+
+    _in_context(check)
+
+
+def test_scope_tightens_but_never_extends():
+    def check():
+        deadline.start(1.0)
+        with deadline.scope(0.2):
+            assert deadline.remaining() <= 0.2
+        assert deadline.remaining() > 0.9
+        with deadline.scope(5.0):
+            assert deadline.remaining() <= 1.0
+
+    _in_context(check)
+
+
+def test_start_with_zero_clears_the_deadline():
+    def check():
+        deadline.start(1.0)
+        deadline.start(0)
+        assert deadline.remaining() is None
+
+    _in_context(check)
+
+
+def test_running_out_of_deadline_does_not_trip_the_breaker():
+    breaker = CircuitBreaker("test", window=4, min_requests=1, failure_ratio=1.0, cooldown=1.0)
+    with pytest.raises(deadline.DeadlineExceeded):
+        with breaker.guard():
+            raise deadline.DeadlineExceeded("request deadline exceeded")
+    assert breaker.stats().state == STATE_CLOSED
+    assert breaker.stats().window == 0
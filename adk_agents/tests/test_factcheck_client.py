@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+from news_info_verification.services import factcheck_client, http_transport
+from news_info_verification.services.cache_store import SqliteTTLCache
+
+CLAIMS = {
+    "claims": [
+        {
+            "text": "5G towers spread the coronavirus",
+            "claimReview": [
+                {
+                    "publisher": {"name": "FactCheckers"},
+                    "url": "https://factcheck.example/5g",
+                    "textualRating": "False",
+                }
+            ],
+        }
+    ]
+}
+
+
+@pytest.fixture
+def broken_cache(monkeypatch, unusable_cache_dir):
+    monkeypatch.setattr(factcheck_client, "FACTCHECK_CACHE_ENABLED", True)
+    monkeypatch.setattr(factcheck_client, "_cache", SqliteTTLCache(str(unusable_cache_dir / "fc.sqlite3"), max_entries=10))
+
+
+def test_unusable_cache_falls_back_to_the_api(broken_cache, monkeypatch, json_response):
+    monkeypatch.setattr(http_transport, "request", lambda *args, **kwargs: json_response(CLAIMS))
+    (review,) = factcheck_client.search_fact_checks("5G towers spread the coronavirus", "key")
+    assert (review.publisher, review.textual_rating) == ("FactCheckers", "False")
+
+
+def test_unusable_cache_falls_back_to_the_api_async(broken_cache, monkeypatch, json_response):
+    async def request_async(*args, **kwargs):
+        return json_response(CLAIMS)
+
+    monkeypatch.setattr(http_transport, "request_async", request_async)
+    reviews = asyncio.run(factcheck_client.search_fact_checks_async("5G towers spread the coronavirus", "key"))
+    assert [review.url for review in reviews] == ["https://factcheck.example/5g"]
@@ -0,0 +1,78 @@
+from news_info_verification.config import STATE_KEYS
+from news_info_verification.reporting.final_report import parse_lane_summary, render_final_report
+
+NEWS = """## News Verification
+- consensus_verdict: false
+- confidence_range: 0.60-0.80
+- noted_gaps: NewsPerplexityAgent: status error — quota exceeded
+
+### Supporting Points
+* NewsApiAgent (GNews): Outlets report no such finding.
+
+### Sources
+1. Reuters — https://reuters.example/a
+2. none
+"""
+SCAM = """## Scam Risk Summary
+- overall_risk: high
+- confidence_range: 0.40-0.90
+- immediate_action_required: yes
+
+### Triggers
+* Link audit: http://bad.example/ — 3 engines flagged malicious
+
+### Sources
+1. n/a
+"""
+
+
+def _section(report, heading):
+    return report.split(f"## {heading}\n", 1)[1].split("\n\n", 1)[0].splitlines()
+
+
+def test_parse_lane_summary():
+    parsed = parse_lane_summary(NEWS)
+    assert parsed.fields == {
+        "consensus_verdict": "false",
+        "confidence_range": "0.60-0.80",
+        "noted_gaps": "NewsPerplexityAgent: status error — quota exceeded",
+    }
+    assert parsed.bullets == ["NewsApiAgent (GNews): Outlets report no such finding."]
+    assert parsed.sources == [("Reuters", "https://reuters.example/a")]
+    assert parse_lane_summary(SCAM).sources == []
+    assert parse_lane_summary("").fields == {}
+
+
+def test_render_final_report_combines_lanes():
+    report = render_final_report(
+        {STATE_KEYS.NEWS_SUMMARY: NEWS, STATE_KEYS.SCAM_SUMMARY: SCAM, STATE_KEYS.LANE_SKIP_REASONS: {"fact": "no factual claim"}},
+        claim="Vaccines contain microchips",
+        submitted_at="2026-10-17T00:00:00Z",
+    )
+    assert report.startswith("# Verification Report\n## Report Summary\nThe claim appears false")
+    assert "- paraphrase: Vaccines contain microchips" in report
+    assert "- submission_time: 2026-10-17T00:00:00Z" in report
+    assert _section(report, "Lane Execution") == ["- executed: news, scam", "- skipped: fact (no factual claim)"]
+    assert _section(report, "Final Verdict") == [
+        "- outcome: false",
+        "- confidence: 0.40-0.90",
+        "- residual_risks:",
+        "  * news: NewsPerplexityAgent: status error — quota exceeded",
+        "  * scam: overall_risk high",
+        "  * skipped lane: fact (no factual claim)",
+    ]
+    assert _section(report, "Fact Assessment")[0] == "- summary: not requested"
+    assert report.rstrip().endswith("1. Reuters — https://reuters.example/a")
+
+
+def test_render_final_report_appends_extra_risks():
+    report = render_final_report({STATE_KEYS.NEWS_SUMMARY: NEWS}, extra_risks=["token budget exhausted"])
+    assert _section(report, "Final Verdict")[-1] == "  * token budget exhausted"
+
+
+def test_render_final_report_without_lanes():
+    report = render_final_report({})
+    assert "the claim remains unverified" in report
+    assert "- paraphrase: unspecified" in report
+    assert _section(report, "Final Verdict") == ["- outcome: unknown", "- confidence: unknown", "- residual_risks:", "  * none"]
+    assert report.endswith("## Sources\n1. none")
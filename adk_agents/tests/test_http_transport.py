@@ -0,0 +1,60 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from news_info_verification.services import http_transport
+
+_BODY = b'{"ok": true}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_BODY)))
+        self.end_headers()
+
+    def do_GET(self):
+        self.do_HEAD()
+        self.wfile.write(_BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    http_transport.close()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    http_transport.close()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_requests_reuse_one_keep_alive_connection(server):
+    for _ in range(3):
+        response = http_transport.request("GET", f"{server}/ping", timeout=2)
+        assert response.json() == {"ok": True}
+    stats = http_transport.pool_stats()
+    assert stats.requests == 3
+    assert stats.connections_opened == 1
+    assert stats.reuse_ratio == pytest.approx(2 / 3, abs=1e-4)
+
+
+def test_session_is_shared_until_closed(server):
+    session = http_transport.get_session()
+    assert http_transport.get_session() is session
+    http_transport.close()
+    assert http_transport.pool_stats().hosts == ()
+    assert http_transport.get_session() is not session
+
+
+def test_prewarm_opens_connections_per_host(server):
+    assert http_transport.prewarm([f"{server}/a", f"{server}/b"], connections_per_host=2) == 2
+    assert http_transport.pool_stats().connections_opened == 2
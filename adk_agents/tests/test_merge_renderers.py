@@ -0,0 +1,101 @@
+import json
+
+from news_info_verification.config import STATE_KEYS
+from news_info_verification.lanes.fact.merge import render_fact_summary
+from news_info_verification.lanes.news.merge import render_news_summary
+from news_info_verification.lanes.scam.merge import render_scam_summary
+from news_info_verification.reporting.final_report import parse_lane_summary
+
+SNOPES = {"organization": "Snopes", "rating": "False", "snippet": "No chips.", "url": "https://snopes.example/x"}
+
+
+def test_news_summary_surfaces_errors_and_merges_sources():
+    summary = render_news_summary(
+        {
+            STATE_KEYS.NEWS_API: {
+                "status": "ok",
+                "confidence": 0.6,
+                "synopsis": "Outlets report no such finding.",
+                "supporting_sources": [{"title": "Reuters", "url": "https://reuters.example/a"}],
+            },
+            # LLM-relayed workers publish fenced JSON strings.
+            STATE_KEYS.NEWS_FACT: "```json\n"
+            + json.dumps({"status": "ok", "verdict": "false", "confidence": 0.8, "notes": "Rated false.", "fact_checks": [SNOPES]})
+            + "\n```",
+            STATE_KEYS.NEWS_PERPLEXITY: {"status": "error", "notes": "quota exceeded"},
+        }
+    )
+    parsed = parse_lane_summary(summary)
+    assert parsed.fields["consensus_verdict"] == "false"
+    assert parsed.fields["confidence_range"] == "0.60-0.80"
+    assert parsed.fields["noted_gaps"] == "NewsPerplexityAgent: status error — quota exceeded"
+    assert parsed.bullets[0] == "Error surfaced — NewsPerplexityAgent: status error — quota exceeded"
+    assert parsed.sources == [("Reuters", "https://reuters.example/a"), ("Snopes", "https://snopes.example/x")]
+
+
+def test_news_summary_without_signals():
+    parsed = parse_lane_summary(render_news_summary({}))
+    assert parsed.fields["consensus_verdict"] == "unknown"
+    assert parsed.fields["confidence_range"] == "0.00-0.00"
+    assert parsed.bullets == ["No worker returned usable evidence."]
+    assert parsed.sources == []
+
+
+def test_fact_summary_reports_registry_conflict():
+    summary = render_fact_summary(
+        {
+            STATE_KEYS.FACT_PRIMARY: {
+                "status": "ok",
+                "verdict": "false",
+                "confidence": 0.9,
+                "notes": "Two reviews.",
+                "fact_checks": [SNOPES],
+            },
+            STATE_KEYS.FACT_PERPLEXITY: {
+                "status": "ok",
+                "verdict": "true",
+                "confidence": 0.5,
+                "reasoning": ["A blog says so"],
+                "references": ["https://blog.example/y"],
+            },
+        }
+    )
+    parsed = parse_lane_summary(summary)
+    assert parsed.fields["consensus_verdict"] == "mixed"
+    assert parsed.fields["registry_alignment"] == "conflicts"
+    assert "Snopes rated it False: No chips." in parsed.bullets
+    assert parsed.sources == [("Snopes", "https://snopes.example/x"), ("https://blog.example/y", "https://blog.example/y")]
+
+
+def test_scam_summary_takes_the_highest_risk():
+    summary = render_scam_summary(
+        {
+            STATE_KEYS.SCAM_SENTIMENT: {
+                "status": "ok",
+                "risk_level": "medium",
+                "confidence": 0.6,
+                "triggers": [{"excerpt": "URGENT", "pattern": "urgency"}],
+            },
+            STATE_KEYS.SCAM_PERPLEXITY: {"status": "ok", "verdict": "benign", "confidence": 0.4},
+            STATE_KEYS.SCAM_LINK: {
+                "status": "ok",
+                "risk_level": "high",
+                "confidence": 0.9,
+                "flagged_urls": [{"url": "http://bad.example/", "issue": "3 engines flagged malicious"}],
+                "recommended_action": "Block the link.",
+            },
+        }
+    )
+    parsed = parse_lane_summary(summary)
+    assert parsed.fields["overall_risk"] == "high"
+    assert parsed.fields["immediate_action_required"] == "yes"
+    assert 'Sentiment (urgency): "URGENT"' in parsed.bullets
+    assert parsed.bullets[-2] == "Block the link."
+    assert parsed.sources == [("VirusTotal link audit (3 engines flagged malicious)", "http://bad.example/")]
+
+
+def test_scam_summary_without_signals_is_unknown():
+    parsed = parse_lane_summary(render_scam_summary({}))
+    assert parsed.fields["overall_risk"] == "unknown"
+    assert parsed.fields["immediate_action_required"] == "no"
+    assert parsed.sources == []
@@ -0,0 +1,90 @@
+import os
+
+import pytest
+
+from news_info_verification.services import near_duplicates
+from news_info_verification.services.near_duplicates import MinHashLSH
+
+CLAIM = "The president of France resigned today amid the pension reform protests in Paris"
+
+
+@pytest.fixture
+def index():
+    return MinHashLSH(threshold=0.85, num_perm=128, bands=32, max_entries=100, ttl=0)
+
+
+def test_reworded_claim_reuses_verdict(index):
+    index.add(CLAIM, {"final_report": "report"})
+    match = index.query(f"BREAKING: {CLAIM}!")
+    assert match is not None
+    assert match.claim == CLAIM
+    assert match.score >= 0.85
+    assert match.state == {"final_report": "report"}
+
+
+@pytest.mark.parametrize(
+    "variant",
+    [
+        CLAIM.replace("France", "Germany"),
+        CLAIM.replace("Paris", "Lyon"),
+        CLAIM.replace("resigned today", "did not resign today"),
+        CLAIM.replace("resigned today", "never resigned"),
+        CLAIM + " after 3 days",
+        "Pfizer vaccine approved for children",
+    ],
+)
+def test_entity_swaps_and_negations_do_not_match(index, variant):
+    index.add(CLAIM, {"final_report": "report"})
+    assert index.query(variant) is None
+
+
+def test_negated_claim_with_high_similarity_does_not_match():
+    index = MinHashLSH(threshold=0.0, max_entries=10, ttl=0)
+    index.add("Drinking bleach cures COVID", {})
+    assert index.query("Drinking bleach does not cure COVID") is None
+    assert index.query("Drinking bleach doesn't cure COVID") is None
+
+
+def test_number_words_are_anchors():
+    index = MinHashLSH(threshold=0.0, max_entries=10, ttl=0)
+    index.add("Three people died in the Lisbon tram crash", {})
+    assert index.query("Four people died in the Lisbon tram crash") is None
+
+
+def test_sentence_initial_common_words_are_not_names():
+    _, anchors = near_duplicates._fingerprint_text("The Mayor of Paris said. This is new")
+    assert anchors == frozenset({"name:mayor", "name:paris"})
+
+
+def test_fingerprint_ignores_case_punctuation_and_tracking_parameters():
+    left = near_duplicates.fingerprint("Visit https://example.com/a?utm_source=x NOW!")
+    right = near_duplicates.fingerprint("visit https://EXAMPLE.com/a now")
+    assert left == right
+    assert left != near_duplicates.fingerprint("visit https://example.com/b now")
+
+
+def test_index_is_bounded_and_replaces_exact_duplicates():
+    index = MinHashLSH(threshold=0.9, max_entries=2, ttl=0)
+    index.add("first claim about Lisbon", {"n": 1})
+    index.add("first claim about Lisbon", {"n": 2})
+    assert len(index) == 1
+    assert index.query("first claim about Lisbon").state == {"n": 2}
+    index.add("second claim about Porto", {})
+    index.add("third claim about Faro", {})
+    assert len(index) == 2
+    assert index.query("first claim about Lisbon") is None
+
+
+@pytest.mark.skipif("NEAR_DUPLICATE_ENABLED" in os.environ, reason="overridden in the environment")
+def test_disabled_by_default():
+    assert near_duplicates.shared_index() is None
+    assert near_duplicates.find(CLAIM) is None
+
+
+def test_enabled_overrides_the_setting(monkeypatch):
+    monkeypatch.setattr(near_duplicates, "NEAR_DUPLICATE_ENABLED", False)
+    near_duplicates.remember(CLAIM, {"final_report": "report"})
+    assert near_duplicates.find(CLAIM) is None
+    near_duplicates.shared_index(enabled=True).clear()
+    near_duplicates.remember(CLAIM, {"final_report": "report"}, enabled=True)
+    assert near_duplicates.find(f"BREAKING: {CLAIM}!", enabled=True).state == {"final_report": "report"}
@@ -0,0 +1,36 @@
+import asyncio
+import json
+
+import pytest
+
+from news_info_verification.services import http_transport, perplexity_client
+from news_info_verification.services.cache_store import SqliteTTLCache
+
+COMPLETION = {
+    "choices": [{"message": {"content": json.dumps({"verdict": "false"})}}],
+    "usage": {"prompt_tokens": 10, "completion_tokens": 5},
+}
+PROMPT = {"user_prompt": "Do 5G towers spread viruses?", "schema_description": "{verdict}", "system_prompt": "Check it."}
+
+
+@pytest.fixture
+def broken_cache(monkeypatch, unusable_cache_dir):
+    monkeypatch.setenv("PERPLEXITY_API_KEY", "key")
+    monkeypatch.setattr(perplexity_client, "PERPLEXITY_CACHE_ENABLED", True)
+    monkeypatch.setattr(perplexity_client, "_cache", SqliteTTLCache(str(unusable_cache_dir / "pplx.sqlite3"), max_entries=10))
+
+
+def test_unusable_cache_falls_back_to_the_api(broken_cache, monkeypatch, json_response):
+    monkeypatch.setattr(http_transport, "request", lambda *args, **kwargs: json_response(COMPLETION))
+    payload, response = perplexity_client.complete_json(**PROMPT, cache_ttl=60)
+    assert payload == {"verdict": "false"}
+    assert response.token_usage["prompt_tokens"] == 10
+
+
+def test_unusable_cache_falls_back_to_the_api_async(broken_cache, monkeypatch, json_response):
+    async def request_async(*args, **kwargs):
+        return json_response(COMPLETION)
+
+    monkeypatch.setattr(http_transport, "request_async", request_async)
+    payload, _ = asyncio.run(perplexity_client.complete_json_async(**PROMPT, cache_ttl=60))
+    assert payload == {"verdict": "false"}
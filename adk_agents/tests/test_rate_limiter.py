@@ -0,0 +1,100 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from news_info_verification.services.rate_limiter import (
+    PRIORITY_BACKFILL,
+    PRIORITY_INTERACTIVE,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+def test_burst_is_granted_without_waiting():
+    bucket = TokenBucket("test", rate_per_s=1.0, burst=3)
+    assert all(bucket.acquire(timeout=0.1) < 0.05 for _ in range(3))
+    assert bucket.stats().granted == 3
+
+
+def test_acquire_waits_for_refill():
+    bucket = TokenBucket("test", rate_per_s=20.0, burst=1)
+    bucket.acquire()
+    assert bucket.acquire(timeout=1.0) >= 0.03
+
+
+def test_acquire_times_out_and_leaves_the_queue():
+    bucket = TokenBucket("test", rate_per_s=0.1, burst=1)
+    bucket.acquire()
+    with pytest.raises(TimeoutError):
+        bucket.acquire(timeout=0.05)
+    assert bucket.stats().queue_depth == 0
+
+
+def test_try_acquire_never_waits():
+    bucket = TokenBucket("test", rate_per_s=0.1, burst=1)
+    assert bucket.try_acquire() is True
+    assert bucket.try_acquire() is False
+
+
+def test_pause_holds_the_bucket():
+    bucket = TokenBucket("test", rate_per_s=100.0, burst=5)
+    bucket.pause(0.1)
+    assert bucket.try_acquire() is False
+    assert bucket.acquire(timeout=1.0) >= 0.08
+    assert bucket.stats().throttled == 1
+
+
+def test_interactive_requests_jump_the_queue():
+    bucket = TokenBucket("test", rate_per_s=20.0, burst=1)
+    bucket.acquire()
+    order = []
+
+    def take(priority, label):
+        bucket.acquire(priority, timeout=2.0)
+        order.append(label)
+
+    backfill = threading.Thread(target=take, args=(PRIORITY_BACKFILL, "backfill"))
+    backfill.start()
+    while bucket.stats().queue_depth < 1:
+        time.sleep(0.001)
+    interactive = threading.Thread(target=take, args=(PRIORITY_INTERACTIVE, "interactive"))
+    interactive.start()
+    backfill.join()
+    interactive.join()
+    assert order == ["interactive", "backfill"]
+
+
+def test_acquire_async_waits_for_refill():
+    bucket = TokenBucket("test", rate_per_s=20.0, burst=1)
+
+    async def run():
+        await bucket.acquire_async()
+        return await bucket.acquire_async(timeout=1.0)
+
+    assert asyncio.run(run()) >= 0.03
+
+
+def test_acquire_async_times_out():
+    bucket = TokenBucket("test", rate_per_s=0.1, burst=1)
+    bucket.acquire()
+    with pytest.raises(TimeoutError):
+        asyncio.run(bucket.acquire_async(timeout=0.05))
+    assert bucket.stats().queue_depth == 0
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, None), ("", None), ("7", 7.0), (" 1.5 ", 1.5), ("-3", 0.0), ("soon", None)],
+)
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 <= parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from news_info_verification.benchmarks import LatencyProfile, ScriptedLlm, StubCluster, install_fake_llm
+from news_info_verification.benchmarks.runner import _without_rate_limits
+from news_info_verification.benchmarks.stubs import PROVIDERS
+from news_info_verification.config import STATE_KEYS
+from news_info_verification.router import create_root_agent
+from news_info_verification.services import near_duplicates, verdict_store
+
+CLAIM = (
+    "Breaking news: Reuters reports that the new vaccines contain tracking microchips that connect to 5G towers, "
+    "see http://news.example/vaccine-chips"
+)
+
+
+@pytest.fixture
+def stubs():
+    profiles = {provider: LatencyProfile(mean_ms=1, jitter_ms=0) for provider in PROVIDERS}
+    with _without_rate_limits(), StubCluster(profiles, seed=1) as cluster:
+        yield cluster
+
+
+async def _verify(agent, claim):
+    install_fake_llm(agent, ScriptedLlm(latency_ms=0, jitter_ms=0, seed=1))
+    sessions = InMemorySessionService()
+    runner = Runner(app_name="test", agent=agent, session_service=sessions)
+    session = await sessions.create_session(app_name="test", user_id="user")
+    message = types.Content(role="user", parts=[types.Part(text=claim)])
+    async for _ in runner.run_async(user_id="user", session_id=session.id, new_message=message):
+        pass
+    session = await sessions.get_session(app_name="test", user_id="user", session_id=session.id)
+    return session.state
+
+
+def test_reuse_stored_verdicts_flag_enables_the_store(stubs):
+    store = verdict_store.shared_store(enabled=True)
+    store.clear()
+    agent = create_root_agent(preclassify=True, reuse_stored_verdicts=True, reuse_near_duplicates=False)
+
+    first = asyncio.run(_verify(agent, CLAIM))
+    assert first.get(STATE_KEYS.REUSED_LANES) is None
+    second = asyncio.run(_verify(agent, CLAIM))
+    assert second[STATE_KEYS.REUSED_LANES]
+    assert second[STATE_KEYS.FINAL_REPORT] == first[STATE_KEYS.FINAL_REPORT]
+
+
+def test_reuse_near_duplicates_flag_enables_the_index(stubs):
+    near_duplicates.shared_index(enabled=True).clear()
+    agent = create_root_agent(preclassify=True, reuse_near_duplicates=True, reuse_stored_verdicts=False)
+
+    first = asyncio.run(_verify(agent, CLAIM))
+    assert first.get(STATE_KEYS.NEAR_DUPLICATE) is None
+    second = asyncio.run(_verify(agent, CLAIM.replace("the new vaccines", "new vaccines") + "!!"))
+    assert second[STATE_KEYS.NEAR_DUPLICATE]["claim"] == CLAIM
+    assert second[STATE_KEYS.FINAL_REPORT].startswith(first[STATE_KEYS.FINAL_REPORT])
+    assert "## Reused Verdict" in second[STATE_KEYS.FINAL_REPORT]
@@ -0,0 +1,75 @@
+import pytest
+
+from news_info_verification.services import scam_language
+from news_info_verification.services.scam_language import PhraseMatcher, find_triggers, score
+
+
+def test_phrase_matcher_reports_overlapping_hits():
+    matcher = PhraseMatcher(["he", "she", "his", "hers"])
+    hits = {(start, end, matcher.phrases[index]) for start, end, index in matcher.finditer("ushers")}
+    assert hits == {(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")}
+
+
+def test_triggers_are_whole_words_only():
+    assert find_triggers("The lotteryticket and the firsthurry") == []
+    assert [phrase for _, phrase, _ in find_triggers("Hurry, buy a lottery ticket")] == ["hurry", "lottery"]
+
+
+def test_triggers_keep_original_excerpt():
+    hits = find_triggers("Please   VERIFY  your\nAccount now. Don’t delay!")
+    assert ("request", "verify your account", "VERIFY  your\nAccount") in hits
+    assert ("urgency", "don't delay", "Don’t delay") in hits
+
+
+def test_shorter_hits_inside_longer_ones_are_dropped():
+    hits = find_triggers("Your account has been suspended")
+    assert [phrase for category, phrase, _ in hits if category == "fear"] == ["account has been suspended"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "URGENT: your account has been suspended. Verify your account within 24 hours or face legal action. "
+        "Click here.",
+        "Congratulations! You have won a cash prize. Pay the processing fee with a gift card to claim your prize.",
+        "This is the IRS. An arrest warrant has been issued. Act now and send money by wire transfer.",
+    ],
+)
+def test_scam_messages_score_high(text):
+    result = score(text)
+    assert result["status"] == "ok"
+    assert result["risk_level"] == "high"
+    assert result["ambiguous"] is False
+    assert result["triggers"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Police department says the lottery winner claimed the jackpot today",
+        "The IRS announced new tax brackets on Monday.",
+        "Police department warns of suspicious activity near the park after a lawsuit was filed.",
+        "Local teacher wins lottery jackpot and plans to donate the inheritance to charity.",
+        "The mayor urged residents to evacuate immediately as the river rose.",
+        "Markets fell as investors reacted to the central bank decision.",
+    ],
+)
+def test_benign_news_scores_low(text):
+    result = score(text)
+    assert result["risk_level"] == "low"
+    assert result["score"] <= scam_language.SCAM_SCORER_GATE_LOW
+
+
+def test_context_only_cues_are_damped():
+    result = score("Police department says the lottery winner claimed the jackpot today")
+    assert result["score"] < 0.25
+    assert "no request or urgency cue" in result["notes"]
+    assert score("Police department says the lottery winner must pay the release fee")["score"] > result["score"]
+
+
+@pytest.mark.parametrize("text", ["", "   \n"])
+def test_empty_text_has_no_data(text):
+    result = score(text)
+    assert result["status"] == "no_data"
+    assert result["score"] == 0.0
+    assert result["triggers"] == []
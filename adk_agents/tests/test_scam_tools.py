@@ -0,0 +1,45 @@
+import asyncio
+import time
+
+import pytest
+
+from news_info_verification.services import http_transport, rate_limiter, virustotal_client
+from news_info_verification.tools import scam_tools
+
+CLAIM = "Your parcel is held, pay the fee at http://parcel.example/pay"
+
+
+@pytest.fixture
+def drained_virustotal_bucket(monkeypatch):
+    monkeypatch.setenv("VT_API_KEY", "test-key")
+    monkeypatch.setattr(virustotal_client, "VT_CACHE_ENABLED", False)
+    monkeypatch.setattr(scam_tools, "VT_LOOKUP_TIMEOUT", 0.2)
+    monkeypatch.setattr(rate_limiter, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(rate_limiter, "_buckets", {})
+    monkeypatch.setitem(rate_limiter.RATE_LIMITS, virustotal_client.PROVIDER, (1, 1))
+    assert rate_limiter.limiter_for(virustotal_client.PROVIDER).try_acquire()
+
+    def send(*args, **kwargs):
+        raise AssertionError("the lookup was sent without a rate-limit token")
+
+    monkeypatch.setattr(http_transport, "_send", send)
+
+
+def _assert_unchecked(payload, elapsed):
+    assert elapsed < 2
+    assert payload["risk_level"] == "medium"
+    (issue,) = payload["flagged_urls"]
+    assert issue["url"] == "http://parcel.example/pay"
+    assert issue["issue"].startswith("Lookup failed")
+
+
+def test_lookup_timeout_bounds_the_rate_limit_wait(drained_virustotal_bucket):
+    started = time.monotonic()
+    payload = scam_tools.scan_urls_with_virustotal(CLAIM, tool_context=None)
+    _assert_unchecked(payload, time.monotonic() - started)
+
+
+def test_lookup_timeout_bounds_the_rate_limit_wait_async(drained_virustotal_bucket):
+    started = time.monotonic()
+    payload = asyncio.run(scam_tools.scan_urls_with_virustotal_async(CLAIM, tool_context=None))
+    _assert_unchecked(payload, time.monotonic() - started)
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from news_info_verification.services import (
+    factcheck_client,
+    gnews_client,
+    perplexity_client,
+    virustotal_client,
+)
+from news_info_verification.tools import fact_tools, news_tools, perplexity_tools, scam_tools
+
+CLAIM = "Breaking: the dam upstream of http://river.example/dam has failed"
+PERPLEXITY_RESPONSE = perplexity_client.PerplexityResponse(message="{}", search_results=[], token_usage={})
+VT_REPORT = virustotal_client.VirusTotalUrlReport(
+    url="http://river.example/dam", harmless=70, malicious=0, suspicious=0, undetected=5, timeout=0,
+    last_analysis_date=None,
+)
+
+
+@pytest.fixture(autouse=True)
+def sync_clients(monkeypatch):
+    for name in ("GNEWS_API_TOKEN", "GOOGLE_FACT_CHECK_API_KEY", "VT_API_KEY"):
+        monkeypatch.setenv(name, "test-key")
+    monkeypatch.setattr(gnews_client, "fetch_articles", lambda **kwargs: [])
+    monkeypatch.setattr(factcheck_client, "search_fact_checks", lambda **kwargs: [])
+    monkeypatch.setattr(perplexity_client, "complete_json", lambda **kwargs: ({"verdict": "true"}, PERPLEXITY_RESPONSE))
+    monkeypatch.setattr(virustotal_client, "fetch_url_report", lambda **kwargs: VT_REPORT)
+
+    async def unexpected(**kwargs):
+        raise AssertionError("a sync tool awaited an async client")
+
+    monkeypatch.setattr(gnews_client, "fetch_articles_async", unexpected)
+    monkeypatch.setattr(factcheck_client, "search_fact_checks_async", unexpected)
+    monkeypatch.setattr(perplexity_client, "complete_json_async", unexpected)
+    monkeypatch.setattr(virustotal_client, "fetch_url_report_async", unexpected)
+
+
+@pytest.mark.parametrize(
+    "tool, status",
+    [
+        (news_tools.fetch_news_evidence, "no_data"),
+        (fact_tools.lookup_fact_checks, "no_data"),
+        (perplexity_tools.research_news_with_perplexity, "ok"),
+        (perplexity_tools.research_fact_with_perplexity, "ok"),
+        (perplexity_tools.research_scam_with_perplexity, "ok"),
+        (scam_tools.scan_urls_with_virustotal, "ok"),
+    ],
+)
+def test_sync_tools_run_inside_an_event_loop(tool, status):
+    async def call_from_a_coroutine():
+        return tool(CLAIM, tool_context=None)
+
+    assert asyncio.run(call_from_a_coroutine())["status"] == status
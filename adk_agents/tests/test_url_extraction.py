@@ -0,0 +1,69 @@
+import pytest
+
+from news_info_verification.services.url_extraction import (
+    canonicalize_url,
+    extract,
+    registered_domain,
+    trim_url,
+)
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("HTTPS://Example.COM/Path?a=1", "https://example.com/Path?a=1"),
+        ("https://example.com", "https://example.com/"),
+        ("http://example.com:80/x", "http://example.com/x"),
+        ("https://example.com:8443/x", "https://example.com:8443/x"),
+        ("https://example.com/x?utm_source=mail&id=7&fbclid=abc#top", "https://example.com/x?id=7"),
+        ("www.example.com/news", "https://www.example.com/news"),
+        ("https://bücher.example/", "https://xn--bcher-kva.example/"),
+        ("https://example.com./", "https://example.com/"),
+        ("https://bank.example@evil.example/login", "https://bank.example@evil.example/login"),
+        ("ftp://example.com/file", None),
+        ("https:///nohost", None),
+        ("https://example.com:99999/", None),
+    ],
+)
+def test_canonicalize_url(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    ("candidate", "expected"),
+    [
+        ("https://example.com/a.", "https://example.com/a"),
+        ("https://example.com/a)!", "https://example.com/a"),
+        ("https://en.wikipedia.org/wiki/Foo_(bar)", "https://en.wikipedia.org/wiki/Foo_(bar)"),
+    ],
+)
+def test_trim_url(candidate, expected):
+    assert trim_url(candidate) == expected
+
+
+@pytest.mark.parametrize(
+    ("host", "expected"),
+    [
+        ("a.b.example.com", "example.com"),
+        ("news.bbc.co.uk", "bbc.co.uk"),
+        ("example.com", "example.com"),
+        ("192.168.0.1", "192.168.0.1"),
+    ],
+)
+def test_registered_domain(host, expected):
+    assert registered_domain(host) == expected
+
+
+def test_extract_deduplicates_on_canonical_form():
+    text = (
+        "See https://Example.com/a?utm_campaign=x, then (https://example.com/a) "
+        "and www.other.example/b."
+    )
+    urls = extract(text)
+    assert [url.canonical for url in urls] == ["https://example.com/a", "https://www.other.example/b"]
+    assert urls[0].raw == "https://Example.com/a?utm_campaign=x"
+
+
+def test_extract_respects_limit():
+    text = " ".join(f"https://site{index}.example/" for index in range(10))
+    assert len(extract(text, limit=3)) == 3
@@ -0,0 +1,103 @@
+import time
+
+import pytest
+
+from news_info_verification.config import STATE_KEYS, VERDICT_TTL_NEWS, VERDICT_TTL_SCAM
+from news_info_verification.services import verdict_store
+from news_info_verification.services.verdict_store import LaneVerdict, VerdictStore, lane_expiry
+
+
+@pytest.fixture
+def store(tmp_path):
+    verdicts = VerdictStore(str(tmp_path / "verdicts.sqlite3"), max_claims=2)
+    yield verdicts
+    verdicts.close()
+
+
+def _verdict(lane, *, ttl=60.0, verified_at=None):
+    now = time.time() if verified_at is None else verified_at
+    return LaneVerdict(lane, f"## {lane} summary", {"status": "ok"}, now, now + ttl)
+
+
+def test_lane_expiry_uses_the_lane_ttl():
+    ok = {STATE_KEYS.NEWS_API: {"status": "ok"}}
+    assert lane_expiry("news", ok, now=1000.0) == 1000.0 + VERDICT_TTL_NEWS
+
+
+def test_lane_expiry_caps_scam_at_virustotal_validity():
+    signals = {STATE_KEYS.SCAM_LINK: {"status": "ok", "valid_until": 1500}}
+    assert lane_expiry("scam", signals, now=1000.0) == 1500.0
+    signals = {STATE_KEYS.SCAM_LINK: {"status": "ok", "valid_until": 10**12}}
+    assert lane_expiry("scam", signals, now=1000.0) == 1000.0 + VERDICT_TTL_SCAM
+
+
+@pytest.mark.parametrize("status", ["error", "timeout"])
+def test_failed_lanes_expire_immediately(status):
+    signals = {STATE_KEYS.FACT_PRIMARY: {"status": "ok"}, STATE_KEYS.FACT_PERPLEXITY: {"status": status}}
+    assert lane_expiry("fact", signals, now=1000.0) == 1000.0
+
+
+def test_fresh_lanes_skip_expired_rows(store):
+    store.save("fp", "claim", {"news": _verdict("news", ttl=0.05), "fact": _verdict("fact")})
+    assert set(store.fresh_lanes("fp")) == {"news", "fact"}
+    assert set(store.fresh_lanes("fp", now=time.time() + 1)) == {"fact"}
+    assert store.fresh_lanes("other") == {}
+
+
+def test_already_expired_lanes_are_not_stored(store):
+    store.save("fp", "claim", {"news": _verdict("news", ttl=-1)})
+    assert store.fresh_lanes("fp", now=0) == {}
+
+
+def test_report_requires_every_lane_and_expires_with_the_first(store):
+    store.save("fp", "claim", {"news": _verdict("news")}, report="# Verification Report", report_lanes=("news", "fact"))
+    assert store.report("fp") is None
+
+    news, fact = _verdict("news", ttl=30), _verdict("fact", ttl=600)
+    store.save(
+        "fp",
+        "claim",
+        {"news": news, "fact": fact},
+        report="# Verification Report",
+        skip_reasons={"scam": "no links"},
+        report_lanes=("news", "fact"),
+    )
+    stored = store.report("fp")
+    assert stored.report == "# Verification Report"
+    assert stored.lanes == ("news", "fact")
+    assert stored.skip_reasons == {"scam": "no links"}
+    assert stored.expires_at == news.expires_at
+    assert store.report("fp", now=news.expires_at) is None
+
+
+def test_saving_without_a_report_drops_the_old_one(store):
+    store.save("fp", "claim", {"news": _verdict("news")}, report="# Verification Report", report_lanes=("news",))
+    store.save("fp", "claim", {"news": _verdict("news")})
+    assert store.report("fp") is None
+
+
+def test_oldest_claims_are_evicted_past_max_claims(store):
+    now = time.time()
+    for offset, fingerprint in enumerate(("first", "second", "third")):
+        store.save(
+            fingerprint,
+            "claim",
+            {"news": _verdict("news", verified_at=now + offset)},
+            report="# Verification Report",
+            report_lanes=("news",),
+        )
+    assert store.fresh_lanes("first") == {}
+    assert store.report("first") is None
+    assert set(store.fresh_lanes("third")) == {"news"}
+    assert store.report("second") is not None
+
+
+def test_enabled_overrides_the_setting(monkeypatch):
+    monkeypatch.setattr(verdict_store, "VERDICT_STORE_ENABLED", False)
+    assert verdict_store.shared_store() is None
+    assert verdict_store.lookup("fp") == ({}, None)
+    verdict_store.shared_store(enabled=True).clear()
+    verdict_store.record("fp", "claim", {"news": _verdict("news")}, enabled=True)
+    fresh, report = verdict_store.lookup("fp", enabled=True)
+    assert set(fresh) == {"news"}
+    assert report is None
@@ -0,0 +1,29 @@
+import asyncio
+
+import pytest
+
+from news_info_verification.services import http_transport, virustotal_client
+from news_info_verification.services.cache_store import SqliteTTLCache
+
+REPORT = {"data": {"attributes": {"last_analysis_stats": {"malicious": 2, "harmless": 60}, "last_analysis_date": 1700000000}}}
+
+
+@pytest.fixture
+def broken_cache(monkeypatch, unusable_cache_dir):
+    monkeypatch.setattr(virustotal_client, "VT_CACHE_ENABLED", True)
+    monkeypatch.setattr(virustotal_client, "_cache", SqliteTTLCache(str(unusable_cache_dir / "vt.sqlite3"), max_entries=10))
+
+
+def test_unusable_cache_falls_back_to_the_api(broken_cache, monkeypatch, json_response):
+    monkeypatch.setattr(http_transport, "request", lambda *args, **kwargs: json_response(REPORT))
+    report = virustotal_client.fetch_url_report("https://bad.example/", "key")
+    assert (report.malicious, report.harmless) == (2, 60)
+
+
+def test_unusable_cache_falls_back_to_the_api_async(broken_cache, monkeypatch, json_response):
+    async def request_async(*args, **kwargs):
+        return json_response(REPORT)
+
+    monkeypatch.setattr(http_transport, "request_async", request_async)
+    report = asyncio.run(virustotal_client.fetch_url_report_async("https://bad.example/", "key"))
+    assert report.malicious == 2